@@ -0,0 +1,928 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for performance-sensitive processing steps.
+
+Runs on synthetic data built from the default configuration, so no network
+access or cache is needed.
+
+Usage:
+    python scripts/benchmark.py tags [--elements N] [--repeat N]
+    python scripts/benchmark.py batch [--elements N] [--repeat N]
+    python scripts/benchmark.py capacity [--elements N] [--repeat N]
+    python scripts/benchmark.py parallel [--elements N] [--repeat N] [--workers N]
+    python scripts/benchmark.py memory [--elements N] [--repeat N]
+    python scripts/benchmark.py dates [--elements N] [--repeat N]
+    python scripts/benchmark.py plants [--elements N] [--plants N] [--repeat N]
+    python scripts/benchmark.py geometry [--elements N] [--repeat N]
+    python scripts/benchmark.py areas [--elements N] [--repeat N]
+    python scripts/benchmark.py clustering [--elements N] [--repeat N]
+    python scripts/benchmark.py grid [--elements N] [--repeat N]
+    python scripts/benchmark.py kmeans [--elements N] [--clusters N] [--repeat N]
+    python scripts/benchmark.py incremental [--elements N] [--changed N]
+    python scripts/benchmark.py cluster-cache [--elements N]
+    python scripts/benchmark.py tiles [--elements N] [--workers N] [--repeat N]
+    python scripts/benchmark.py pipeline [--elements N] [--countries N] [--latency S]
+"""
+
+import argparse
+import math
+import multiprocessing
+import pickle
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+# Add src to path for development
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from osm_powerplants import get_config
+from osm_powerplants.enhancement.geometry import PlantGeometryIndex
+from osm_powerplants.models import PlantGeometry, Units
+from osm_powerplants.parsing.batch import BatchGeneratorParser
+from osm_powerplants.parsing.generators import GeneratorParser
+from osm_powerplants.parsing.mappings import TagMappings
+from osm_powerplants.quality.rejection import RejectionTracker
+from osm_powerplants.retrieval.cache import ElementCache
+from osm_powerplants.retrieval.client import OverpassAPIClient
+from osm_powerplants.retrieval.elements import compact_elements
+from osm_powerplants.retrieval.index import ElementIndex
+from osm_powerplants.utils import (
+    _parse_capacity_cached,
+    capacity_cache_stats,
+    clear_capacity_cache,
+    parse_capacity_value,
+    parse_start_year,
+)
+from osm_powerplants.workflow import Workflow
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of several runs of func in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(name: str, baseline: float, optimized: float, count: int) -> None:
+    """Print per-item timings and the speedup of one comparison."""
+    print(f"{name}:")
+    print(f"  baseline:  {baseline / count * 1e6:8.2f} us/item ({baseline:.3f}s)")
+    print(f"  optimized: {optimized / count * 1e6:8.2f} us/item ({optimized:.3f}s)")
+    print(f"  speedup:   {baseline / optimized:8.1f}x")
+
+
+def peak_memory(func: Callable[[], object]) -> float:
+    """Return the peak memory growth of func in MiB."""
+
+    # Run in a forked child: scikit-learn allocates outside tracemalloc
+    def run(queue: multiprocessing.Queue) -> None:
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        func()
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        queue.put((after - before) / 1024)
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=run, args=(queue,))
+    process.start()
+    growth = queue.get()
+    process.join()
+    return growth
+
+
+def synthetic_tags(config: dict, count: int, seed: int = 0) -> list[dict]:
+    """Build generator tag dicts with values drawn from the tag mappings."""
+    rng = random.Random(seed)
+    sources = [v for values in config["source_mapping"].values() for v in values]
+    technologies = [
+        v for values in config["technology_mapping"].values() for v in values
+    ]
+    tags = []
+    for _ in range(count):
+        element_tags = {
+            "power": "generator",
+            "generator:source": rng.choice(sources + ["unmapped"]),
+        }
+        if rng.random() < 0.9:
+            element_tags["generator:method"] = rng.choice(technologies)
+        tags.append(element_tags)
+    return tags
+
+
+def bench_tags(args: argparse.Namespace) -> None:
+    """Compare list scans with compiled lookups for tag classification."""
+    config = get_config()
+    tags_list = synthetic_tags(config, args.elements)
+    source_mapping = config["source_mapping"]
+    technology_mapping = config["technology_mapping"]
+    source_tech_mapping = config["source_technology_mapping"]
+
+    def scan(tags: dict) -> tuple[str | None, str | None]:
+        source = None
+        value = tags["generator:source"].lower()
+        for config_source in source_mapping:
+            if value in source_mapping[config_source]:
+                source = config_source
+                break
+        if source is None or "generator:method" not in tags:
+            return source, None
+        value = tags["generator:method"].lower()
+        for config_technology in technology_mapping:
+            if config_technology in source_tech_mapping[source]:
+                if value in technology_mapping[config_technology]:
+                    return source, config_technology
+        return source, None
+
+    mappings = TagMappings(config)
+
+    def lookup(tags: dict) -> tuple[str | None, str | None]:
+        source = mappings.source_lookup.get(tags["generator:source"].lower())
+        if source is None or "generator:method" not in tags:
+            return source, None
+        technology = mappings.technology_lookup.get(
+            (source, tags["generator:method"].lower())
+        )
+        return source, technology
+
+    assert [scan(t) for t in tags_list] == [lookup(t) for t in tags_list]
+
+    baseline = best_time(lambda: [scan(t) for t in tags_list], args.repeat)
+    optimized = best_time(lambda: [lookup(t) for t in tags_list], args.repeat)
+    report("Source and technology classification", baseline, optimized, len(tags_list))
+
+
+def synthetic_generators(count: int, seed: int = 0) -> list[dict]:
+    """Build solar and wind generator nodes, a fifth of them incomplete."""
+    rng = random.Random(seed)
+    elements = []
+    for i in range(count):
+        source, method = rng.choice(
+            [("solar", "photovoltaic"), ("wind", "wind_turbine")]
+        )
+        tags = {
+            "power": "generator",
+            "generator:source": source,
+            "generator:method": method,
+            "generator:output:electricity": f"{rng.uniform(0.01, 5):.3f} MW",
+            "start_date": str(rng.randint(1995, 2024)),
+        }
+        if rng.random() < 0.2:
+            del tags[rng.choice(["generator:output:electricity", "start_date"])]
+        elements.append(
+            {
+                "type": "node",
+                "id": i,
+                "lat": rng.uniform(47, 55),
+                "lon": rng.uniform(6, 15),
+                "tags": tags,
+            }
+        )
+    return elements
+
+
+def bench_batch(args: argparse.Namespace) -> None:
+    """Compare scalar and batch parsing of generator nodes."""
+    config = get_config()
+    config["units_reconstruction"] = {"enabled": False}
+    elements = synthetic_generators(args.elements)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with OverpassAPIClient(cache_dir=cache_dir, show_progress=False) as client:
+            parser = GeneratorParser(client, RejectionTracker(), config)
+            batch = BatchGeneratorParser(parser)
+
+            def scalar() -> list:
+                return [
+                    parser.process_element(element, "Germany", set())
+                    for element in elements
+                ]
+
+            def batched() -> list:
+                batch.prepare(elements, "Germany")
+                results = []
+                for element in elements:
+                    result = batch.pop(f"node/{element['id']}")
+                    if result is None:
+                        results.append(
+                            parser.process_element(element, "Germany", set())
+                        )
+                    else:
+                        results.append(result.unit)
+                return results
+
+            assert [u and u.id for u in scalar()] == [u and u.id for u in batched()]
+
+            baseline = best_time(scalar, args.repeat)
+            optimized = best_time(batched, args.repeat)
+    report("Generator node parsing", baseline, optimized, len(elements))
+
+
+def bench_capacity(args: argparse.Namespace) -> None:
+    """Compare uncached and memoized capacity string parsing."""
+    rng = random.Random(0)
+    values = [
+        f"{rng.choice([1, 2, 2.3, 3, 5, 10, 50, 100])} "
+        f"{rng.choice(['MW', 'MWp', 'kW', 'kWp', 'GW'])}"
+        for _ in range(args.elements)
+    ]
+    patterns = tuple(get_config()["capacity_extraction"].get("regex_patterns", []))
+    patterns = patterns or (r"^(\d+(?:\.\d+)?)\s*([a-zA-Z]+p?)$",)
+    uncached = _parse_capacity_cached.__wrapped__
+
+    def baseline() -> list:
+        return [uncached(value.strip(), patterns) for value in values]
+
+    def memoized() -> list:
+        return [parse_capacity_value(value, True, patterns) for value in values]
+
+    clear_capacity_cache()
+    assert baseline() == memoized()
+
+    report(
+        "Capacity parsing",
+        best_time(baseline, args.repeat),
+        best_time(memoized, args.repeat),
+        len(values),
+    )
+    print(f"  cache:     {capacity_cache_stats()}")
+
+
+def bench_parallel(args: argparse.Namespace) -> None:
+    """Compare serial and process-parallel parsing of one country."""
+    elements = synthetic_generators(args.elements)
+
+    class OfflineClient(OverpassAPIClient):
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            return {"elements": []}, {"elements": elements}
+
+    def run(client: OverpassAPIClient, parallel: bool) -> list:
+        config = get_config()
+        config.update(
+            {
+                "plants_only": False,
+                "units_reconstruction": {"enabled": False},
+                "incremental_parsing": {"enabled": False},
+                "batch_parsing": {"enabled": False},
+                "parallel_parsing": {
+                    "enabled": parallel,
+                    "workers": args.workers,
+                    "min_elements": 0,
+                },
+            }
+        )
+        with Workflow(client, RejectionTracker(), Units(), config) as workflow:
+            units, _ = workflow.process_country_data("Germany", force_refresh=True)
+        return [unit.id for unit in units]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with OfflineClient(cache_dir=cache_dir, show_progress=False) as client:
+            assert run(client, False) == run(client, True)
+
+            baseline = best_time(lambda: run(client, False), args.repeat)
+            optimized = best_time(lambda: run(client, True), args.repeat)
+    report(
+        f"Country parsing with {args.workers} workers",
+        baseline,
+        optimized,
+        len(elements),
+    )
+
+
+def bench_memory(args: argparse.Namespace) -> None:
+    """Compare memory and tag access time of element dicts and compact elements."""
+    elements = synthetic_generators(args.elements)
+    for i, element in enumerate(elements):
+        element["tags"]["name"] = f"Generator {i}"
+        element["_country"] = "DE"
+    # Load from a pickle like the element cache does
+    data = pickle.dumps(elements)
+
+    def allocated(build: Callable[[], list]) -> tuple[list, int]:
+        tracemalloc.start()
+        built = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return built, size
+
+    dicts, dict_size = allocated(lambda: pickle.loads(data))
+    compact, compact_size = allocated(lambda: compact_elements(pickle.loads(data)))
+    assert dicts == compact
+
+    def access(items: list) -> list:
+        return [
+            (e["type"], e.get("_country"), e["tags"].get("generator:source"))
+            for e in items
+        ]
+
+    count = len(elements)
+    print("Element memory:")
+    print(f"  dicts:     {dict_size / count:8.1f} bytes/element")
+    print(f"  compact:   {compact_size / count:8.1f} bytes/element")
+    print(f"  reduction: {1 - compact_size / dict_size:8.1%}")
+    report(
+        "Element field access (compact vs dicts)",
+        best_time(lambda: access(dicts), args.repeat),
+        best_time(lambda: access(compact), args.repeat),
+        count,
+    )
+
+    # Country caches hold the elements for the whole run
+    with tempfile.TemporaryDirectory() as cache_dir:
+        writer = ElementCache(cache_dir)
+        writer.store_generators("DE", {"elements": elements})
+        writer.save_all_caches()
+        writer.close()
+
+        def load(compact_cache: bool) -> int:
+            cache = ElementCache(cache_dir, compact_elements=compact_cache)
+            tracemalloc.start()
+            cache.load_all_caches()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            cache.close()
+            return size
+
+        dict_cache_size = load(False)
+        compact_cache_size = load(True)
+    print("Element cache memory after loading:")
+    print(f"  dicts:     {dict_cache_size / count:8.1f} bytes/element")
+    print(f"  compact:   {compact_cache_size / count:8.1f} bytes/element")
+    print(f"  reduction: {1 - compact_cache_size / dict_cache_size:8.1%}")
+
+
+def bench_dates(args: argparse.Namespace) -> None:
+    """Compare general and fast-path memoized start date parsing."""
+    from dateutil import parser as date_parser
+
+    rng = random.Random(0)
+    values = [
+        rng.choice(["{y}", "{y}-{m:02d}", "{y}-{m:02d}-{d:02d}"]).format(
+            y=rng.randint(1980, 2024), m=rng.randint(1, 12), d=rng.randint(1, 28)
+        )
+        for _ in range(args.elements)
+    ]
+
+    def baseline() -> list:
+        return [date_parser.parse(value, fuzzy=True).year for value in values]
+
+    def optimized() -> list:
+        return [parse_start_year(value)[0] for value in values]
+
+    assert baseline() == optimized()
+    report(
+        "Start date parsing",
+        best_time(baseline, args.repeat),
+        best_time(optimized, args.repeat),
+        len(values),
+    )
+
+
+def bench_plants(args: argparse.Namespace) -> None:
+    """Compare linear and indexed generator-within-plant checks."""
+    from shapely.geometry import Point, box
+
+    rng = random.Random(0)
+    plants = {}
+    for k in range(args.plants):
+        lon, lat = rng.uniform(13.0, 15.0), rng.uniform(52.0, 54.0)
+        geometry = (
+            Point(lon, lat) if k % 4 == 0 else box(lon, lat, lon + 0.01, lat + 0.01)
+        )
+        plants[f"way/{k}"] = PlantGeometry(id=str(k), type="way", geometry=geometry)
+    points = [
+        (rng.uniform(52.0, 54.0), rng.uniform(13.0, 15.0)) for _ in range(args.elements)
+    ]
+
+    def baseline() -> list:
+        return [
+            next((key for key, g in plants.items() if g.contains_point(lat, lon)), None)
+            for lat, lon in points
+        ]
+
+    def optimized() -> list:
+        index = PlantGeometryIndex.from_dict(plants)
+        candidates = index.candidates_many(
+            [lat for lat, _ in points], [lon for _, lon in points]
+        )
+        return [
+            index.first_containing(lat, lon, positions=positions)
+            for (lat, lon), positions in zip(points, candidates, strict=True)
+        ]
+
+    assert baseline() == optimized()
+    report(
+        f"Plant containment ({len(plants)} plants)",
+        best_time(baseline, args.repeat),
+        best_time(optimized, args.repeat),
+        len(points),
+    )
+
+
+def bench_geometry(args: argparse.Namespace) -> None:
+    """Compare scalar and batch way polygons and point containment."""
+    rng = random.Random(0)
+    nodes, ways = [], []
+    for k in range(args.elements):
+        lat, lon = rng.uniform(52.0, 54.0), rng.uniform(13.0, 15.0)
+        ids = [4 * k + n for n in range(4)]
+        corners = [(0, 0), (0, 0.005), (0.005, 0.005), (0.005, 0)]
+        nodes += [
+            {"type": "node", "id": i, "lat": lat + dy, "lon": lon + dx}
+            for i, (dy, dx) in zip(ids, corners, strict=True)
+        ]
+        ways.append({"type": "way", "id": k, "nodes": ids + ids[:1]})
+    points = [
+        (rng.uniform(52.0, 54.0), rng.uniform(13.0, 15.0)) for _ in range(args.elements)
+    ]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with OverpassAPIClient(cache_dir=cache_dir, show_progress=False) as client:
+            client.cache.store_nodes_bulk(nodes)
+            parser = GeneratorParser(client, RejectionTracker(), get_config())
+            handler = parser.geometry_handler
+            # Nodes are read from memory in both paths, as during a run
+            handler.element_index = ElementIndex(client.cache, [])
+            for node in nodes:
+                handler.element_index.get_node(node["id"])
+
+            def scalar_ways() -> list:
+                handler.clear_memo()
+                return [handler.get_element_geometry(way) for way in ways]
+
+            def batch_ways() -> list:
+                handler.clear_memo()
+                return list(handler.build_way_geometries(ways))
+
+            report(
+                "Way polygons",
+                best_time(scalar_ways, args.repeat),
+                best_time(batch_ways, args.repeat),
+                len(ways),
+            )
+
+            index = PlantGeometryIndex(geometry for geometry in scalar_ways())
+            lats = [lat for lat, _ in points]
+            lons = [lon for _, lon in points]
+
+            def scalar_points() -> list:
+                candidates = index.candidates_many(lats, lons)
+                return [
+                    index.first_containing(lat, lon, positions=positions)
+                    for (lat, lon), positions in zip(points, candidates, strict=True)
+                ]
+
+            def batch_points() -> list:
+                positions = index.containing_many(lats, lons)
+                return [index.keys[p] if p >= 0 else None for p in positions]
+
+            assert scalar_points() == batch_points()
+            report(
+                "Point containment",
+                best_time(scalar_points, args.repeat),
+                best_time(batch_points, args.repeat),
+                len(points),
+            )
+
+
+def bench_areas(args: argparse.Namespace) -> None:
+    """Compare per-way and vectorized area-based capacity estimation."""
+    from osm_powerplants.enhancement.estimation import CapacityEstimator
+
+    rng = random.Random(0)
+    nodes, ways = [], []
+    for k in range(args.elements):
+        lat, lon = rng.uniform(35.0, 60.0), rng.uniform(-10.0, 30.0)
+        count = rng.randint(4, 12)
+        ids = [16 * k + n for n in range(count)]
+        nodes += [
+            {
+                "type": "node",
+                "id": node_id,
+                "lat": lat + 0.002 * math.sin(2 * math.pi * n / count),
+                "lon": lon + 0.002 * math.cos(2 * math.pi * n / count),
+            }
+            for n, node_id in enumerate(ids)
+        ]
+        ways.append({"type": "way", "id": k, "nodes": ids + ids[:1]})
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with OverpassAPIClient(cache_dir=cache_dir, show_progress=False) as client:
+            client.cache.store_nodes_bulk(nodes)
+            estimator = CapacityEstimator(client, RejectionTracker(), get_config())
+            elements = ElementIndex(client.cache, [])
+            for node in nodes:
+                elements.get_node(node["id"])
+            client.cache.get_node = elements.get_node
+
+            def scalar() -> list:
+                estimator.way_areas = {}
+                return [
+                    estimator.estimate_capacity_area_based(way, "Solar", "plant")
+                    for way in ways
+                ]
+
+            def vectorized() -> list:
+                estimator.compute_way_areas(ways, elements)
+                return [
+                    estimator.estimate_capacity_area_based(way, "Solar", "plant")
+                    for way in ways
+                ]
+
+            assert scalar() == vectorized()
+            report(
+                "Area-based estimation",
+                best_time(scalar, args.repeat),
+                best_time(vectorized, args.repeat),
+                len(ways),
+            )
+
+
+def bench_clustering(args: argparse.Namespace) -> None:
+    """Compare scikit-learn and chunked haversine DBSCAN on dense solar parks."""
+    import numpy as np
+    from sklearn.cluster import DBSCAN
+
+    from osm_powerplants.enhancement.clustering import haversine_dbscan
+
+    rng = np.random.default_rng(0)
+    centers = rng.uniform([47.0, 6.0], [55.0, 15.0], size=(args.elements // 500, 2))
+    points = centers[rng.integers(0, len(centers), args.elements)]
+    points += rng.normal(0, 0.003, points.shape)
+
+    def baseline() -> np.ndarray:
+        return DBSCAN(
+            eps=500 / 6371000, min_samples=2, metric="haversine", algorithm="ball_tree"
+        ).fit_predict(np.radians(points))
+
+    def optimized() -> np.ndarray:
+        return haversine_dbscan(points[:, 0], points[:, 1], 500, 2)
+
+    # Measured before anything else runs in this process
+    print("Clustering peak memory growth:")
+    print(f"  baseline:  {peak_memory(baseline):8.1f} MiB")
+    print(f"  optimized: {peak_memory(optimized):8.1f} MiB")
+    assert (baseline() == optimized()).all()
+    report(
+        "Haversine DBSCAN",
+        best_time(baseline, args.repeat),
+        best_time(optimized, args.repeat),
+        len(points),
+    )
+
+
+def bench_grid(args: argparse.Namespace) -> None:
+    """Compare haversine DBSCAN and grid clustering on rooftop PV."""
+    import numpy as np
+
+    from osm_powerplants.enhancement.clustering import grid_clusters, haversine_dbscan
+
+    # Towns of scattered rooftop systems
+    rng = np.random.default_rng(0)
+    towns = rng.uniform([47.0, 6.0], [55.0, 15.0], size=(args.elements // 200, 2))
+    points = towns[rng.integers(0, len(towns), args.elements)]
+    points += rng.normal(0, 0.01, points.shape)
+
+    dbscan_labels = haversine_dbscan(points[:, 0], points[:, 1], 500, 2)
+    grid_labels = grid_clusters(points[:, 0], points[:, 1], 500, 2)
+    print("Clusters:")
+    print(f"  dbscan:    {dbscan_labels.max() + 1:8d}")
+    print(f"  grid:      {grid_labels.max() + 1:8d}")
+    report(
+        "Grid clustering (vs haversine DBSCAN)",
+        best_time(
+            lambda: haversine_dbscan(points[:, 0], points[:, 1], 500, 2), args.repeat
+        ),
+        best_time(
+            lambda: grid_clusters(points[:, 0], points[:, 1], 500, 2), args.repeat
+        ),
+        len(points),
+    )
+
+
+def bench_kmeans(args: argparse.Namespace) -> None:
+    """Compare full-batch K-means with warm-started mini-batch K-means."""
+    import numpy as np
+
+    from osm_powerplants.enhancement.clustering import KMeansClustering
+    from osm_powerplants.models import Unit
+
+    rng = np.random.default_rng(0)
+    towns = rng.uniform([47.0, 6.0], [55.0, 15.0], size=(args.clusters, 2))
+    points = towns[rng.integers(0, len(towns), args.elements)]
+    points += rng.normal(0, 0.05, points.shape)
+    generators = [
+        Unit(projectID=f"g{k}", lat=lat, lon=lon, Capacity=1.0)
+        for k, (lat, lon) in enumerate(points)
+    ]
+    # The re-run sees one percent of the generators changed
+    changed = generators[len(generators) // 100 :]
+
+    config = {"n_clusters": args.clusters, "n_init": 1, "random_state": 0}
+    full = KMeansClustering(config)
+    minibatch = KMeansClustering(
+        {**config, "minibatch": True, "batch_size": 4096, "max_no_improvement": 10}
+    )
+    minibatch.cluster(generators)
+    minibatch.initial_centers = minibatch.cluster_centers
+
+    report(
+        "Mini-batch K-means re-run (vs full-batch K-means)",
+        best_time(lambda: full.cluster(changed), args.repeat),
+        best_time(lambda: minibatch.cluster(changed), args.repeat),
+        len(changed),
+    )
+
+
+def bench_incremental(args: argparse.Namespace) -> None:
+    """Compare full and incremental re-clustering after a few changes."""
+    import numpy as np
+
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        ClusteringStore,
+    )
+    from osm_powerplants.models import Unit
+
+    rng = np.random.default_rng(0)
+    towns = rng.uniform([47.0, 6.0], [55.0, 15.0], size=(args.elements // 200, 2))
+    points = towns[rng.integers(0, len(towns), args.elements)]
+    points += rng.normal(0, 0.01, points.shape)
+    generators = [
+        Unit(
+            projectID=f"g{k}",
+            lat=lat,
+            lon=lon,
+            Capacity=0.01,
+            Country="Germany",
+            Fueltype="Solar",
+        )
+        for k, (lat, lon) in enumerate(points)
+    ]
+
+    config = get_config()
+    config["units_clustering"]["incremental"] = True
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "dbscan",
+        "eps_meters": 500,
+        "min_samples": 2,
+    }
+    manager = ClusteringManager(config)
+
+    def full() -> None:
+        _, clusters = manager.cluster_generators(generators, "Solar")
+        manager.create_cluster_plants(clusters, "Solar")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        manager.store = ClusteringStore(cache_dir)
+        manager.update_clusters(generators, "Solar", "DE")
+        # Move a few generators by a kilometre
+        for gen in generators[:: len(generators) // args.changed]:
+            gen.lat += 0.01
+        report(
+            f"Incremental re-clustering of {args.changed} changes (vs full)",
+            best_time(full, 1),
+            best_time(lambda: manager.update_clusters(generators, "Solar", "DE"), 1),
+            len(generators),
+        )
+        manager.store.close()
+
+
+def bench_cluster_cache(args: argparse.Namespace) -> None:
+    """Compare clustering with reusing cached clusters of unchanged input."""
+    import numpy as np
+
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        ClusteringStore,
+    )
+    from osm_powerplants.models import Unit
+
+    rng = np.random.default_rng(0)
+    towns = rng.uniform([47.0, 6.0], [55.0, 15.0], size=(args.elements // 200, 2))
+    points = towns[rng.integers(0, len(towns), args.elements)]
+    points += rng.normal(0, 0.01, points.shape)
+    generators = [
+        Unit(
+            projectID=f"g{k}",
+            lat=lat,
+            lon=lon,
+            Capacity=0.01,
+            Country="Germany",
+            Fueltype="Solar",
+        )
+        for k, (lat, lon) in enumerate(points)
+    ]
+
+    config = get_config()
+    config["units_clustering"]["cache"] = True
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "dbscan",
+        "eps_meters": 500,
+        "min_samples": 2,
+    }
+    manager = ClusteringManager(config)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        manager.store = ClusteringStore(cache_dir)
+        report(
+            "Cached clustering (vs clustering)",
+            best_time(lambda: manager.cluster_by_source(generators, "DE"), 1),
+            best_time(lambda: manager.cluster_by_source(generators, "DE"), 1),
+            len(generators),
+        )
+        print(f"  hits/misses: {manager.cache_hits}/{manager.cache_misses}")
+        manager.store.close()
+
+
+def bench_tiles(args: argparse.Namespace) -> None:
+    """Compare single-pass and tiled haversine DBSCAN."""
+    import numpy as np
+
+    from osm_powerplants.enhancement.clustering import haversine_dbscan, tiled_dbscan
+
+    rng = np.random.default_rng(0)
+    towns = rng.uniform([47.0, 6.0], [55.0, 15.0], size=(args.elements // 200, 2))
+    points = towns[rng.integers(0, len(towns), args.elements)]
+    points += rng.normal(0, 0.01, points.shape)
+
+    def baseline() -> np.ndarray:
+        return haversine_dbscan(points[:, 0], points[:, 1], 500, 2)
+
+    def optimized() -> np.ndarray:
+        return tiled_dbscan(points[:, 0], points[:, 1], 500, 2, workers=args.workers)
+
+    # Measured before anything else runs in this process
+    print("Clustering peak memory growth:")
+    print(f"  baseline:  {peak_memory(baseline):8.1f} MiB")
+    print(f"  optimized: {peak_memory(optimized):8.1f} MiB")
+    assert (baseline() == optimized()).all()
+    report(
+        f"Tiled DBSCAN with {args.workers or 1} workers (vs single pass)",
+        best_time(baseline, args.repeat),
+        best_time(optimized, args.repeat),
+        len(points),
+    )
+
+
+def bench_pipeline(args: argparse.Namespace) -> None:
+    """Compare taking turns and overlapping country downloads and processing."""
+    from osm_powerplants.retrieval.prefetch import download_ahead
+
+    elements = synthetic_generators(args.elements)
+    countries = ["Germany"] * args.countries
+
+    class SlowClient(OverpassAPIClient):
+        # Stands in for the Overpass API round trips of one country
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            time.sleep(args.latency)
+            return {"elements": []}, {"elements": elements}
+
+    config = get_config()
+    config.update(
+        {
+            "plants_only": False,
+            "units_reconstruction": {"enabled": False},
+            "incremental_parsing": {"enabled": False},
+            "parallel_parsing": {"enabled": False},
+        }
+    )
+
+    def process(client: OverpassAPIClient, osm_data=None) -> int:
+        with Workflow(client, RejectionTracker(), Units(), config) as workflow:
+            units, _ = workflow.process_country_data(
+                "Germany", force_refresh=True, osm_data=osm_data
+            )
+        return len(units)
+
+    def baseline() -> list[int]:
+        return [process(client) for _ in countries]
+
+    def optimized() -> list[int]:
+        return [
+            process(client, download.result())
+            for _, download in download_ahead(client, countries, force_refresh=True)
+        ]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with SlowClient(cache_dir=cache_dir, show_progress=False) as client:
+            assert baseline() == optimized()
+            start = time.perf_counter()
+            process(client, ({"elements": []}, {"elements": elements}))
+            cpu = time.perf_counter() - start
+            print(f"Per country: {args.latency:.2f}s download, {cpu:.2f}s processing")
+            report(
+                f"{args.countries} countries with downloads one ahead",
+                best_time(baseline, 1),
+                best_time(optimized, 1),
+                args.countries,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    tags_parser = subparsers.add_parser("tags", help="Tag mapping classification")
+    tags_parser.add_argument("--elements", type=int, default=100_000)
+    tags_parser.add_argument("--repeat", type=int, default=5)
+    tags_parser.set_defaults(func=bench_tags)
+
+    batch_parser = subparsers.add_parser("batch", help="Batch generator parsing")
+    batch_parser.add_argument("--elements", type=int, default=50_000)
+    batch_parser.add_argument("--repeat", type=int, default=3)
+    batch_parser.set_defaults(func=bench_batch)
+
+    capacity_parser = subparsers.add_parser("capacity", help="Capacity parsing")
+    capacity_parser.add_argument("--elements", type=int, default=200_000)
+    capacity_parser.add_argument("--repeat", type=int, default=5)
+    capacity_parser.set_defaults(func=bench_capacity)
+
+    parallel_parser = subparsers.add_parser("parallel", help="Parallel parsing")
+    parallel_parser.add_argument("--elements", type=int, default=200_000)
+    parallel_parser.add_argument("--repeat", type=int, default=1)
+    parallel_parser.add_argument("--workers", type=int, default=4)
+    parallel_parser.set_defaults(func=bench_parallel)
+
+    memory_parser = subparsers.add_parser("memory", help="Compact elements")
+    memory_parser.add_argument("--elements", type=int, default=200_000)
+    memory_parser.add_argument("--repeat", type=int, default=5)
+    memory_parser.set_defaults(func=bench_memory)
+
+    dates_parser = subparsers.add_parser("dates", help="Start date parsing")
+    dates_parser.add_argument("--elements", type=int, default=50_000)
+    dates_parser.add_argument("--repeat", type=int, default=3)
+    dates_parser.set_defaults(func=bench_dates)
+
+    plants_parser = subparsers.add_parser("plants", help="Plant containment checks")
+    plants_parser.add_argument("--elements", type=int, default=2_000)
+    plants_parser.add_argument("--plants", type=int, default=1_000)
+    plants_parser.add_argument("--repeat", type=int, default=3)
+    plants_parser.set_defaults(func=bench_plants)
+
+    geometry_parser = subparsers.add_parser("geometry", help="Batch geometry")
+    geometry_parser.add_argument("--elements", type=int, default=50_000)
+    geometry_parser.add_argument("--repeat", type=int, default=3)
+    geometry_parser.set_defaults(func=bench_geometry)
+
+    areas_parser = subparsers.add_parser("areas", help="Area-based estimation")
+    areas_parser.add_argument("--elements", type=int, default=50_000)
+    areas_parser.add_argument("--repeat", type=int, default=3)
+    areas_parser.set_defaults(func=bench_areas)
+
+    clustering_parser = subparsers.add_parser("clustering", help="DBSCAN clustering")
+    clustering_parser.add_argument("--elements", type=int, default=100_000)
+    clustering_parser.add_argument("--repeat", type=int, default=1)
+    clustering_parser.set_defaults(func=bench_clustering)
+
+    grid_parser = subparsers.add_parser("grid", help="Grid clustering")
+    grid_parser.add_argument("--elements", type=int, default=200_000)
+    grid_parser.add_argument("--repeat", type=int, default=1)
+    grid_parser.set_defaults(func=bench_grid)
+
+    kmeans_parser = subparsers.add_parser("kmeans", help="Mini-batch K-means")
+    kmeans_parser.add_argument("--elements", type=int, default=200_000)
+    kmeans_parser.add_argument("--clusters", type=int, default=200)
+    kmeans_parser.add_argument("--repeat", type=int, default=1)
+    kmeans_parser.set_defaults(func=bench_kmeans)
+
+    incremental_parser = subparsers.add_parser(
+        "incremental", help="Incremental re-clustering"
+    )
+    incremental_parser.add_argument("--elements", type=int, default=200_000)
+    incremental_parser.add_argument("--changed", type=int, default=100)
+    incremental_parser.set_defaults(func=bench_incremental)
+
+    cluster_cache_parser = subparsers.add_parser(
+        "cluster-cache", help="Clustering result cache"
+    )
+    cluster_cache_parser.add_argument("--elements", type=int, default=200_000)
+    cluster_cache_parser.set_defaults(func=bench_cluster_cache)
+
+    tiles_parser = subparsers.add_parser("tiles", help="Tiled DBSCAN")
+    tiles_parser.add_argument("--elements", type=int, default=200_000)
+    tiles_parser.add_argument("--workers", type=int, default=None)
+    tiles_parser.add_argument("--repeat", type=int, default=1)
+    tiles_parser.set_defaults(func=bench_tiles)
+
+    pipeline_parser = subparsers.add_parser(
+        "pipeline", help="Overlapped download and processing"
+    )
+    pipeline_parser.add_argument("--elements", type=int, default=20_000)
+    pipeline_parser.add_argument("--countries", type=int, default=6)
+    pipeline_parser.add_argument("--latency", type=float, default=1.0)
+    pipeline_parser.set_defaults(func=bench_pipeline)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
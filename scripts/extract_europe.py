@@ -3,15 +3,20 @@
 Full European extraction script.
 
 Processes all 36 European countries (excluding Kosovo) with a single client
-and shared Units instance for optimal performance.
+and shared Units instance for optimal performance. With ``--jobs N``,
+countries are processed in N worker processes, each with its own client over
+the shared cache; results are combined in country order.
 
 Usage:
-    python scripts/extract_europe.py [--clear-cache]
+    python scripts/extract_europe.py [--clear-cache] [--import-cache SNAPSHOT]
+                                     [--export-cache SNAPSHOT] [--jobs N]
 """
 
 import argparse
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 # Add src to path for development
@@ -21,6 +26,8 @@ from osm_powerplants import Units, get_cache_dir, get_config
 from osm_powerplants.interface import validate_countries
 from osm_powerplants.quality.rejection import RejectionTracker
 from osm_powerplants.retrieval.client import OverpassAPIClient
+from osm_powerplants.retrieval.prefetch import download_ahead
+from osm_powerplants.retrieval.snapshot import export_cache, import_cache
 from osm_powerplants.workflow import Workflow
 
 EUROPEAN_COUNTRIES = [
@@ -75,6 +82,51 @@ def clear_cache(cache_dir: Path) -> None:
         print(f"Cache directory does not exist: {cache_dir}")
 
 
+def process_country(client, country: str, config: dict, download=None):
+    """Process one country into its own units and rejection tracker.
+
+    ``download`` is the future of a download started by ``download_ahead``.
+
+    Returns
+    -------
+    tuple[list[Unit], RejectionTracker, str or None]
+        Units, rejections and the error message if processing failed
+    """
+    country_units = Units()
+    country_tracker = RejectionTracker.from_config(config)
+
+    try:
+        osm_data = download.result() if download is not None else None
+        with Workflow(
+            client=client,
+            rejection_tracker=country_tracker,
+            units=country_units,
+            config=config,
+        ) as workflow:
+            workflow.process_country_data(country, osm_data=osm_data)
+    except Exception as e:
+        return [], country_tracker, str(e)
+    return list(country_units), country_tracker, None
+
+
+# Client of a worker process, created once by init_worker
+_worker_client = None
+
+
+def init_worker(client_params: dict) -> None:
+    """Create the client used by all countries of a worker process."""
+    global _worker_client
+    _worker_client = OverpassAPIClient(**client_params)
+
+
+def process_country_worker(country: str, config: dict):
+    """Process one country in a worker process and save its caches."""
+    try:
+        return process_country(_worker_client, country, config)
+    finally:
+        _worker_client.cache.save_all_caches()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract European power plants from OSM"
@@ -90,10 +142,35 @@ def main():
         default="osm_europe.csv",
         help="Output CSV file (default: osm_europe.csv)",
     )
+    parser.add_argument(
+        "--import-cache",
+        metavar="SNAPSHOT",
+        help="Load a cache snapshot before processing",
+    )
+    parser.add_argument(
+        "--export-cache",
+        metavar="SNAPSHOT",
+        help="Write a cache snapshot after processing",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Download the plants and generators of every country again, "
+        "reusing cached nodes, ways and relations",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Countries processed in parallel worker processes (default: 1)",
+    )
     args = parser.parse_args()
 
     # Load config
     config = get_config()
+    if args.refresh:
+        config["force_refresh"] = True
     cache_dir = get_cache_dir(config)
 
     print(f"Cache directory: {cache_dir}")
@@ -112,7 +189,7 @@ def main():
 
     # Single Units instance for all countries
     all_units = Units()
-    all_rejections = RejectionTracker()
+    all_rejections = RejectionTracker.from_config(config)
 
     # Get client params
     api_config = config.get("overpass_api", {})
@@ -123,47 +200,82 @@ def main():
         "max_retries": api_config.get("max_retries", 3),
         "retry_delay": api_config.get("retry_delay", 60),
         "show_progress": api_config.get("show_progress", True),
+        "compact_elements": config.get("compact_elements", {}).get("enabled", False),
     }
 
     # Process all countries with single client
     with OverpassAPIClient(**client_params) as client:
-        for i, country in enumerate(valid_countries, 1):
-            print(f"\n{'='*60}")
+        if args.import_cache:
+            manifest = import_cache(
+                client.cache, args.import_cache, boundary_index=client.boundary_index
+            )
             print(
-                f"Processing {i}/{len(valid_countries)}: {country} ({country_codes[country]})"
+                f"Imported cache snapshot from {manifest['created_at']} "
+                f"({len(manifest['countries'])} countries)"
             )
-            print("=" * 60)
-
-            country_units = Units()
-            country_tracker = RejectionTracker()
 
-            workflow = Workflow(
-                client=client,
-                rejection_tracker=country_tracker,
-                units=country_units,
-                config=config,
+        if args.jobs > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=args.jobs,
+                initializer=init_worker,
+                initargs=(client_params,),
             )
+            # Results arrive in country order whichever worker finishes first
+            results = executor.map(
+                process_country_worker, valid_countries, repeat(config)
+            )
+        elif api_config.get("download_ahead", 0) > 0:
+            executor = None
+            # Following countries download while the current one is processed
+            results = (
+                process_country(client, country, config, download)
+                for country, download in download_ahead(
+                    client,
+                    valid_countries,
+                    ahead=api_config["download_ahead"],
+                    force_refresh=config.get("force_refresh", False),
+                    plants_only=config.get("plants_only", True),
+                )
+            )
+        else:
+            executor = None
+            results = (
+                process_country(client, country, config) for country in valid_countries
+            )
+
+        try:
+            for i, (country, (country_units, country_tracker, error)) in enumerate(
+                zip(valid_countries, results), 1
+            ):
+                print(f"\n{'='*60}")
+                print(
+                    f"Processed {i}/{len(valid_countries)}: {country} ({country_codes[country]})"
+                )
+                print("=" * 60)
 
-            try:
-                workflow.process_country_data(country)
+                if error is not None:
+                    print(f"✗ {country}: Error - {error}")
+                    continue
 
                 # Add to global collection
                 for unit in country_units:
                     all_units.add_unit(unit)
-
-                # Merge rejections
-                for rej_list in country_tracker.rejected_elements.values():
-                    for rej in rej_list:
-                        all_rejections.rejected_elements.setdefault(rej.id, []).append(
-                            rej
-                        )
+                all_rejections.merge(country_tracker)
 
                 print(f"✓ {country}: {len(country_units)} plants")
                 print(country_tracker.get_summary_string())
-
-            except Exception as e:
-                print(f"✗ {country}: Error - {e}")
-                continue
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if args.export_cache:
+            if executor is not None:
+                # Pick up the country caches saved by the workers
+                client.cache.load_all_caches()
+            export_cache(
+                client.cache, args.export_cache, boundary_index=client.boundary_index
+            )
+            print(f"✓ Saved cache snapshot to {args.export_cache}")
 
     # Summary
     print(f"\n{'='*60}")
@@ -12,6 +12,7 @@ __version__ = "0.1.3"
 
 from .core import get_cache_dir, get_config
 from .interface import (
+    prefetch_countries,
     process_countries,
     process_units,
     validate_countries,
@@ -22,6 +23,7 @@ __all__ = [
     "__version__",
     "process_countries",
     "process_units",
+    "prefetch_countries",
     "validate_countries",
     "Unit",
     "Units",
@@ -65,6 +65,79 @@ def main():
         action="store_true",
         help="Reprocess from API cache (skip CSV cache)",
     )
+    process_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Countries processed in parallel worker processes (default: 1)",
+    )
+
+    # Prefetch command
+    prefetch_parser = subparsers.add_parser(
+        "prefetch",
+        help="Download OSM data for countries into the cache without processing",
+    )
+    prefetch_parser.add_argument(
+        "countries",
+        nargs="+",
+        help="Countries to prefetch (names or ISO codes)",
+    )
+    prefetch_parser.add_argument(
+        "-c",
+        "--config",
+        help="Path to config file",
+    )
+    prefetch_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Concurrent country downloads (default: overpass_api.prefetch_jobs)",
+    )
+    prefetch_parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Download again even if already prefetched",
+    )
+
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Export or import cache snapshots",
+    )
+    cache_subparsers = cache_parser.add_subparsers(
+        dest="cache_command", help="Cache commands"
+    )
+    export_parser = cache_subparsers.add_parser(
+        "export",
+        help="Pack the cache into a snapshot archive",
+    )
+    export_parser.add_argument(
+        "path",
+        help="Snapshot file to write (e.g. cache.tar.gz)",
+    )
+    export_parser.add_argument(
+        "--countries",
+        nargs="+",
+        help="Only export these countries (default: all cached countries)",
+    )
+    export_parser.add_argument(
+        "-c",
+        "--config",
+        help="Path to config file",
+    )
+    import_parser = cache_subparsers.add_parser(
+        "import",
+        help="Load a snapshot archive into the cache",
+    )
+    import_parser.add_argument(
+        "path",
+        help="Snapshot file to read",
+    )
+    import_parser.add_argument(
+        "-c",
+        "--config",
+        help="Path to config file",
+    )
 
     # Info command
     info_parser = subparsers.add_parser(
@@ -81,6 +154,10 @@ def main():
 
     if args.command == "process":
         run_process(args)
+    elif args.command == "prefetch":
+        run_prefetch(args)
+    elif args.command == "cache" and args.cache_command:
+        run_cache(args)
     elif args.command == "info":
         run_info(args)
     else:
@@ -111,6 +188,7 @@ def run_process(args):
             cache_dir=str(cache_dir),
             update=args.update,
             osm_config=config,
+            jobs=args.jobs,
         )
 
         if df.empty:
@@ -125,6 +203,79 @@ def run_process(args):
         sys.exit(1)
 
 
+def run_prefetch(args):
+    """Run the prefetch command."""
+    from .interface import prefetch_countries
+
+    config = get_config(args.config)
+    cache_dir = get_cache_dir(config)
+
+    logger.info(f"Prefetching countries: {args.countries}")
+    logger.info(f"Cache directory: {cache_dir}")
+
+    try:
+        results = prefetch_countries(
+            countries=args.countries,
+            config=config,
+            cache_dir=str(cache_dir),
+            jobs=args.jobs,
+            force_refresh=args.force_refresh or None,
+        )
+    except Exception as e:
+        logger.error(f"Prefetch failed: {e}")
+        sys.exit(1)
+
+    logger.info(
+        f"Prefetched {len(results['countries_fetched'])} countries, "
+        f"skipped {len(results['countries_skipped'])} already cached"
+    )
+    for country, error in results["countries_failed"].items():
+        logger.error(f"Failed to prefetch {country}: {error}")
+
+    if not results["success"]:
+        sys.exit(1)
+
+
+def run_cache(args):
+    """Run the cache export/import commands."""
+    from .retrieval.boundaries import CountryBoundaryIndex
+    from .retrieval.cache import ElementCache
+    from .retrieval.snapshot import export_cache, import_cache
+
+    config = get_config(args.config)
+    cache_dir = str(get_cache_dir(config))
+    cache_size_gb = config.get("overpass_api", {}).get("cache_size_gb", 12)
+
+    logger.info(f"Cache directory: {cache_dir}")
+
+    cache = ElementCache(cache_dir, cache_size_gb=cache_size_gb)
+    boundary_index = CountryBoundaryIndex(cache_dir)
+    try:
+        cache.load_all_caches()
+        if args.cache_command == "export":
+            manifest = export_cache(
+                cache,
+                args.path,
+                countries=args.countries,
+                boundary_index=boundary_index,
+            )
+            logger.info(
+                f"Exported {len(manifest['countries'])} countries to {args.path}"
+            )
+        else:
+            manifest = import_cache(cache, args.path, boundary_index=boundary_index)
+            logger.info(
+                f"Imported {len(manifest['countries'])} countries from {args.path} "
+                f"(created {manifest['created_at']})"
+            )
+    except (OSError, ValueError) as e:
+        logger.error(f"Cache {args.cache_command} failed: {e}")
+        sys.exit(1)
+    finally:
+        boundary_index.close()
+        cache.close()
+
+
 def run_info(args):
     """Run the info command."""
     from .core import get_default_config_path
@@ -9,13 +9,24 @@ This module provides clustering algorithms to group nearby generators
 into logical power plant units based on spatial proximity.
 """
 
+import hashlib
 import inspect
+import json
 import logging
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
+import diskcache
 import numpy as np
-from sklearn.cluster import DBSCAN, KMeans
+import pandas as pd
+from sklearn.cluster import DBSCAN, KMeans, MiniBatchKMeans
+from sklearn.neighbors import BallTree
 
+from osm_powerplants.enhancement.kernels import EARTH_RADIUS_M
 from osm_powerplants.models import Unit
 from osm_powerplants.parsing.factory import UnitFactory
 
@@ -36,36 +47,516 @@ class ClusteringAlgorithm:
         )
         return {}
 
+    def locality(self) -> tuple[float, float] | None:
+        """Get the distances over which a changed generator affects clusters.
+
+        Returns
+        -------
+        tuple[float, float] or None
+            ``(reach, halo)`` in metres: clusters with a member within
+            ``reach`` of a change are re-clustered, together with the
+            generators within ``halo`` of them for context. None if a
+            change can affect every cluster, as for K-means.
+        """
+        return None
+
+    def label_points(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Label coordinates by cluster, for algorithms with a locality."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support incremental clustering"
+        )
+
+    def core_points(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Mark the points through which clusters connect.
+
+        Only links between core points join clusters; border points belong
+        to a cluster without connecting it to another one.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support incremental clustering"
+        )
+
     def get_cluster_centroids(
         self, clusters: dict[int, list[Unit]]
     ) -> dict[int, tuple[float, float]]:
         """Calculate centroid for each cluster."""
-        centroids = {}
-        for cluster_id, plants in clusters.items():
-            if cluster_id < 0:
-                continue
-
-            lats = [plant.lat for plant in plants if plant.lat is not None]
-            lons = [plant.lon for plant in plants if plant.lon is not None]
-
-            if lats and lons:
-                centroids[cluster_id] = (sum(lats) / len(lats), sum(lons) / len(lons))
+        cluster_ids, members = _cluster_members(clusters)
+        lats = _unit_values(clusters, "lat")
+        lons = _unit_values(clusters, "lon")
+        lat_sums, lat_counts = _sums(members, lats, len(cluster_ids))
+        lon_sums, lon_counts = _sums(members, lons, len(cluster_ids))
 
+        centroids = {}
+        for k, cluster_id in enumerate(cluster_ids):
+            if lat_counts[k] and lon_counts[k]:
+                centroids[cluster_id] = (
+                    lat_sums[k] / lat_counts[k],
+                    lon_sums[k] / lon_counts[k],
+                )
         return centroids
 
     def get_cluster_capacity(self, clusters: dict[int, list[Unit]]) -> dict[int, float]:
         """Calculate total capacity for each cluster."""
-        capacities = {}
-        for cluster_id, plants in clusters.items():
-            if cluster_id < 0:
-                continue
+        cluster_ids, members = _cluster_members(clusters)
+        capacities = _unit_values(clusters, "Capacity")
+        capacity_sums, _ = _sums(
+            members, np.nan_to_num(capacities, nan=0.0), len(cluster_ids)
+        )
+        return dict(zip(cluster_ids, capacity_sums, strict=True))
+
+
+def _group_by_label(
+    labels: np.ndarray, generators: list[Unit]
+) -> dict[int, list[Unit]]:
+    """Group generators by cluster label, in order of first appearance."""
+    clusters: dict[int, list[Unit]] = {}
+    for label, generator in zip(labels.tolist(), generators, strict=True):
+        clusters.setdefault(label, []).append(generator)
+    return clusters
 
-            capacity = sum(
-                plant.Capacity if plant.Capacity is not None else 0 for plant in plants
-            )
-            capacities[cluster_id] = capacity
 
-        return capacities
+def _cluster_members(clusters: dict[int, list[Unit]]) -> tuple[list[int], np.ndarray]:
+    """Get the IDs of real clusters and the cluster position of each unit.
+
+    Units of outlier clusters (negative IDs) get position -1.
+    """
+    cluster_ids = [cluster_id for cluster_id in clusters if cluster_id >= 0]
+    positions = {cluster_id: k for k, cluster_id in enumerate(cluster_ids)}
+    members = np.fromiter(
+        (
+            positions.get(cluster_id, -1)
+            for cluster_id, plants in clusters.items()
+            for _ in plants
+        ),
+        dtype=np.int64,
+    )
+    return cluster_ids, members
+
+
+def _unit_values(clusters: dict[int, list[Unit]], field: str) -> np.ndarray:
+    """Get a numeric field of all clustered units, NaN where missing."""
+    values = (getattr(plant, field) for plants in clusters.values() for plant in plants)
+    return np.fromiter(
+        (np.nan if value is None else value for value in values), dtype=float
+    )
+
+
+def _sums(
+    members: np.ndarray, values: np.ndarray, count: int
+) -> tuple[list[float], list[int]]:
+    """Sum the present values per cluster, in unit order."""
+    present = (members >= 0) & ~np.isnan(values)
+    sums = np.bincount(members[present], weights=values[present], minlength=count)
+    counts = np.bincount(members[present], minlength=count)
+    return sums.tolist(), counts.tolist()
+
+
+def haversine_dbscan(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    eps_meters: float,
+    min_samples: int,
+    chunk_size: int = 2000,
+    n_jobs: int | None = None,
+    leaf_size: int = 40,
+) -> np.ndarray:
+    """Run DBSCAN with great-circle distances in bounded memory.
+
+    Neighbourhoods are found with a haversine BallTree and processed in
+    chunks, so memory grows with the number of points and the chunk size
+    rather than with the total number of neighbour pairs. Core points are
+    joined with a vectorized union-find. Labels match
+    ``DBSCAN(metric="haversine")``: clusters are numbered in the order of
+    their first core point and border points join the lowest-numbered
+    neighbouring cluster.
+
+    Parameters
+    ----------
+    lats, lons : numpy.ndarray
+        Coordinates in degrees
+    eps_meters : float
+        Neighbourhood radius in metres
+    min_samples : int
+        Neighbours (including the point itself) that make a core point
+    chunk_size : int
+        Points whose neighbourhoods are held in memory at once
+    n_jobs : int, optional
+        Threads querying chunks concurrently, 1 by default; -1 uses all
+        CPUs
+    leaf_size : int
+        BallTree leaf size
+
+    Returns
+    -------
+    numpy.ndarray
+        Cluster label of each point, -1 for noise
+    """
+    coords = np.radians(np.column_stack([lats, lons]))
+    n = len(coords)
+    if not n:
+        return np.empty(0, dtype=np.int64)
+
+    tree = BallTree(coords, leaf_size=leaf_size, metric="haversine")
+    radius = eps_meters / EARTH_RADIUS_M
+    chunk_size = max(1, chunk_size)
+    if n_jobs is None:
+        workers = 1
+    elif n_jobs < 0:
+        workers = os.cpu_count() or 1
+    else:
+        workers = max(1, n_jobs)
+
+    def chunks(points: np.ndarray) -> list[np.ndarray]:
+        return [points[i : i + chunk_size] for i in range(0, len(points), chunk_size)]
+
+    def query(points: np.ndarray) -> np.ndarray:
+        return tree.query_radius(coords[points], r=radius)
+
+    counts = np.zeros(n, dtype=np.int64)
+    core = np.zeros(n, dtype=bool)
+    # Union-find over core points; roots are the smallest point index
+    parent = np.arange(n)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Neighbourhoods are symmetric, so each pair is linked once, from its
+        # later point, when the core status of both points is known
+        for points, neighbours in _bounded_map(
+            executor, query, chunks(np.arange(n)), workers
+        ):
+            sizes = [len(found) for found in neighbours]
+            counts[points] = sizes
+            core[points] = counts[points] >= min_samples
+            targets = np.concatenate(neighbours)
+            sources = np.repeat(points, sizes)
+            del neighbours
+            linked = (targets < sources) & core[targets] & core[sources]
+            sources, targets = sources[linked], targets[linked]
+            if len(sources):
+                # The tree is compressed, so parent holds the roots. Each
+                # source joins the smallest root among itself and its
+                # neighbours, and only differing roots are linked.
+                starts = np.flatnonzero(np.diff(sources, prepend=-1))
+                smallest = np.minimum(
+                    np.minimum.reduceat(parent[targets], starts),
+                    parent[sources[starts]],
+                )
+                joined = np.repeat(smallest, np.diff(starts, append=len(sources)))
+                roots = np.concatenate([parent[targets], parent[sources[starts]]])
+                joined = np.concatenate([joined, smallest])
+                differ = roots != joined
+                _union(parent, roots[differ], joined[differ])
+                _compress(parent)
+
+        labels = np.full(n, -1, dtype=np.int64)
+        core_points = np.flatnonzero(core)
+        unique_roots, core_labels = np.unique(parent[core_points], return_inverse=True)
+        labels[core_points] = core_labels
+        logger.debug(f"Found {len(unique_roots)} clusters among {n} points")
+
+        border_points = np.flatnonzero(~core & (counts > 1))
+        for points, neighbours in _bounded_map(
+            executor, query, chunks(border_points), workers
+        ):
+            found = np.concatenate(neighbours)
+            owners = np.repeat(np.arange(len(points)), [len(f) for f in neighbours])
+            is_core = core[found]
+            nearest = np.full(len(points), n, dtype=np.int64)
+            np.minimum.at(nearest, owners[is_core], labels[found[is_core]])
+            joined = nearest < n
+            labels[points[joined]] = nearest[joined]
+
+    return labels
+
+
+def haversine_core_points(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    eps_meters: float,
+    min_samples: int,
+    chunk_size: int = 2000,
+    leaf_size: int = 40,
+) -> np.ndarray:
+    """Find the DBSCAN core points with great-circle distances.
+
+    Parameters
+    ----------
+    lats, lons : numpy.ndarray
+        Coordinates in degrees
+    eps_meters : float
+        Neighbourhood radius in metres
+    min_samples : int
+        Neighbours (including the point itself) that make a core point
+    chunk_size : int
+        Points counted at once
+    leaf_size : int
+        BallTree leaf size
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask of the core points, as in :func:`haversine_dbscan`
+    """
+    coords = np.radians(np.column_stack([lats, lons]))
+    core = np.zeros(len(coords), dtype=bool)
+    if not len(coords):
+        return core
+
+    tree = BallTree(coords, leaf_size=leaf_size, metric="haversine")
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(coords), chunk_size):
+        counts = tree.query_radius(
+            coords[start : start + chunk_size],
+            r=eps_meters / EARTH_RADIUS_M,
+            count_only=True,
+        )
+        core[start : start + chunk_size] = counts >= min_samples
+    return core
+
+
+def tiled_dbscan(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    eps_meters: float,
+    min_samples: int,
+    tile_meters: float = 50_000,
+    workers: int | None = None,
+    leaf_size: int = 40,
+) -> np.ndarray:
+    """Run haversine DBSCAN on spatial tiles in worker processes.
+
+    Points are split into square tiles of about ``tile_meters``. Each tile
+    is clustered with the points of its neighbours within ``eps`` (the
+    halo), which gives the exact core status of the tile's own points.
+    Tiles report their local clusters and the links of their points into
+    the halo; clusters linked across tile boundaries are merged here.
+    Labels are identical to :func:`haversine_dbscan`, independent of the
+    tiling and the number of workers.
+
+    Parameters
+    ----------
+    lats, lons : numpy.ndarray
+        Coordinates in degrees
+    eps_meters : float
+        Neighbourhood radius in metres
+    min_samples : int
+        Neighbours (including the point itself) that make a core point
+    tile_meters : float
+        Tile size in metres, at least ``4 * eps_meters``
+    workers : int, optional
+        Worker processes; tiles are clustered in this process by default
+    leaf_size : int
+        BallTree leaf size
+
+    Returns
+    -------
+    numpy.ndarray
+        Cluster label of each point, -1 for noise
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    n = len(lats)
+    if not n:
+        return np.empty(0, dtype=np.int64)
+
+    tiles = _tiles(lats, lons, max(tile_meters, 4 * eps_meters), eps_meters)
+    payloads = (
+        (points, lats[points], lons[points], owned, eps_meters, min_samples, leaf_size)
+        for points, owned in tiles
+    )
+
+    core = np.zeros(n, dtype=bool)
+    # Union-find over core points; roots are the smallest point index
+    parent = np.arange(n)
+    link_sources: list[np.ndarray] = []
+    link_targets: list[np.ndarray] = []
+
+    def merge(points: np.ndarray, result: tuple) -> None:
+        tile_core, roots, sources, targets = result
+        owned = points[: len(tile_core)]
+        core[owned] = tile_core
+        parent[owned[tile_core]] = points[roots[tile_core]]
+        link_sources.append(points[sources])
+        link_targets.append(points[targets])
+
+    if workers is not None and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_cluster_tile, payloads)
+            for (points, _), result in zip(tiles, results, strict=True):
+                merge(points, result)
+    else:
+        for (points, _), payload in zip(tiles, payloads, strict=True):
+            merge(points, _cluster_tile(payload))
+
+    sources = np.concatenate(link_sources)
+    targets = np.concatenate(link_targets)
+    linked = core[sources] & core[targets]
+    _union(parent, sources[linked], targets[linked])
+    _compress(parent)
+
+    labels = np.full(n, -1, dtype=np.int64)
+    core_points = np.flatnonzero(core)
+    unique_roots, core_labels = np.unique(parent[core_points], return_inverse=True)
+    labels[core_points] = core_labels
+
+    # Border points join the lowest-numbered neighbouring cluster
+    border = ~core[sources] & core[targets]
+    nearest = np.full(n, n, dtype=np.int64)
+    np.minimum.at(nearest, sources[border], labels[targets[border]])
+    joined = nearest < n
+    labels[joined] = nearest[joined]
+    logger.debug(
+        f"Found {len(unique_roots)} clusters among {n} points in {len(tiles)} tiles"
+    )
+    return labels
+
+
+def _tiles(
+    lats: np.ndarray, lons: np.ndarray, tile_meters: float, halo_meters: float
+) -> list[tuple[np.ndarray, int]]:
+    """Split points into tiles with a halo.
+
+    Returns, for each tile with points of its own, the point indices (own
+    points first, each part in index order) and the number of own points.
+    Tile columns are at least ``tile_meters`` wide at the most poleward
+    point, so the halo of a tile is within its eight neighbours. Columns
+    divide the full circle and wrap around at the antimeridian.
+    """
+    meters_per_degree = np.pi / 180 * EARTH_RADIUS_M
+    row_degrees = tile_meters / meters_per_degree
+    stretch = 1 / np.cos(np.radians(min(np.abs(lats).max() + row_degrees, 89.9)))
+    column_count = max(1, int(360 / (row_degrees * stretch)))
+    column_degrees = 360 / column_count
+    lat_margin = halo_meters / meters_per_degree
+    lon_margin = lat_margin * stretch
+
+    row_position = lats / row_degrees
+    column_position = (lons + 180) / column_degrees
+    rows = np.floor(row_position).astype(np.int64)
+    columns = np.floor(column_position).astype(np.int64)
+    near_edge = {
+        (-1, 0): (row_position - rows) * row_degrees < lat_margin,
+        (1, 0): (rows + 1 - row_position) * row_degrees < lat_margin,
+        (0, -1): (column_position - columns) * column_degrees < lon_margin,
+        (0, 1): (columns + 1 - column_position) * column_degrees < lon_margin,
+    }
+    columns %= column_count
+
+    keys = [rows * column_count + columns]
+    points = [np.arange(len(lats))]
+    own = [np.ones(len(lats), dtype=bool)]
+    for dr in (-1, 0, 1):
+        for dc in (-1, 0, 1):
+            if not dr and not dc:
+                continue
+            mask = np.ones(len(lats), dtype=bool)
+            if dr:
+                mask &= near_edge[(dr, 0)]
+            if dc:
+                mask &= near_edge[(0, dc)]
+            halo = np.flatnonzero(mask)
+            halo_columns = (columns[halo] + dc) % column_count
+            keys.append((rows[halo] + dr) * column_count + halo_columns)
+            points.append(halo)
+            own.append(np.zeros(len(halo), dtype=bool))
+
+    keys = np.concatenate(keys)
+    points = np.concatenate(points)
+    own = np.concatenate(own)
+    if column_count < 3:
+        # Wrapped neighbours coincide; keep each point once per tile,
+        # as an own point where it is one
+        order = np.lexsort((~own, points, keys))
+        keys, points, own = keys[order], points[order], own[order]
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = (np.diff(keys) != 0) | (np.diff(points) != 0)
+        keys, points, own = keys[first], points[first], own[first]
+    order = np.lexsort((points, ~own, keys))
+    keys, points, own = keys[order], points[order], own[order]
+    starts = np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
+    ends = np.append(starts[1:], len(keys))
+    return [
+        (points[start:end], int(own[start:end].sum()))
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True)
+        if own[start]
+    ]
+
+
+def _cluster_tile(
+    payload: tuple[np.ndarray, np.ndarray, np.ndarray, int, float, int, int],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Cluster the own points of a tile, in a worker process.
+
+    Returns the core status and local cluster root of each own point, and
+    the links to merge across tiles: from own core points to halo points
+    with a lower index (the tile of the halo point links the others), and
+    from own non-core points to all their neighbours. Positions are
+    tile-local.
+    """
+    points, lats, lons, owned, eps_meters, min_samples, leaf_size = payload
+    coords = np.radians(np.column_stack([lats, lons]))
+    tree = BallTree(coords, leaf_size=leaf_size, metric="haversine")
+    neighbours = tree.query_radius(coords[:owned], r=eps_meters / EARTH_RADIUS_M)
+    sizes = np.fromiter((len(found) for found in neighbours), dtype=np.int64)
+    core = sizes >= min_samples
+    targets = np.concatenate(neighbours)
+    sources = np.repeat(np.arange(owned), sizes)
+    del neighbours
+
+    # Own points are in index order, so local roots are the smallest index
+    parent = np.arange(owned)
+    own_core = np.zeros(len(points), dtype=bool)
+    own_core[:owned] = core
+    internal = own_core[sources] & own_core[targets] & (targets != sources)
+    _union(parent, sources[internal], targets[internal])
+    _compress(parent)
+
+    outward = (targets >= owned) & core[sources] & (points[targets] < points[sources])
+    border = ~core[sources] & (targets != sources)
+    links = outward | border
+    return core, parent, sources[links], targets[links]
+
+
+def _bounded_map(
+    executor: ThreadPoolExecutor, func: Any, items: list, window: int
+) -> Iterator[tuple[Any, Any]]:
+    """Yield (item, func(item)) in order with at most window pending calls."""
+    pending: deque = deque()
+    for item in items:
+        pending.append((item, executor.submit(func, item)))
+        if len(pending) > window:
+            done_item, future = pending.popleft()
+            yield done_item, future.result()
+    while pending:
+        done_item, future = pending.popleft()
+        yield done_item, future.result()
+
+
+def _find(parent: np.ndarray, points: np.ndarray) -> np.ndarray:
+    roots = parent[points]
+    while True:
+        following = parent[roots]
+        if np.array_equal(following, roots):
+            return roots
+        roots = following
+
+
+def _union(parent: np.ndarray, a: np.ndarray, b: np.ndarray) -> None:
+    while len(a):
+        root_a = _find(parent, a)
+        root_b = _find(parent, b)
+        differ = root_a != root_b
+        if not differ.any():
+            return
+        a, b = root_a[differ], root_b[differ]
+        np.minimum.at(parent, np.maximum(a, b), np.minimum(a, b))
+
+
+def _compress(parent: np.ndarray) -> None:
+    while True:
+        following = parent[parent]
+        if np.array_equal(following, parent):
+            return
+        parent[:] = following
 
 
 class DBSCANClustering(ClusteringAlgorithm):
@@ -74,6 +565,10 @@ class DBSCANClustering(ClusteringAlgorithm):
     Groups generators based on spatial density, creating clusters
     where generators are close together. Outliers are marked with
     cluster ID -1.
+
+    With ``eps_meters`` in the configuration, distances are great-circle
+    distances and :func:`haversine_dbscan` is used; otherwise ``eps`` is
+    a distance in the (optionally radian) coordinate space.
     """
 
     def cluster(self, generators: list[Unit]) -> dict[int, list[Unit]]:
@@ -102,6 +597,10 @@ class DBSCANClustering(ClusteringAlgorithm):
 
         coords = np.array(coords)
 
+        if self.config.get("eps_meters") is not None:
+            labels = self.label_points(coords[:, 0], coords[:, 1])
+            return _group_by_label(labels, valid_generators)
+
         if self.config.get("to_radians", False):
             coords = np.radians(coords)
 
@@ -127,22 +626,81 @@ class DBSCANClustering(ClusteringAlgorithm):
 
         labels = dbscan.fit_predict(coords)
 
-        clusters = {}
-        for i, label in enumerate(labels):
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append(valid_generators[i])
+        return _group_by_label(labels, valid_generators)
 
-        return clusters
+    def locality(self) -> tuple[float, float] | None:
+        """Get the reach of changes, only known for ``eps_meters``.
+
+        A change alters the core status of points within ``eps`` and so
+        the links of points within ``2 * eps``. Points within a further
+        ``2 * eps`` keep the core status of the re-clustered points exact.
+        """
+        eps_meters = self.config.get("eps_meters")
+        if eps_meters is None:
+            return None
+        return 2 * eps_meters, 2 * eps_meters
+
+    def label_points(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Label coordinates with :func:`haversine_dbscan`.
+
+        With ``tile_meters``, points are clustered in tiles by
+        :func:`tiled_dbscan`, in ``tile_workers`` processes.
+        """
+        if self.config.get("tile_meters") is not None:
+            return tiled_dbscan(
+                lats,
+                lons,
+                eps_meters=self.config["eps_meters"],
+                min_samples=self.config.get("min_samples", 2),
+                tile_meters=self.config["tile_meters"],
+                workers=self.config.get("tile_workers"),
+                leaf_size=self.config.get("leaf_size", 40),
+            )
+        return haversine_dbscan(
+            lats,
+            lons,
+            eps_meters=self.config["eps_meters"],
+            min_samples=self.config.get("min_samples", 2),
+            chunk_size=self.config.get("chunk_size", 2000),
+            n_jobs=self.config.get("n_jobs"),
+            leaf_size=self.config.get("leaf_size", 40),
+        )
+
+    def core_points(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Mark core points with :func:`haversine_core_points`."""
+        return haversine_core_points(
+            lats,
+            lons,
+            eps_meters=self.config["eps_meters"],
+            min_samples=self.config.get("min_samples", 2),
+            chunk_size=self.config.get("chunk_size", 2000),
+            leaf_size=self.config.get("leaf_size", 40),
+        )
 
 
 class KMeansClustering(ClusteringAlgorithm):
     """K-means clustering for fixed number of generator groups.
 
     Groups generators into a predetermined number of clusters based
-    on spatial proximity to cluster centers.
+    on spatial proximity to cluster centers. With ``minibatch: true`` the
+    centers are fitted on random batches of ``batch_size`` generators
+    (``MiniBatchKMeans``), stopping early after ``max_no_improvement``
+    batches without improvement.
+
+    Attributes
+    ----------
+    initial_centers : numpy.ndarray or None
+        Centers to start from instead of ``init`` (warm start)
+    cluster_centers : numpy.ndarray or None
+        Centers found by the last call to :meth:`cluster`
     """
 
+    def __init__(self, config: dict[str, Any]):
+        """Initialize with algorithm configuration."""
+        super().__init__(config)
+        self.initial_centers: np.ndarray | None = None
+        self.cluster_centers: np.ndarray | None = None
+
     def cluster(self, generators: list[Unit]) -> dict[int, list[Unit]]:
         """Cluster generators using K-means algorithm.
 
@@ -174,32 +732,549 @@ class KMeansClustering(ClusteringAlgorithm):
 
         n_clusters = self.config.get("n_clusters", min(8, len(coords)))
 
+        estimator = KMeans
+        param_names = ["init", "n_init", "max_iter", "tol", "verbose", "random_state"]
+        if self.config.get("minibatch", False):
+            estimator = MiniBatchKMeans
+            param_names += ["batch_size", "max_no_improvement", "reassignment_ratio"]
+
         kmeans_params = {}
-        signature = inspect.signature(KMeans.__init__)
+        signature = inspect.signature(estimator.__init__)
         possible_params = list(signature.parameters.keys())
 
-        for param in ["init", "n_init", "max_iter", "tol", "verbose", "random_state"]:
+        for param in param_names:
             if param in self.config and param in possible_params:
                 kmeans_params[param] = self.config[param]
 
-        kmeans = KMeans(n_clusters=n_clusters, **kmeans_params)
+        # Previous centers are only reused while the number of clusters holds
+        centers = self.initial_centers
+        warm_start = centers is not None and centers.shape == (n_clusters, 2)
+        if warm_start:
+            kmeans_params["init"] = centers
+            kmeans_params["n_init"] = 1
+
+        kmeans = estimator(n_clusters=n_clusters, **kmeans_params)
 
         labels = kmeans.fit_predict(coords)
+        self.cluster_centers = kmeans.cluster_centers_
+        logger.debug(
+            f"{estimator.__name__} converged after {kmeans.n_iter_} iterations "
+            f"({'warm' if warm_start else 'cold'} start)"
+        )
+
+        return _group_by_label(labels, valid_generators)
+
+
+@dataclass
+class ClusteringState:
+    """Clustering result of one fuel type of a country.
+
+    Attributes
+    ----------
+    config_hash : str
+        Hash of the clustering configuration that produced the result
+    ids : numpy.ndarray
+        Project IDs of the clustered generators
+    lats, lons : numpy.ndarray
+        Generator coordinates, the input of the spatial index
+    capacities : numpy.ndarray
+        Generator capacities, NaN where missing
+    attributes : numpy.ndarray
+        Country, technology and start date of each generator, which the
+        cluster plants take from their first member
+    labels : numpy.ndarray
+        Cluster label of each generator (-1 for outliers)
+    plants : dict[int, Unit]
+        Cluster plant of each cluster label
+    core : numpy.ndarray or None
+        Core status of each generator, None in states stored before it
+        was recorded
+    """
+
+    config_hash: str
+    ids: np.ndarray
+    lats: np.ndarray
+    lons: np.ndarray
+    capacities: np.ndarray
+    attributes: np.ndarray
+    labels: np.ndarray
+    plants: dict[int, Unit]
+    core: np.ndarray | None = None
+
+
+class ClusteringStore:
+    """Persistent store of clustering results.
+
+    Keeps K-means centers for warm starts and the clustering state of
+    each country and fuel type for incremental re-clustering.
+
+    Attributes
+    ----------
+    store : diskcache.Cache
+        Persistent storage of centers and states
+    """
+
+    def __init__(self, cache_dir: str):
+        """Open the clustering store.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Directory for the store
+        """
+        self.store = diskcache.Cache(directory=f"{cache_dir}/clustering_dc")
+
+    def close(self) -> None:
+        """Close the clustering store."""
+        try:
+            self.store.close()
+        except Exception as e:
+            logger.debug(f"Error closing clustering store: {e}")
+
+    def get_centers(
+        self, country: str, source_type: str, config: dict[str, Any]
+    ) -> np.ndarray | None:
+        """Get the K-means centers of the previous run, None if there are none.
+
+        Centers are kept per coordinate space, degrees or radians.
+        """
+        return self.store.get(_centers_key(country, source_type, config))
+
+    def put_centers(
+        self,
+        country: str,
+        source_type: str,
+        config: dict[str, Any],
+        centers: np.ndarray,
+    ) -> None:
+        """Store the K-means centers of a run."""
+        self.store.set(_centers_key(country, source_type, config), centers)
+
+    def get_state(self, country: str, source_type: str) -> ClusteringState | None:
+        """Get the clustering state of the previous run, None if there is none."""
+        return self.store.get(f"state:{country}:{source_type}")
+
+    def put_state(self, country: str, source_type: str, state: ClusteringState) -> None:
+        """Store the clustering state of a run."""
+        self.store.set(f"state:{country}:{source_type}", state)
+
+    def get_result(
+        self,
+        country: str,
+        source_type: str,
+        fingerprint: str,
+        generators: list[Unit],
+    ) -> list[Unit] | None:
+        """Get the clustered units of the previous run for the same input.
+
+        Only cluster plants are stored. Outliers are taken from
+        ``generators``, so their fields not covered by the fingerprint,
+        such as names, are current.
+
+        Parameters
+        ----------
+        country : str
+            Country being processed
+        source_type : str
+            Fuel type
+        fingerprint : str
+            Hash of the generators and clustering configuration
+        generators : list[Unit]
+            Generators of the fuel type, in the order they were clustered
+
+        Returns
+        -------
+        list[Unit] or None
+            Cluster plants and outliers, None if the input has changed
+        """
+        stored = self.store.get(f"clusters:{country}:{source_type}")
+        if stored is None or stored[0] != fingerprint:
+            return None
+        return [
+            generators[item] if isinstance(item, int) else item for item in stored[1]
+        ]
+
+    def put_result(
+        self,
+        country: str,
+        source_type: str,
+        fingerprint: str,
+        units: list[Unit],
+        generators: list[Unit],
+    ) -> None:
+        """Store the clustered units of a run, replacing the previous ones.
+
+        Units taken over from ``generators`` are stored as their position.
+        """
+        positions = {id(gen): position for position, gen in enumerate(generators)}
+        stored = [positions.get(id(unit), unit) for unit in units]
+        self.store.set(f"clusters:{country}:{source_type}", (fingerprint, stored))
+
+
+def _centers_key(country: str, source_type: str, config: dict[str, Any]) -> str:
+    space = "radians" if config.get("to_radians", False) else "degrees"
+    return f"centers:{country}:{source_type}:{space}"
 
-        clusters = {}
-        for i, label in enumerate(labels):
-            if label not in clusters:
-                clusters[label] = []
-            clusters[label].append(valid_generators[i])
 
-        return clusters
+def _clustering_config_hash(config: dict[str, Any]) -> str:
+    config_str = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.md5(config_str.encode()).hexdigest()
+
+
+def clustering_fingerprint(generators: list[Unit], config: dict[str, Any]) -> str:
+    """Hash the generators and configuration that clustering depends on.
+
+    Covers project IDs, coordinates and capacities of the generators, the
+    attributes cluster plants take from their members, and the clustering
+    configuration of the fuel type.
+
+    Parameters
+    ----------
+    generators : list[Unit]
+        Generators of one fuel type
+    config : dict
+        Configuration the clustered units depend on
+
+    Returns
+    -------
+    str
+        MD5 hex digest
+    """
+    digest = hashlib.md5(_clustering_config_hash(config).encode())
+    digest.update("\x1e".join(gen.projectID or "" for gen in generators).encode())
+    digest.update("\x1e".join(_attributes(gen) for gen in generators).encode())
+    for field in ("lat", "lon", "Capacity"):
+        digest.update(_unit_values({0: generators}, field).tobytes())
+    return digest.hexdigest()
+
+
+def _attributes(generator: Unit) -> str:
+    """Get the generator attributes that cluster plants take from a member."""
+    return f"{generator.Country}\x1f{generator.Technology}\x1f{generator.DateIn}"
+
+
+def points_near(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    center_lats: np.ndarray,
+    center_lons: np.ndarray,
+    radius_meters: float,
+) -> np.ndarray:
+    """Find the points within a distance of any of a set of centers.
+
+    Points and centers are hashed into grid cells at least
+    ``radius_meters`` wide, so only points in the cells around a center
+    are measured.
+
+    Parameters
+    ----------
+    lats, lons : numpy.ndarray
+        Point coordinates in degrees
+    center_lats, center_lons : numpy.ndarray
+        Center coordinates in degrees
+    radius_meters : float
+        Great-circle distance in metres
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask of the points within the distance
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    within = np.zeros(len(lats), dtype=bool)
+    if not len(lats) or not len(center_lats) or radius_meters <= 0:
+        return within
+
+    row_degrees = radius_meters / (np.pi / 180 * EARTH_RADIUS_M)
+    # Columns are at least the radius wide up to the most poleward point and
+    # wrap around at the antimeridian
+    max_lat = max(np.abs(lats).max(), np.abs(center_lats).max()) + row_degrees
+    column_degrees = row_degrees / np.cos(np.radians(min(max_lat, 89.9)))
+    column_count = max(1, int(360 / column_degrees))
+    column_degrees = 360 / column_count
+
+    def cells(
+        cell_lats: np.ndarray, cell_lons: np.ndarray, dr: int = 0, dc: int = 0
+    ) -> np.ndarray:
+        rows = np.floor(np.asarray(cell_lats) / row_degrees).astype(np.int64)
+        columns = np.floor((np.asarray(cell_lons) + 180) / column_degrees)
+        columns = (columns.astype(np.int64) + dc) % column_count
+        return (rows + dr) * column_count + columns
+
+    around = [
+        cells(center_lats, center_lons, dr, dc)
+        for dr in (-1, 0, 1)
+        for dc in (-1, 0, 1)
+    ]
+    candidates = np.flatnonzero(
+        pd.Index(cells(lats, lons)).isin(np.unique(np.concatenate(around)))
+    )
+    if not len(candidates):
+        return within
+
+    tree = BallTree(
+        np.radians(np.column_stack([center_lats, center_lons])), metric="haversine"
+    )
+    counts = tree.query_radius(
+        np.radians(np.column_stack([lats[candidates], lons[candidates]])),
+        r=radius_meters / EARTH_RADIUS_M,
+        count_only=True,
+    )
+    within[candidates[counts > 0]] = True
+    return within
+
+
+def relabel_changed(
+    lats: np.ndarray,
+    lons: np.ndarray,
+    labels: np.ndarray,
+    core: np.ndarray,
+    changed: np.ndarray,
+    change_lats: np.ndarray,
+    change_lons: np.ndarray,
+    stale_labels: np.ndarray,
+    locality: tuple[float, float],
+    label_points: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    core_points: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, set[int]]:
+    """Re-cluster only the clusters around changed generators.
+
+    Clusters with a member within ``reach`` of a change, and the clusters
+    of changed and removed generators, are dissolved and their members
+    clustered again together with the unchanged generators within
+    ``halo``. All other clusters keep their labels. A re-clustered group
+    continues an unchanged cluster only through a context generator that
+    is a core point in both runs, so clusters joined by a border point
+    alone stay apart, as in a full run.
+
+    Parameters
+    ----------
+    lats, lons : numpy.ndarray
+        Current generator coordinates in degrees
+    labels : numpy.ndarray
+        Previous label of each current generator; -1 for added and
+        changed generators
+    core : numpy.ndarray
+        Previous core status of each current generator; False for added
+        and changed generators
+    changed : numpy.ndarray
+        Boolean mask of added and changed generators
+    change_lats, change_lons : numpy.ndarray
+        Old and new positions of changed, added and removed generators
+    stale_labels : numpy.ndarray
+        Previous labels of changed and removed generators
+    locality : tuple[float, float]
+        ``(reach, halo)`` in metres, see :meth:`ClusteringAlgorithm.locality`
+    label_points : callable
+        Clustering of coordinates, returning a label per point
+    core_points : callable
+        Core status of coordinates, see :meth:`ClusteringAlgorithm.core_points`
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray, set[int]]
+        Label and core status of each generator, and the labels of
+        clusters whose members changed. New clusters get labels above all
+        previous ones.
+    """
+    reach, halo = locality
+    labels = np.asarray(labels, dtype=np.int64).copy()
+    near = changed | points_near(lats, lons, change_lats, change_lons, reach)
+    touched = set(labels[near].tolist()) | set(np.asarray(stale_labels).tolist())
+    touched.discard(-1)
+    subset = near | np.isin(labels, list(touched))
+    context = points_near(lats, lons, lats[subset], lons[subset], halo) & ~subset
+
+    run = np.flatnonzero(subset | context)
+    run_labels = label_points(lats[run], lons[run])
+    run_core = core_points(lats[run], lons[run])
+    previous = labels[run]
+    in_context = context[run]
+
+    # Clusters reaching into the context extend unchanged clusters, but
+    # only through points that link clusters in both runs
+    extends = (
+        in_context
+        & (previous >= 0)
+        & (run_labels >= 0)
+        & run_core
+        & np.asarray(core, dtype=bool)[run]
+    )
+    adopted = (
+        pd.Series(previous[extends])
+        .groupby(run_labels[extends])
+        .agg(lambda values: values.mode().iloc[0])
+    )
+    next_label = max(labels.max(initial=-1), max(touched, default=-1)) + 1
+    fresh = np.setdiff1d(np.unique(run_labels[run_labels >= 0]), adopted.index)
+    mapping = dict(zip(adopted.index.tolist(), adopted.tolist(), strict=True))
+    mapping.update(
+        zip(fresh.tolist(), range(next_label, next_label + len(fresh)), strict=True)
+    )
+
+    members = run[~in_context]
+    labels[members] = [mapping.get(label, -1) for label in run_labels[~in_context]]
+    # Neighbourhoods of re-clustered generators lie within the run
+    core = np.asarray(core, dtype=bool).copy()
+    core[members] = run_core[~in_context]
+    rebuilt = touched | set(mapping.values())
+    logger.debug(
+        f"Re-clustered {len(members)} of {len(labels)} generators "
+        f"({len(rebuilt)} clusters changed)"
+    )
+    return labels, core, rebuilt
+
+
+class GridClustering(ClusteringAlgorithm):
+    """Grid-hash clustering for very large generator sets.
+
+    Buckets generators into square grid cells of ``cell_meters`` and joins
+    occupied cells that touch, including diagonally. Runs in linear time
+    and memory, so it suits countries with millions of rooftop generators
+    where DBSCAN is too slow. Clusters with fewer than ``min_samples``
+    generators are outliers with cluster ID -1.
+    """
+
+    def cluster(self, generators: list[Unit]) -> dict[int, list[Unit]]:
+        """Cluster generators by connected grid cells.
+
+        Parameters
+        ----------
+        generators : list[Unit]
+            Generators to cluster
+
+        Returns
+        -------
+        dict[int, list[Unit]]
+            Clusters mapped by cluster ID (-1 for outliers)
+        """
+        valid_generators = [
+            gen for gen in generators if gen.lat is not None and gen.lon is not None
+        ]
+        if not valid_generators:
+            logger.warning("No valid coordinates for clustering")
+            return {}
+
+        labels = self.label_points(
+            np.fromiter((gen.lat for gen in valid_generators), dtype=float),
+            np.fromiter((gen.lon for gen in valid_generators), dtype=float),
+        )
+        return _group_by_label(labels, valid_generators)
+
+    def locality(self) -> tuple[float, float] | None:
+        """Get the reach of changes: the clusters a change can join or split.
+
+        Cells are anchored to fixed meridians, so a run on any subset of
+        the points has the cells of a full run. Points of touching cells
+        are less than three cell sizes apart, and a cluster too small to
+        count has fewer than ``min_samples`` points, so all points of a
+        small cluster touching a change are within ``min_samples - 1``
+        such steps.
+        """
+        cell_meters = self.config.get("cell_meters", 500)
+        min_samples = self.config.get("min_samples", 2)
+        return 3 * cell_meters * max(1, min_samples - 1), 0.0
+
+    def label_points(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Label coordinates with :func:`grid_clusters`."""
+        return grid_clusters(
+            lats,
+            lons,
+            cell_meters=self.config.get("cell_meters", 500),
+            min_samples=self.config.get("min_samples", 2),
+        )
+
+    def core_points(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Mark all points: each one joins its cell to the touching cells."""
+        return np.ones(len(lats), dtype=bool)
+
+
+def grid_clusters(
+    lats: np.ndarray, lons: np.ndarray, cell_meters: float, min_samples: int = 2
+) -> np.ndarray:
+    """Label points by connected occupied grid cells.
+
+    Rows are ``cell_meters`` of latitude; within a row, columns are
+    ``cell_meters`` wide at the row's central latitude and counted from the
+    antimeridian, so every point falls in the same cell whatever the other
+    points are. A cell touches the cells beside it and the cells of the
+    next row whose longitude intervals overlap or meet its own. Cells are
+    found with hash lookups, so time and memory grow linearly with the
+    number of points.
+
+    Parameters
+    ----------
+    lats, lons : numpy.ndarray
+        Coordinates in degrees
+    cell_meters : float
+        Cell size in metres
+    min_samples : int
+        Smallest number of points forming a cluster
+
+    Returns
+    -------
+    numpy.ndarray
+        Cluster label of each point, numbered in order of the first point
+        of each cluster; -1 for points in clusters that are too small
+    """
+    n = len(lats)
+    if not n:
+        return np.empty(0, dtype=np.int64)
+
+    meters_per_degree = np.pi / 180 * EARTH_RADIUS_M
+
+    def columns_per_degree(rows: np.ndarray) -> np.ndarray:
+        row_lats = np.radians((rows + 0.5) * cell_meters / meters_per_degree)
+        return meters_per_degree * np.maximum(np.cos(row_lats), 1e-6) / cell_meters
+
+    rows = np.floor(np.asarray(lats) * meters_per_degree / cell_meters).astype(np.int64)
+    lon_offsets = np.asarray(lons) + 180
+    columns = np.floor(lon_offsets * columns_per_degree(rows)).astype(np.int64)
+
+    first_row = rows.min()
+    stride = int(columns.max()) + 1
+    cells, cell_keys = pd.factorize((rows - first_row) * stride + columns)
+    cell_index = pd.Index(cell_keys)
+    cell_rows = cell_keys // stride + first_row
+    cell_columns = cell_keys % stride
+
+    parent = np.arange(len(cell_keys))
+    neighbours = cell_index.get_indexer(cell_keys + 1)
+    found = np.flatnonzero((neighbours >= 0) & (cell_columns + 1 < stride))
+    _union(parent, found, neighbours[found])
+
+    # Longitude interval of each cell in columns of the next row
+    ratio = columns_per_degree(cell_rows + 1) / columns_per_degree(cell_rows)
+    first = np.ceil(cell_columns * ratio).astype(np.int64) - 1
+    last = np.floor((cell_columns + 1) * ratio).astype(np.int64)
+    for step in range(int((last - first).max()) + 1):
+        next_columns = first + step
+        keys = (cell_rows + 1 - first_row) * stride + next_columns
+        neighbours = cell_index.get_indexer(keys)
+        found = np.flatnonzero(
+            (neighbours >= 0)
+            & (next_columns <= last)
+            & (next_columns >= 0)
+            & (next_columns < stride)
+        )
+        _union(parent, found, neighbours[found])
+    _compress(parent)
+
+    labels, _ = pd.factorize(parent[cells])
+    small = np.bincount(labels)[labels] < min_samples
+    labels[small] = -1
+    # Renumber the remaining clusters in order of their first point
+    labels[~small] = pd.factorize(labels[~small])[0]
+    logger.debug(f"Grouped {n} points into {labels.max() + 1} grid clusters")
+    return labels.astype(np.int64)
 
 
 class ClusteringManager:
     """Manages generator clustering operations.
 
     Coordinates clustering algorithms and creates aggregated plant
-    units from generator clusters. Supports DBSCAN and K-means
+    units from generator clusters. Supports DBSCAN, K-means and grid
     algorithms with source-specific configurations.
 
     Attributes
@@ -208,6 +1283,13 @@ class ClusteringManager:
         Clustering configuration
     unit_factory : UnitFactory
         Factory for creating cluster units
+    store : ClusteringStore or None
+        Store of K-means centers, clustering states and results, used for
+        warm starts, incremental re-clustering and the result cache
+    cache_hits : int
+        Number of fuel types whose clustered units came from the cache
+    cache_misses : int
+        Number of fuel types that had to be clustered
 
     Examples
     --------
@@ -215,6 +1297,7 @@ class ClusteringManager:
     >>> success, clusters = manager.cluster_generators(solar_gens, "Solar")
     >>> if success:
     ...     plants = manager.create_cluster_plants(clusters, "Solar")
+    >>> units = manager.cluster_by_source(generators)  # all fuel types
     """
 
     def __init__(self, config: dict[str, Any]):
@@ -227,6 +1310,9 @@ class ClusteringManager:
         """
         self.config = config
         self.unit_factory = UnitFactory(config)
+        self.store: ClusteringStore | None = None
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def create_algorithm(
         self, source_type: str
@@ -253,12 +1339,18 @@ class ClusteringManager:
                 .get(source_type, {})
                 .get("units_clustering", {}),
             )
+        elif method == "grid":
+            return True, GridClustering(
+                config=self.config.get("sources", {})
+                .get(source_type, {})
+                .get("units_clustering", {}),
+            )
         else:
             logger.warning(f"Unknown clustering method '{method}'")
             return False, None
 
     def cluster_generators(
-        self, generators: list[Unit], source_type: str
+        self, generators: list[Unit], source_type: str, country: str | None = None
     ) -> tuple[bool, dict[int, list[Unit]]]:
         """Cluster generators by source type.
 
@@ -268,6 +1360,9 @@ class ClusteringManager:
             Generators to cluster
         source_type : str
             Fuel type for source-specific configuration
+        country : str, optional
+            Country being processed. K-means with ``warm_start: true``
+            starts from the centers of the previous run of this country.
 
         Returns
         -------
@@ -285,40 +1380,314 @@ class ClusteringManager:
             logger.error(f"Algorithm is None for source type '{source_type}'")
             return False, {}
 
-        return success, algorithm.cluster(generators)
+        warm_start = (
+            isinstance(algorithm, KMeansClustering)
+            and algorithm.config.get("warm_start", False)
+            and self.store is not None
+            and country is not None
+        )
+        if not warm_start:
+            return success, algorithm.cluster(generators)
 
-    def create_cluster_plants(
-        self, clusters: dict[int, list[Unit]], source_type: str
+        algorithm.initial_centers = self.store.get_centers(
+            country, source_type, algorithm.config
+        )
+        clusters = algorithm.cluster(generators)
+        if algorithm.cluster_centers is not None:
+            self.store.put_centers(
+                country, source_type, algorithm.config, algorithm.cluster_centers
+            )
+        return success, clusters
+
+    def cluster_by_source(
+        self, generators: list[Unit], country: str | None = None
     ) -> list[Unit]:
-        """Create aggregated plants from clusters.
+        """Cluster generators of each fuel type and build the cluster plants.
+
+        Fuel types are clustered concurrently in threads, using up to
+        ``units_clustering.workers`` threads (one per fuel type by default).
+        The neighbour searches and K-means release the GIL, so fuel types
+        proceed in parallel. With ``units_clustering.cache``, fuel types
+        whose generators and configuration are unchanged since the last
+        run of the country are taken from the store without clustering.
+        With ``units_clustering.incremental``, the other fuel types are
+        updated with :meth:`update_clusters` where possible.
 
         Parameters
         ----------
-        clusters : dict[int, list[Unit]]
-            Clustered generators by cluster ID
-        source_type : str
-            Fuel type for naming
+        generators : list[Unit]
+            Generators of all fuel types
+        country : str, optional
+            Country being processed, for K-means warm starts, incremental
+            re-clustering and the result cache
 
         Returns
         -------
         list[Unit]
-            Aggregated plant units (outliers kept separate)
+            Cluster plants and unclustered generators, grouped by fuel type
+            in order of first appearance
         """
+        generators_by_source: dict[str, list[Unit]] = {}
+        for gen in generators:
+            generators_by_source.setdefault(gen.Fueltype or "unknown", []).append(gen)
+        if not generators_by_source:
+            return []
+
+        clustering_config = self.config.get("units_clustering", {})
+        incremental = (
+            self.store is not None
+            and country is not None
+            and clustering_config.get("incremental", False)
+        )
+
+        fingerprints: dict[str, str] = {}
+        cached: dict[str, list[Unit]] = {}
+        if (
+            self.store is not None
+            and country is not None
+            and clustering_config.get("cache", False)
+        ):
+            for source, source_generators in generators_by_source.items():
+                # Cluster plants also carry the processing configuration hash
+                fingerprints[source] = clustering_fingerprint(
+                    source_generators,
+                    {
+                        "units_clustering": self.config.get("sources", {})
+                        .get(source, {})
+                        .get("units_clustering", {}),
+                        "config_hash": self.unit_factory.config_hash,
+                    },
+                )
+                units = self.store.get_result(
+                    country, source, fingerprints[source], source_generators
+                )
+                if units is not None:
+                    cached[source] = units
+            self.cache_hits += len(cached)
+            self.cache_misses += len(fingerprints) - len(cached)
+        pending = {
+            source: source_generators
+            for source, source_generators in generators_by_source.items()
+            if source not in cached
+        }
+
+        def cluster_source(source: str, source_generators: list[Unit]) -> list[Unit]:
+            if len(source_generators) < 2:
+                return source_generators
+
+            if incremental:
+                units = self.update_clusters(source_generators, source, country)
+                if units is not None:
+                    return units
+
+            success, clusters = self.cluster_generators(
+                source_generators, source, country
+            )
+            if not success:
+                logger.warning(
+                    f"Clustering failed for {len(source_generators)} generators of type {source}"
+                )
+                return source_generators
+
+            logger.info(
+                f"Clustering successful for {len(source_generators)} generators of type {source}"
+            )
+            return self.create_cluster_plants(clusters, source)
+
+        clustered: dict[str, list[Unit]] = {}
+        if pending:
+            workers = clustering_config.get("workers")
+            with ThreadPoolExecutor(max_workers=workers or len(pending)) as executor:
+                clustered = dict(
+                    zip(
+                        pending,
+                        executor.map(cluster_source, pending, pending.values()),
+                        strict=True,
+                    )
+                )
+
+        for source, units in clustered.items():
+            if source in fingerprints:
+                self.store.put_result(
+                    country,
+                    source,
+                    fingerprints[source],
+                    units,
+                    generators_by_source[source],
+                )
+
+        return [
+            unit
+            for source in generators_by_source
+            for unit in cached.get(source, clustered.get(source, []))
+        ]
+
+    def update_clusters(
+        self, generators: list[Unit], source_type: str, country: str
+    ) -> list[Unit] | None:
+        """Re-cluster only the neighbourhoods of changed generators.
+
+        The clustering state of the previous run of the country is compared
+        with the generators by project ID. Clusters near added, removed or
+        changed generators are re-clustered with
+        :func:`relabel_changed` and their cluster plants rebuilt; the
+        cluster plants of all other clusters are reused as stored.
+
+        Parameters
+        ----------
+        generators : list[Unit]
+            Generators of one fuel type
+        source_type : str
+            Fuel type for source-specific configuration
+        country : str
+            Country being processed
+
+        Returns
+        -------
+        list[Unit] or None
+            Cluster plants and outliers, None if the clustering method
+            cannot be updated locally (K-means, DBSCAN without
+            ``eps_meters``) or project IDs are not unique
+        """
+        success, algorithm = self.create_algorithm(source_type)
+        locality = algorithm.locality() if success and algorithm else None
+        if locality is None or self.store is None:
+            return None
+
+        valid_generators = [
+            gen for gen in generators if gen.lat is not None and gen.lon is not None
+        ]
+        ids = pd.Index([gen.projectID for gen in valid_generators])
+        if not ids.is_unique:
+            logger.debug(f"Duplicate project IDs in {source_type}, clustering fully")
+            return None
+
+        lats = np.fromiter((gen.lat for gen in valid_generators), dtype=float)
+        lons = np.fromiter((gen.lon for gen in valid_generators), dtype=float)
+        capacities = _unit_values({0: valid_generators}, "Capacity")
+        attributes = np.array([_attributes(gen) for gen in valid_generators])
+        config_hash = _clustering_config_hash(algorithm.config)
+
+        state = self.store.get_state(country, source_type)
+        if state is None or state.config_hash != config_hash or state.core is None:
+            labels = algorithm.label_points(lats, lons)
+            core = algorithm.core_points(lats, lons)
+            rebuilt = set(labels.tolist())
+            plants: dict[int, Unit] = {}
+        else:
+            positions = pd.Index(state.ids).get_indexer(ids)
+            kept = positions >= 0
+            previous = positions[kept]
+            unchanged = (
+                (state.lats[previous] == lats[kept])
+                & (state.lons[previous] == lons[kept])
+                & (
+                    (state.capacities[previous] == capacities[kept])
+                    | (
+                        np.isnan(state.capacities[previous])
+                        & np.isnan(capacities[kept])
+                    )
+                )
+                & (state.attributes[previous] == attributes[kept])
+            )
+            changed = np.ones(len(ids), dtype=bool)
+            changed[np.flatnonzero(kept)[unchanged]] = False
+            labels = np.full(len(ids), -1, dtype=np.int64)
+            labels[~changed] = state.labels[previous[unchanged]]
+            core = np.zeros(len(ids), dtype=bool)
+            core[~changed] = state.core[previous[unchanged]]
+
+            # Changed generators are removed from their old position
+            present = np.zeros(len(state.ids), dtype=bool)
+            present[previous[unchanged]] = True
+            stale = np.flatnonzero(~present)
+            if not len(stale) and not changed.any():
+                logger.info(f"No changed {source_type} generators in {country}")
+                return self._cluster_units(
+                    valid_generators, labels, state.plants, source_type
+                )
+
+            logger.info(
+                f"Updating {source_type} clusters in {country} for "
+                f"{int(changed.sum())} added or changed and "
+                f"{len(state.ids) - int(kept.sum())} removed generators"
+            )
+            labels, core, rebuilt = relabel_changed(
+                lats,
+                lons,
+                labels,
+                core,
+                changed,
+                np.concatenate([state.lats[stale], lats[changed]]),
+                np.concatenate([state.lons[stale], lons[changed]]),
+                state.labels[stale],
+                locality,
+                algorithm.label_points,
+                algorithm.core_points,
+            )
+            plants = {
+                label: plant
+                for label, plant in state.plants.items()
+                if label not in rebuilt
+            }
+
+        rebuilt_clusters: dict[int, list[Unit]] = {}
+        for label, gen in zip(labels.tolist(), valid_generators, strict=True):
+            if label in rebuilt and label >= 0:
+                rebuilt_clusters.setdefault(label, []).append(gen)
+        plants.update(self._cluster_plant_map(rebuilt_clusters, source_type))
+
+        self.store.put_state(
+            country,
+            source_type,
+            ClusteringState(
+                config_hash=config_hash,
+                ids=ids.to_numpy(),
+                lats=lats,
+                lons=lons,
+                capacities=capacities,
+                attributes=attributes,
+                labels=labels,
+                plants=plants,
+                core=core,
+            ),
+        )
+        return self._cluster_units(valid_generators, labels, plants, source_type)
+
+    @staticmethod
+    def _cluster_units(
+        generators: list[Unit],
+        labels: np.ndarray,
+        plants: dict[int, Unit],
+        source_type: str,
+    ) -> list[Unit]:
+        """Get cluster plants in label order followed by the outliers."""
+        outliers = [
+            gen
+            for label, gen in zip(labels.tolist(), generators, strict=True)
+            if label < 0
+        ]
+        logger.info(
+            f"Clustered {len(generators)} {source_type} generators into "
+            f"{len(plants)} plants and {len(outliers)} outliers"
+        )
+        return [plants[label] for label in sorted(plants)] + outliers
+
+    def _cluster_plant_map(
+        self, clusters: dict[int, list[Unit]], source_type: str
+    ) -> dict[int, Unit]:
+        """Create the cluster plant of each cluster, keyed by cluster ID."""
         _, algorithm = self.create_algorithm(source_type)
         if algorithm is None:
             logger.error(f"No clustering algorithm available for {source_type}")
-            return []
+            return {}
 
         centroids = algorithm.get_cluster_centroids(clusters)
         capacities = algorithm.get_cluster_capacity(clusters)
 
-        cluster_plants = []
+        cluster_plants = {}
         for cluster_id, plants in clusters.items():
-            if cluster_id < 0:
-                cluster_plants.extend(plants)
-                continue
-
-            if not plants:
+            if cluster_id < 0 or not plants:
                 continue
 
             centroid = centroids.get(cluster_id)
@@ -333,7 +1702,7 @@ class ClusteringManager:
                     )
                     continue
 
-                cluster_plant = self.unit_factory.create_cluster_plant(
+                cluster_plants[cluster_id] = self.unit_factory.create_cluster_plant(
                     cluster_id=str(cluster_id),
                     country=template.Country,
                     lat=centroid[0],
@@ -346,6 +1715,30 @@ class ClusteringManager:
                     start_date=template.DateIn,
                 )
 
-                cluster_plants.append(cluster_plant)
-
         return cluster_plants
+
+    def create_cluster_plants(
+        self, clusters: dict[int, list[Unit]], source_type: str
+    ) -> list[Unit]:
+        """Create aggregated plants from clusters.
+
+        Parameters
+        ----------
+        clusters : dict[int, list[Unit]]
+            Clustered generators by cluster ID
+        source_type : str
+            Fuel type for naming
+
+        Returns
+        -------
+        list[Unit]
+            Aggregated plant units (outliers kept separate)
+        """
+        cluster_plants = self._cluster_plant_map(clusters, source_type)
+        units = []
+        for cluster_id, plants in clusters.items():
+            if cluster_id < 0:
+                units.extend(plants)
+            elif cluster_id in cluster_plants:
+                units.append(cluster_plants[cluster_id])
+        return units
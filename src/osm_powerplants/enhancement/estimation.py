@@ -12,9 +12,12 @@ including area-based calculations and default values.
 import logging
 from typing import Any
 
+from osm_powerplants.enhancement.kernels import polygon_areas, ring_offsets
 from osm_powerplants.models import RejectionReason
 from osm_powerplants.quality.rejection import RejectionTracker
+from osm_powerplants.retrieval.cache import ElementCache
 from osm_powerplants.retrieval.client import OverpassAPIClient
+from osm_powerplants.retrieval.index import ElementIndex
 from osm_powerplants.utils import calculate_area, get_source_config
 
 logger = logging.getLogger(__name__)
@@ -35,6 +38,8 @@ class CapacityEstimator:
         Tracks estimation failures
     config : dict
         Estimation configuration
+    way_areas : dict[int, float]
+        Areas of ways computed in advance by :meth:`compute_way_areas`
 
     Examples
     --------
@@ -63,6 +68,58 @@ class CapacityEstimator:
         self.client = client
         self.rejection_tracker = rejection_tracker
         self.config = config
+        self.way_areas: dict[int, float] = {}
+
+    def compute_way_areas(
+        self,
+        ways: list[dict[str, Any]],
+        elements: ElementCache | ElementIndex | None = None,
+    ) -> dict[int, float]:
+        """Compute the areas of many ways in one vectorized pass.
+
+        The areas replace :attr:`way_areas` and are used by
+        :meth:`estimate_capacity_area_based` instead of computing each
+        way's area on demand.
+
+        Parameters
+        ----------
+        ways : list[dict]
+            OSM way elements with nodes lists
+        elements : ElementCache or ElementIndex, optional
+            Source of the way nodes. Defaults to the client cache.
+
+        Returns
+        -------
+        dict[int, float]
+            Area in square meters by way ID, for ways with at least three
+            located nodes
+        """
+        elements = elements or self.client.cache
+        way_ids: list[int] = []
+        lats: list[float] = []
+        lons: list[float] = []
+        counts: list[int] = []
+        for way in ways:
+            if way.get("type") != "way" or "nodes" not in way:
+                continue
+            count = 0
+            for node_id in way["nodes"]:
+                node = elements.get_node(node_id)
+                if node and "lat" in node and "lon" in node:
+                    lats.append(node["lat"])
+                    lons.append(node["lon"])
+                    count += 1
+            way_ids.append(way["id"])
+            counts.append(count)
+
+        areas = polygon_areas(lats, lons, ring_offsets(counts)).tolist()
+        self.way_areas = {
+            way_id: area
+            for way_id, area, count in zip(way_ids, areas, counts, strict=True)
+            if count >= 3
+        }
+        logger.debug(f"Computed areas of {len(self.way_areas)} ways")
+        return self.way_areas
 
     def estimate_capacity(
         self, element: dict[str, Any], source_type: str, unit_type: str
@@ -148,7 +205,9 @@ class CapacityEstimator:
 
         area_m2 = None
 
-        if element["type"] == "way" and "nodes" in element:
+        if element["type"] == "way" and element["id"] in self.way_areas:
+            area_m2 = self.way_areas[element["id"]]
+        elif element["type"] == "way" and "nodes" in element:
             coords = []
             for node_id in element["nodes"]:
                 node = self.client.cache.get_node(node_id)
@@ -7,22 +7,293 @@ Geometry handling for OSM power plant elements.
 
 This module provides geometric operations for OSM elements including
 coordinate extraction, polygon creation, and spatial relationship checks.
+Geometries are memoized per element, so parsers and the workflow share the
+work of building them during a run.
 """
 
 import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+import shapely
 from shapely.errors import ShapelyError
-from shapely.geometry import MultiPoint, Point, Polygon
-from shapely.ops import unary_union
-
+from shapely.geometry import MultiPoint, MultiPolygon, Point, Polygon
+from shapely.geometry.base import BaseGeometry
+from shapely.strtree import STRtree
+
+from osm_powerplants.enhancement.rings import (
+    assemble_area,
+    rings_to_polygons,
+    stitch_rings,
+)
 from osm_powerplants.models import PlantGeometry, create_plant_geometry
 from osm_powerplants.quality.rejection import RejectionTracker
+from osm_powerplants.retrieval.cache import ElementCache
 from osm_powerplants.retrieval.client import OverpassAPIClient
+from osm_powerplants.retrieval.index import ElementIndex
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ElementGeometry:
+    """Memoized geometry of an OSM element.
+
+    Attributes
+    ----------
+    geometry : PlantGeometry, optional
+        Geometry of the element, None if it could not be built
+    centroid : tuple[float, float] or tuple[None, None]
+        (latitude, longitude) of the geometry centroid
+    bounds : tuple[float, float, float, float], optional
+        (min_lon, min_lat, max_lon, max_lat) of the geometry
+    coordinates : tuple[float, float] or tuple[None, None], optional
+        Result of :meth:`GeometryHandler.process_element_coordinates`,
+        None until it is first requested
+    """
+
+    geometry: PlantGeometry | None
+    centroid: tuple[float, float] | tuple[None, None] = (None, None)
+    bounds: tuple[float, float, float, float] | None = None
+    coordinates: tuple[float, float] | tuple[None, None] | None = None
+
+
+_POLYGON_TYPE_IDS = (shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON)
+
+# PlantGeometry.contains_point divides the buffer by 111320 m scaled by a
+# latitude factor between 0.5 and 1, so this bounds the buffer in degrees
+_MIN_METERS_PER_DEGREE = 111320.0 * 0.5
+
+
+class PlantGeometryIndex:
+    """Spatial index over plant geometries for containment checks.
+
+    Candidates are found with an STRtree and then tested with the same
+    :class:`PlantGeometry` methods as a linear scan, in the original order,
+    so results are identical to scanning every geometry. Polygons are
+    prepared once for faster repeated point-in-polygon tests.
+
+    Attributes
+    ----------
+    geometries : list[PlantGeometry]
+        Indexed plant geometries in their original order
+    keys : list[str]
+        Identifier returned for each geometry
+
+    Examples
+    --------
+    >>> index = PlantGeometryIndex(plant_parser.plant_polygons)
+    >>> handler.is_element_within_plant_geometries(generator, index)
+    (True, 'way/123456')
+    """
+
+    def __init__(
+        self,
+        plant_geometries: Iterable[PlantGeometry],
+        keys: Iterable[str] | None = None,
+    ):
+        """Build the index.
+
+        Parameters
+        ----------
+        plant_geometries : iterable of PlantGeometry
+            Plant boundaries to index
+        keys : iterable of str, optional
+            Identifiers of the geometries. Defaults to "type/id".
+        """
+        self.geometries = list(plant_geometries)
+        if keys is None:
+            self.keys = [f"{g.type}/{g.id}" for g in self.geometries]
+        else:
+            self.keys = list(keys)
+
+        shapes = np.array([g.geometry for g in self.geometries], dtype=object)
+        polygons = [
+            shape for shape in shapes if isinstance(shape, Polygon | MultiPolygon)
+        ]
+        if polygons:
+            shapely.prepare(polygons)
+        self._tree = STRtree(shapes) if len(shapes) else None
+
+    @classmethod
+    def from_dict(
+        cls, plant_geometries: dict[str, PlantGeometry]
+    ) -> "PlantGeometryIndex":
+        """Index a mapping of identifiers to plant geometries."""
+        return cls(plant_geometries.values(), plant_geometries.keys())
+
+    def __len__(self) -> int:
+        return len(self.geometries)
+
+    def candidates(
+        self,
+        geometry: BaseGeometry | None,
+        lat: float,
+        lon: float,
+        buffer_meters: float | None = None,
+    ) -> list[int]:
+        """Get positions of geometries that may contain or touch a location.
+
+        Parameters
+        ----------
+        geometry : shapely geometry, optional
+            Element geometry tested for intersection
+        lat, lon : float
+            Point tested for containment
+        buffer_meters : float, optional
+            Buffer used for point geometries, 50 m by default
+
+        Returns
+        -------
+        list[int]
+            Sorted positions in :attr:`geometries`
+        """
+        if self._tree is None:
+            return []
+        distance = (50.0 if buffer_meters is None else buffer_meters) / (
+            _MIN_METERS_PER_DEGREE
+        )
+        distance = max(distance, 0) * 1.001
+        positions = self._tree.query(
+            Point(lon, lat), predicate="dwithin", distance=distance
+        )
+        if geometry is not None and not isinstance(geometry, Point):
+            positions = np.union1d(
+                positions,
+                self._tree.query(geometry, predicate="dwithin", distance=distance),
+            )
+        return sorted(positions.tolist())
+
+    def candidates_many(
+        self, lats: list[float], lons: list[float], buffer_meters: float | None = None
+    ) -> list[list[int]]:
+        """Get candidate positions for many points with one bulk query.
+
+        Parameters
+        ----------
+        lats, lons : list[float]
+            Coordinates of the points
+        buffer_meters : float, optional
+            Buffer used for point geometries, 50 m by default
+
+        Returns
+        -------
+        list[list[int]]
+            Sorted positions in :attr:`geometries` for each point
+        """
+        result: list[list[int]] = [[] for _ in lats]
+        if self._tree is None or not result:
+            return result
+        distance = (50.0 if buffer_meters is None else buffer_meters) / (
+            _MIN_METERS_PER_DEGREE
+        )
+        points = shapely.points(np.asarray(lons), np.asarray(lats))
+        point_positions, positions = self._tree.query(
+            points, predicate="dwithin", distance=max(distance, 0) * 1.001
+        )
+        for point_position, position in zip(
+            point_positions.tolist(), positions.tolist(), strict=True
+        ):
+            result[point_position].append(position)
+        for positions_of_point in result:
+            positions_of_point.sort()
+        return result
+
+    def containing_many(
+        self, lats: list[float], lons: list[float], buffer_meters: float | None = None
+    ) -> np.ndarray:
+        """Find the first geometry containing each of many points.
+
+        Candidates from one bulk query are tested with the vectorized
+        shapely predicates: ``contains_xy`` for polygons and ``dwithin``
+        with the latitude-corrected buffer of
+        :meth:`PlantGeometry.contains_point` for points.
+
+        Parameters
+        ----------
+        lats, lons : list[float]
+            Coordinates of the points
+        buffer_meters : float, optional
+            Buffer used for point geometries, 50 m by default
+
+        Returns
+        -------
+        numpy.ndarray
+            Position in :attr:`geometries` of the first containing geometry
+            for each point, -1 where no geometry contains the point
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        result = np.full(len(lats), -1, dtype=np.int64)
+        if self._tree is None or not len(lats):
+            return result
+
+        buffer_meters = 50.0 if buffer_meters is None else buffer_meters
+        points = shapely.points(lons, lats)
+        point_positions, positions = self._tree.query(
+            points,
+            predicate="dwithin",
+            distance=max(buffer_meters / _MIN_METERS_PER_DEGREE, 0) * 1.001,
+        )
+        shapes = self._tree.geometries[positions]
+        pair_lats = lats[point_positions]
+
+        contained = np.zeros(len(positions), dtype=bool)
+        type_ids = shapely.get_type_id(shapes)
+        is_polygon = np.isin(type_ids, _POLYGON_TYPE_IDS)
+        contained[is_polygon] = shapely.contains_xy(
+            shapes[is_polygon], lons[point_positions[is_polygon]], pair_lats[is_polygon]
+        )
+        is_point = type_ids == shapely.GeometryType.POINT
+        buffer_degrees = np.where(
+            pair_lats[is_point] != 0,
+            buffer_meters
+            / (111320.0 * ((1 + np.abs(np.cos(np.radians(pair_lats[is_point])))) / 2)),
+            buffer_meters / 111320.0,
+        )
+        contained[is_point] = shapely.dwithin(
+            shapes[is_point], points[point_positions[is_point]], buffer_degrees
+        )
+
+        first = np.full(len(lats), len(self.geometries), dtype=np.int64)
+        np.minimum.at(first, point_positions[contained], positions[contained])
+        found = first < len(self.geometries)
+        result[found] = first[found]
+        return result
+
+    def first_containing(
+        self,
+        lat: float,
+        lon: float,
+        buffer_meters: float | None = None,
+        positions: list[int] | None = None,
+    ) -> str | None:
+        """Get the key of the first geometry containing a point.
+
+        Parameters
+        ----------
+        lat, lon : float
+            Point coordinates
+        buffer_meters : float, optional
+            Buffer used for point geometries
+        positions : list[int], optional
+            Candidates from :meth:`candidates_many`, queried if not given
+
+        Returns
+        -------
+        str or None
+            Key of the first containing geometry in index order
+        """
+        if positions is None:
+            positions = self.candidates(None, lat, lon, buffer_meters)
+        for position in positions:
+            if self.geometries[position].contains_point(lat, lon, buffer_meters):
+                return self.keys[position]
+        return None
+
+
 class GeometryHandler:
     """Handles geometric operations for OSM elements.
 
@@ -36,6 +307,15 @@ class GeometryHandler:
         API client for retrieving element dependencies
     rejection_tracker : RejectionTracker
         Tracker for invalid geometries
+    element_index : ElementIndex, optional
+        Index of the country being processed, used instead of the cache for
+        member lookups when set
+
+    Notes
+    -----
+    Geometries of elements and relation member ways are memoized by element
+    ID. Call :meth:`clear_memo` when the underlying OSM data may have
+    changed, e.g. at the start of each processing run.
 
     Examples
     --------
@@ -56,6 +336,61 @@ class GeometryHandler:
         """
         self.client = client
         self.rejection_tracker = rejection_tracker
+        self.element_index: ElementIndex | None = None
+        self._memo: dict[str, ElementGeometry] = {}
+
+    @property
+    def elements(self) -> ElementCache | ElementIndex:
+        """Source of member nodes and ways: the element index or the cache."""
+        if self.element_index is not None:
+            return self.element_index
+        return self.client.cache
+
+    def clear_memo(self) -> None:
+        """Forget all memoized element geometries."""
+        self._memo.clear()
+
+    def element_geometry(self, element: dict[str, Any]) -> ElementGeometry:
+        """Get the memoized geometry of an element, building it once.
+
+        Parameters
+        ----------
+        element : dict
+            OSM element (node, way, or relation)
+
+        Returns
+        -------
+        ElementGeometry
+            Geometry with centroid and bounds
+        """
+        key = f"{element.get('type')}/{element.get('id')}"
+        record = self._memo.get(key)
+        if record is None:
+            record = self._build_element_geometry(element)
+            if "id" in element:
+                self._memo[key] = record
+        return record
+
+    def _build_element_geometry(self, element: dict[str, Any]) -> ElementGeometry:
+        element_type = element.get("type")
+
+        if element_type == "node":
+            plant_geometry = self.create_node_geometry(element)
+        elif element_type == "way":
+            plant_geometry = self.create_way_geometry(element)
+        elif element_type == "relation":
+            plant_geometry = self.create_relation_geometry(element)
+        else:
+            logger.warning(f"Unknown element type: {element_type}")
+            plant_geometry = None
+
+        if plant_geometry is None:
+            return ElementGeometry(None)
+        return ElementGeometry(
+            plant_geometry,
+            centroid=plant_geometry.get_centroid(),
+            bounds=plant_geometry.geometry.bounds,
+        )
 
     def create_node_geometry(self, node: dict[str, Any]) -> PlantGeometry | None:
         """Create point geometry from OSM node."""
@@ -72,6 +407,86 @@ class GeometryHandler:
             )
             return None
 
+    def build_way_geometries(self, ways: list[dict[str, Any]]) -> np.ndarray:
+        """Build the polygons of many ways at once.
+
+        Node coordinates of all ways are packed into one array and turned
+        into rings and polygons with the vectorized shapely constructors;
+        validity, centroids and bounds are computed in bulk as well. The
+        resulting geometries are memoized exactly as
+        :meth:`create_way_geometry` would build them. Ways with fewer than
+        three located nodes take the scalar path.
+
+        Parameters
+        ----------
+        ways : list[dict]
+            OSM way elements with nodes lists
+
+        Returns
+        -------
+        numpy.ndarray
+            Shapely geometry of each way, None where it has no geometry
+        """
+        result = np.full(len(ways), None, dtype=object)
+        coords: list[tuple[float, float]] = []
+        counts: list[int] = []
+        batched: list[int] = []
+
+        for position, way in enumerate(ways):
+            key = f"way/{way.get('id')}"
+            record = self._memo.get(key)
+            if record is None and way.get("type") == "way" and "nodes" in way:
+                way_coords = self._way_coordinates(way)
+                if len(way_coords) >= 3:
+                    coords.extend(way_coords)
+                    counts.append(len(way_coords))
+                    batched.append(position)
+                    continue
+            record = self.element_geometry(way)
+            if record.geometry is not None:
+                result[position] = record.geometry.geometry
+
+        if not batched:
+            return result
+
+        try:
+            rings = shapely.linearrings(
+                np.asarray(coords, dtype=float),
+                indices=np.repeat(np.arange(len(counts)), counts),
+            )
+            polygons = shapely.polygons(rings)
+        except (ShapelyError, ValueError) as e:
+            logger.debug(f"Falling back to scalar way geometries: {str(e)}")
+            for position in batched:
+                record = self.element_geometry(ways[position])
+                if record.geometry is not None:
+                    result[position] = record.geometry.geometry
+            return result
+
+        valid = shapely.is_valid(polygons)
+        centroids = shapely.centroid(polygons)
+        centroid_lats = shapely.get_y(centroids).tolist()
+        centroid_lons = shapely.get_x(centroids).tolist()
+        bounds = shapely.bounds(polygons).tolist()
+
+        for k, position in enumerate(batched):
+            way = ways[position]
+            if not valid[k]:
+                logger.debug(f"Invalid polygon for way {way['id']}")
+                record = ElementGeometry(None)
+            else:
+                record = ElementGeometry(
+                    create_plant_geometry(way, polygons[k]),
+                    centroid=(centroid_lats[k], centroid_lons[k]),
+                    bounds=tuple(bounds[k]),
+                )
+                result[position] = polygons[k]
+            if "id" in way:
+                self._memo[f"way/{way['id']}"] = record
+
+        logger.debug(f"Built {len(batched)} way polygons in batch")
+        return result
+
     def create_way_geometry(self, way: dict[str, Any]) -> PlantGeometry | None:
         """Create polygon or point geometry from OSM way.
 
@@ -89,11 +504,7 @@ class GeometryHandler:
             logger.debug(f"Way {way['id']} does not have nodes")
             return None
 
-        coords = []
-        for node_id in way["nodes"]:
-            node = self.client.cache.get_node(node_id)
-            if node and "lat" in node and "lon" in node:
-                coords.append((node["lon"], node["lat"]))
+        coords = self._way_coordinates(way)
 
         if len(coords) == 1:
             return create_plant_geometry(way, Point(coords[0]))
@@ -114,13 +525,25 @@ class GeometryHandler:
                 logger.debug(f"Error creating polygon for way/{way['id']}: {str(e)}")
                 return None
 
+    def _way_coordinates(self, way: dict[str, Any]) -> list[tuple[float, float]]:
+        """Get the (lon, lat) coordinates of the located nodes of a way."""
+        coords = []
+        for node_id in way.get("nodes", []):
+            node = self.elements.get_node(node_id)
+            if node and "lat" in node and "lon" in node:
+                coords.append((node["lon"], node["lat"]))
+        return coords
+
     def create_relation_geometry(
         self, relation: dict[str, Any]
     ) -> PlantGeometry | None:
         """Create geometry from OSM relation members.
 
-        Combines member ways into polygons or creates convex hull
-        from member nodes. Handles multipolygon relations.
+        Assembles member ways into an area or creates a convex hull from
+        member nodes. Open member ways are stitched into rings, and ways
+        with the ``inner`` role are cut out of the ``outer`` area. The
+        resulting geometry is prepared for fast repeated containment tests
+        and memoized with the relation.
 
         Parameters
         ----------
@@ -143,20 +566,13 @@ class GeometryHandler:
             logger.debug(f"Relation {relation['id']} does not have way or node members")
             return None
 
-        polygons = []
-        for way_member in way_members:
-            way_id = way_member["ref"]
-            way = self.client.cache.get_way(way_id)
-            if way:
-                way_geom = self.create_way_geometry(way)
-                if way_geom and isinstance(way_geom.geometry, Polygon):
-                    polygons.append(way_geom.geometry)
+        outer, inner = self._relation_faces(way_members)
 
-        if not polygons and node_members:
+        if not outer and not inner and node_members:
             points = []
             for node_member in node_members:
                 node_id = node_member["ref"]
-                node = self.client.cache.get_node(node_id)
+                node = self.elements.get_node(node_id)
                 if node and "lat" in node and "lon" in node:
                     points.append(Point(node["lon"], node["lat"]))
 
@@ -168,17 +584,17 @@ class GeometryHandler:
                 hull = MultiPoint(points).convex_hull
                 return create_plant_geometry(relation, hull)
 
-        if polygons:
+        if outer or inner:
             try:
-                if len(polygons) == 1:
-                    union = polygons[0]
-                else:
-                    union = unary_union(polygons)
-
-                if not union.is_valid:
+                # Relations with only inner members keep them as their area
+                union = (
+                    assemble_area(outer, inner) if outer else assemble_area(inner, [])
+                )
+                if union is None or not union.is_valid:
                     logger.debug(f"Invalid union polygon for relation {relation['id']}")
                     return None
 
+                shapely.prepare(union)
                 return create_plant_geometry(relation, union)
             except ShapelyError as e:
                 logger.debug(
@@ -188,6 +604,58 @@ class GeometryHandler:
 
         return None
 
+    def _relation_faces(
+        self, way_members: list[dict[str, Any]]
+    ) -> tuple[list[Polygon], list[Polygon]]:
+        """Get the outer and inner polygons formed by relation member ways.
+
+        Closed ways use their memoized polygon, repaired if invalid. Open
+        ways are stitched into rings; an outer way that cannot be stitched
+        is used as its own closed polygon, as for a standalone way.
+        """
+        outer: list[Polygon] = []
+        inner: list[Polygon] = []
+        open_ways: dict[bool, list[tuple[dict[str, Any], list]]] = {
+            False: [],
+            True: [],
+        }
+
+        for way_member in way_members:
+            way = self.elements.get_way(way_member["ref"])
+            if not way:
+                continue
+            is_inner = way_member.get("role") == "inner"
+            faces = inner if is_inner else outer
+            nodes = way.get("nodes", [])
+
+            if len(nodes) >= 4 and nodes[0] == nodes[-1]:
+                way_geom = self.element_geometry(way).geometry
+                if way_geom and isinstance(way_geom.geometry, Polygon):
+                    faces.append(way_geom.geometry)
+                    continue
+                coords = self._way_coordinates(way)
+                if len(coords) >= 4 and coords[0] == coords[-1]:
+                    faces.extend(rings_to_polygons([coords]))
+            else:
+                coords = self._way_coordinates(way)
+                if len(coords) >= 2:
+                    open_ways[is_inner].append((way, coords))
+
+        for is_inner, ways in open_ways.items():
+            if not ways:
+                continue
+            faces = inner if is_inner else outer
+            rings, leftover = stitch_rings([coords for _, coords in ways])
+            faces.extend(rings_to_polygons(rings))
+            if is_inner:
+                continue
+            for position in leftover:
+                way_geom = self.element_geometry(ways[position][0]).geometry
+                if way_geom and isinstance(way_geom.geometry, Polygon):
+                    outer.append(way_geom.geometry)
+
+        return outer, inner
+
     def get_element_geometry(self, element: dict[str, Any]) -> PlantGeometry | None:
         """Get geometry for any OSM element type.
 
@@ -201,17 +669,7 @@ class GeometryHandler:
         PlantGeometry or None
             Appropriate geometry for element type
         """
-        element_type = element.get("type")
-
-        if element_type == "node":
-            return self.create_node_geometry(element)
-        elif element_type == "way":
-            return self.create_way_geometry(element)
-        elif element_type == "relation":
-            return self.create_relation_geometry(element)
-        else:
-            logger.warning(f"Unknown element type: {element_type}")
-            return None
+        return self.element_geometry(element).geometry
 
     def process_element_coordinates(
         self, element: dict[str, Any]
@@ -228,16 +686,23 @@ class GeometryHandler:
         tuple[float, float] or tuple[None, None]
             (latitude, longitude) or (None, None) if not found
         """
-        plant_geometry = self.get_element_geometry(element)
-        if plant_geometry:
-            return plant_geometry.get_centroid()
+        record = self.element_geometry(element)
+        if record.coordinates is None:
+            record.coordinates = self._element_coordinates(element, record)
+        return record.coordinates
+
+    def _element_coordinates(
+        self, element: dict[str, Any], record: ElementGeometry
+    ) -> tuple[float | None, float | None]:
+        if record.geometry:
+            return record.centroid
 
         if element.get("type") == "node" and "lat" in element and "lon" in element:
             return (element["lat"], element["lon"])
 
         if element.get("type") == "way" and "nodes" in element:
             for node_id in element["nodes"]:
-                node = self.client.cache.get_node(node_id)
+                node = self.elements.get_node(node_id)
                 if node and "lat" in node and "lon" in node:
                     logger.debug(
                         f"Using first available node coordinate for way {element['id']}"
@@ -272,9 +737,9 @@ class GeometryHandler:
 
             member_elem = None
             if member_type == "node":
-                member_elem = self.client.cache.get_node(member_id)
+                member_elem = self.elements.get_node(member_id)
             elif member_type == "way":
-                member_elem = self.client.cache.get_way(member_id)
+                member_elem = self.elements.get_way(member_id)
             elif member_type == "relation":
                 continue
 
@@ -294,9 +759,9 @@ class GeometryHandler:
             if member_type == "node" and "lat" in member_elem and "lon" in member_elem:
                 lat, lon = member_elem["lat"], member_elem["lon"]
             elif member_type == "way":
-                way_geom = self.create_way_geometry(member_elem)
-                if way_geom:
-                    lat, lon = way_geom.get_centroid()
+                way_record = self.element_geometry(member_elem)
+                if way_record.geometry:
+                    lat, lon = way_record.centroid
 
             if lat is not None and lon is not None:
                 if has_capacity:
@@ -321,7 +786,7 @@ class GeometryHandler:
     def is_element_within_plant_geometries(
         self,
         element: dict[str, Any],
-        plant_geometries: list[PlantGeometry],
+        plant_geometries: list[PlantGeometry] | PlantGeometryIndex,
         buffer_meters: float | None = None,
     ) -> tuple[bool, str | None]:
         """Check if element is within any plant boundary.
@@ -330,8 +795,9 @@ class GeometryHandler:
         ----------
         element : dict
             OSM element to check
-        plant_geometries : list[PlantGeometry]
-            Plant boundaries to test against
+        plant_geometries : list[PlantGeometry] or PlantGeometryIndex
+            Plant boundaries to test against. An index only tests the
+            plants near the element, with the same result.
         buffer_meters : float, optional
             Buffer distance for containment check
 
@@ -340,14 +806,23 @@ class GeometryHandler:
         tuple[bool, str or None]
             (is_within, plant_id) where plant_id is like "way/123456"
         """
-        element_geometry = self.get_element_geometry(element)
+        record = self.element_geometry(element)
+        element_geometry = record.geometry
         if not element_geometry:
             return False, None
 
-        lat, lon = element_geometry.get_centroid()
+        lat, lon = record.centroid
         if lat is None or lon is None:
             return False, None
 
+        if isinstance(plant_geometries, PlantGeometryIndex):
+            plant_geometries = [
+                plant_geometries.geometries[position]
+                for position in plant_geometries.candidates(
+                    element_geometry.geometry, lat, lon, buffer_meters
+                )
+            ]
+
         for plant_geom in plant_geometries:
             try:
                 if plant_geom.contains_point(lat, lon, buffer_meters):
@@ -367,10 +842,12 @@ class GeometryHandler:
         self,
         lat: float,
         lon: float,
-        plant_geometries: dict[str, PlantGeometry],
+        plant_geometries: dict[str, PlantGeometry] | PlantGeometryIndex,
         buffer_meters: float | None = None,
     ) -> str | None:
         """Check if point is within any plant geometry."""
+        if isinstance(plant_geometries, PlantGeometryIndex):
+            return plant_geometries.first_containing(lat, lon, buffer_meters)
         for geom_id, plant_geom in plant_geometries.items():
             if plant_geom.contains_point(lat, lon, buffer_meters):
                 return geom_id
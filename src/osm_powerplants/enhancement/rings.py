@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Ring assembly for multipolygon relations.
+
+OSM multipolygons are drawn as member ways that may each be a closed ring
+or only a segment of one. This module stitches segments into closed rings
+by their shared end points and combines the rings into an area, removing
+``inner`` rings from ``outer`` ones. It is used for plant relations and
+for country boundary relations.
+
+Examples
+--------
+>>> rings, leftover = stitch_rings([[(0, 0), (1, 0), (1, 1)], [(1, 1), (0, 1), (0, 0)]])
+>>> len(rings), leftover
+(1, [])
+>>> area = assemble_area(rings_to_polygons(rings), [])
+"""
+
+import logging
+from collections.abc import Sequence
+
+import shapely
+from shapely.geometry import Polygon
+from shapely.geometry.base import BaseGeometry
+from shapely.ops import unary_union
+
+logger = logging.getLogger(__name__)
+
+Coordinate = tuple[float, float]
+
+
+def stitch_rings(
+    segments: Sequence[Sequence[Coordinate]],
+) -> tuple[list[list[Coordinate]], list[int]]:
+    """Stitch line segments into closed rings.
+
+    Closed segments are rings on their own. Open segments are joined end
+    to end, in either direction, until the chain closes.
+
+    Parameters
+    ----------
+    segments : sequence of sequence of (lon, lat)
+        Coordinates of each member way
+
+    Returns
+    -------
+    tuple[list[list[tuple[float, float]]], list[int]]
+        Closed rings, and the positions of segments that could not be
+        closed into a ring
+    """
+    rings: list[list[Coordinate]] = []
+    leftover: list[int] = []
+    open_segments: list[int] = []
+    ends: dict[Coordinate, list[int]] = {}
+
+    for position, segment in enumerate(segments):
+        segment = [tuple(coordinate) for coordinate in segment]
+        if len(segment) < 2:
+            leftover.append(position)
+        elif segment[0] == segment[-1]:
+            if len(segment) >= 4:
+                rings.append(segment)
+            else:
+                leftover.append(position)
+        else:
+            open_segments.append(position)
+            ends.setdefault(segment[0], []).append(position)
+            ends.setdefault(segment[-1], []).append(position)
+
+    used: set[int] = set()
+
+    def extend(chain: list[Coordinate], members: list[int]) -> None:
+        while chain[0] != chain[-1]:
+            following = next(
+                (p for p in ends.get(chain[-1], []) if p not in used), None
+            )
+            if following is None:
+                return
+            used.add(following)
+            members.append(following)
+            segment = [tuple(coordinate) for coordinate in segments[following]]
+            if segment[0] != chain[-1]:
+                segment.reverse()
+            chain.extend(segment[1:])
+
+    for position in open_segments:
+        if position in used:
+            continue
+        used.add(position)
+        chain = [tuple(coordinate) for coordinate in segments[position]]
+        members = [position]
+        extend(chain, members)
+        if chain[0] != chain[-1]:
+            # Continue from the other end of the chain
+            chain.reverse()
+            extend(chain, members)
+
+        if chain[0] == chain[-1] and len(chain) >= 4:
+            rings.append(chain)
+        else:
+            leftover.extend(members)
+
+    return rings, sorted(leftover)
+
+
+def rings_to_polygons(rings: Sequence[Sequence[Coordinate]]) -> list[Polygon]:
+    """Turn closed rings into valid polygons.
+
+    Self-intersecting rings are repaired with ``make_valid``; only the
+    polygonal parts of the repaired geometry are kept.
+    """
+    polygons: list[Polygon] = []
+    for ring in rings:
+        polygon = Polygon(ring)
+        if polygon.is_valid:
+            polygons.append(polygon)
+            continue
+        repaired = shapely.make_valid(polygon)
+        polygons.extend(
+            part
+            for part in shapely.get_parts(repaired)
+            if isinstance(part, Polygon) and not part.is_empty
+        )
+    return polygons
+
+
+def assemble_area(
+    outer: Sequence[BaseGeometry], inner: Sequence[BaseGeometry]
+) -> BaseGeometry | None:
+    """Combine outer and inner polygons into one area.
+
+    Inner polygons are removed from the union of the outer polygons. Outer
+    polygons lying inside an inner one (islands in lakes) are added back.
+
+    Parameters
+    ----------
+    outer : sequence of shapely geometry
+        Polygons of the outer rings
+    inner : sequence of shapely geometry
+        Polygons of the inner rings
+
+    Returns
+    -------
+    shapely geometry or None
+        Polygon or MultiPolygon, None if the area is empty
+    """
+    if not outer:
+        return None
+    geometry = outer[0] if len(outer) == 1 else unary_union(outer)
+    if inner:
+        inner_area = unary_union(inner)
+        islands = [face for face in outer if inner_area.contains(face)]
+        geometry = geometry.difference(inner_area)
+        if islands:
+            geometry = unary_union([geometry, *islands])
+    return None if geometry.is_empty else geometry
@@ -12,18 +12,22 @@ and data processing.
 Main functions:
     process_units: Simplified entry point for most use cases
     process_countries: Lower-level function with more options
+    prefetch_countries: Fill the download cache without processing
     validate_countries: Validate country names with fuzzy matching
 """
 
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
 from difflib import get_close_matches
+from itertools import repeat
 
 import pandas as pd
 
 from .models import Unit, Units
 from .quality.rejection import RejectionTracker
 from .retrieval.client import OverpassAPIClient
+from .retrieval.prefetch import download_ahead, prefetch_country_data
 from .utils import get_country_code
 from .workflow import Workflow
 
@@ -78,6 +82,9 @@ def get_client_params(osm_config, api_url, cache_dir):
         "retry_delay": osm_config.get("overpass_api", {}).get("retry_delay", 5),
         "cache_size_gb": osm_config.get("overpass_api", {}).get("cache_size_gb", 12),
         "show_progress": osm_config.get("overpass_api", {}).get("show_progress", True),
+        "compact_elements": osm_config.get("compact_elements", {}).get(
+            "enabled", False
+        ),
     }
 
 
@@ -247,10 +254,19 @@ def validate_countries(
 
 
 def process_countries(
-    countries, csv_cache_path, cache_dir, update, osm_config, raw=False
+    countries, csv_cache_path, cache_dir, update, osm_config, raw=False, jobs=None
 ):
     """Process power plant data for specified countries.
 
+    With ``jobs`` above one, countries missing from the CSV cache are
+    processed in worker processes, each with its own client over the
+    shared cache directory. Results are combined in the order of
+    ``countries``, so the output does not depend on the number of jobs.
+
+    Otherwise countries are processed in this process. With
+    ``overpass_api.download_ahead`` set, the next countries are downloaded
+    in the background while the current one is processed.
+
     Parameters
     ----------
     countries : list of str
@@ -265,6 +281,9 @@ def process_countries(
         Configuration dictionary
     raw : bool, default False
         If True, return all columns including metadata
+    jobs : int, optional
+        Number of worker processes. Countries are processed one after
+        another in this process if not above one.
 
     Returns
     -------
@@ -294,41 +313,249 @@ def process_countries(
 
     all_valid_data = pd.DataFrame()
 
-    # Create single client for all countries
     client_params = get_client_params(osm_config, api_url, cache_dir)
 
-    with OverpassAPIClient(**client_params) as client:
-        for i, country in enumerate(valid_countries, 1):
-            logger.info(
-                f"Processing country {i}/{len(valid_countries)}: {country} ({country_code_map[country]})"
-            )
-
-            country_data = process_single_country(
-                country,
-                csv_cache_path,
-                current_config_hash,
-                update,
-                force_refresh,
-                osm_config,
-                client,
-            )
+    if jobs is not None and jobs > 1 and len(valid_countries) > 1:
+        results = process_countries_in_pool(
+            valid_countries,
+            csv_cache_path,
+            current_config_hash,
+            update,
+            force_refresh,
+            osm_config,
+            client_params,
+            jobs,
+        )
+    else:
+        ahead = osm_config.get("overpass_api", {}).get("download_ahead", 0)
+        # Create single client for all countries
+        with OverpassAPIClient(**client_params) as client:
+            if ahead > 0 and len(valid_countries) > 1:
+                results = process_countries_pipelined(
+                    valid_countries,
+                    csv_cache_path,
+                    current_config_hash,
+                    update,
+                    force_refresh,
+                    osm_config,
+                    client,
+                    ahead,
+                )
+            else:
+                results = []
+                for i, country in enumerate(valid_countries, 1):
+                    logger.info(
+                        f"Processing country {i}/{len(valid_countries)}: {country} ({country_code_map[country]})"
+                    )
 
-            if country_data is not None and not country_data.empty:
-                if not raw:
-                    country_data = validate_and_standardize_df(
-                        country_data,
-                        VALID_FUELTYPES,
-                        VALID_TECHNOLOGIES,
-                        VALID_SETS,
+                    results.append(
+                        process_single_country(
+                            country,
+                            csv_cache_path,
+                            current_config_hash,
+                            update,
+                            force_refresh,
+                            osm_config,
+                            client,
+                        )
                     )
-                all_valid_data = pd.concat(
-                    [all_valid_data, country_data], ignore_index=True
+
+    for country_data in results:
+        if country_data is not None and not country_data.empty:
+            if not raw:
+                country_data = validate_and_standardize_df(
+                    country_data,
+                    VALID_FUELTYPES,
+                    VALID_TECHNOLOGIES,
+                    VALID_SETS,
                 )
+            all_valid_data = pd.concat(
+                [all_valid_data, country_data], ignore_index=True
+            )
 
     logger.info(f"✅ Successfully processed all {len(valid_countries)} countries")
     return all_valid_data
 
 
+# Client of a worker process, created once by _init_country_worker
+_worker_client: OverpassAPIClient | None = None
+
+
+def _init_country_worker(client_params: dict) -> None:
+    """Create the client used by all countries of a worker process."""
+    global _worker_client
+    _worker_client = OverpassAPIClient(**client_params)
+
+
+def _process_country_worker(
+    country, config_hash, update, force_refresh, osm_config
+) -> pd.DataFrame | None:
+    """Process one country in a worker process.
+
+    The CSV cache is left to the main process; the country caches are
+    saved right away so other workers and later runs can use them.
+    """
+    try:
+        return process_single_country(
+            country,
+            None,
+            config_hash,
+            update,
+            force_refresh,
+            osm_config,
+            _worker_client,
+        )
+    finally:
+        _worker_client.cache.save_all_caches()
+
+
+def process_countries_in_pool(
+    countries,
+    csv_cache_path,
+    config_hash,
+    update,
+    force_refresh,
+    osm_config,
+    client_params,
+    jobs,
+):
+    """Process countries in worker processes.
+
+    Countries found in the CSV cache are read in this process. The others
+    are processed by up to ``jobs`` workers, and their results are written
+    to the CSV cache here, one country at a time.
+
+    Parameters
+    ----------
+    countries : list of str
+        Validated country names
+    csv_cache_path : str
+        Path to CSV cache
+    config_hash : str
+        Current config hash for cache validation
+    update : bool
+        Force update if True
+    force_refresh : bool
+        Skip cache if True
+    osm_config : dict
+        Configuration dictionary
+    client_params : dict
+        Parameters for the client of each worker
+    jobs : int
+        Maximum number of worker processes
+
+    Returns
+    -------
+    list of pd.DataFrame or None
+        Country data in the order of ``countries``, None where not found
+    """
+    results = {}
+    pending = []
+    for country in countries:
+        country_data = None
+        if not force_refresh:
+            country_data = check_csv_cache(csv_cache_path, country, config_hash, update)
+        if country_data is not None:
+            results[country] = country_data
+        else:
+            pending.append(country)
+
+    if pending:
+        workers = min(jobs, len(pending))
+        logger.info(f"Processing {len(pending)} countries in {workers} processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_country_worker,
+            initargs=(client_params,),
+        ) as executor:
+            processed = executor.map(
+                _process_country_worker,
+                pending,
+                repeat(config_hash),
+                repeat(update),
+                repeat(force_refresh),
+                repeat(osm_config),
+            )
+            # Results arrive in submission order
+            for i, (country, country_data) in enumerate(zip(pending, processed), 1):
+                logger.info(f"Finished country {i}/{len(pending)}: {country}")
+                if country_data is not None:
+                    update_csv_cache(csv_cache_path, country, country_data)
+                results[country] = country_data
+
+    return [results[country] for country in countries]
+
+
+def process_countries_pipelined(
+    countries,
+    csv_cache_path,
+    config_hash,
+    update,
+    force_refresh,
+    osm_config,
+    client,
+    ahead,
+):
+    """Process countries while the following ones are downloaded.
+
+    Countries found in the CSV or units cache are read first. The others
+    are downloaded in background threads, at most ``ahead`` countries
+    ahead of the one being processed, so downloading and processing
+    overlap instead of taking turns.
+
+    Parameters
+    ----------
+    countries : list of str
+        Validated country names
+    csv_cache_path : str
+        Path to CSV cache
+    config_hash : str
+        Current config hash for cache validation
+    update : bool
+        Force update if True
+    force_refresh : bool
+        Skip cache if True
+    osm_config : dict
+        Configuration dictionary
+    client : OverpassAPIClient
+        API client shared by the downloads and the processing
+    ahead : int
+        Number of countries downloaded ahead of the one being processed
+
+    Returns
+    -------
+    list of pd.DataFrame or None
+        Country data in the order of ``countries``, None where not found
+    """
+    results = {}
+    pending = []
+    for country in countries:
+        country_data = None
+        if not force_refresh:
+            country_data = check_cached_country(
+                csv_cache_path, country, config_hash, update, client
+            )
+        if country_data is not None:
+            results[country] = country_data
+        else:
+            pending.append(country)
+
+    downloads = download_ahead(
+        client,
+        pending,
+        ahead=ahead,
+        force_refresh=force_refresh,
+        plants_only=osm_config.get("plants_only", True),
+    )
+    for i, (country, download) in enumerate(downloads, 1):
+        logger.info(f"Processing country {i}/{len(pending)}: {country}")
+        results[country] = process_from_api(
+            csv_cache_path, country, osm_config, client, download
+        )
+
+    return [results[country] for country in countries]
+
+
 def process_single_country(
     country, csv_cache_path, config_hash, update, force_refresh, osm_config, client
 ):
@@ -338,8 +565,8 @@ def process_single_country(
     ----------
     country : str
         Country name
-    csv_cache_path : str
-        Path to CSV cache
+    csv_cache_path : str or None
+        Path to CSV cache, None to neither read nor update it
     config_hash : str
         Current config hash for cache validation
     update : bool
@@ -361,17 +588,23 @@ def process_single_country(
     if force_refresh:
         return process_from_api(csv_cache_path, country, osm_config, client)
 
-    # Check CSV cache first
-    country_data = check_csv_cache(csv_cache_path, country, config_hash, update)
+    country_data = check_cached_country(
+        csv_cache_path, country, config_hash, update, client
+    )
     if country_data is not None:
         return country_data
 
-    country_data = check_units_cache(csv_cache_path, country, config_hash, client)
+    # Process from API using existing client
+    return process_from_api(csv_cache_path, country, osm_config, client)
+
+
+def check_cached_country(csv_cache_path, country, config_hash, update, client):
+    """Check the CSV cache, then the units cache, for valid country data."""
+    country_data = check_csv_cache(csv_cache_path, country, config_hash, update)
     if country_data is not None:
         return country_data
 
-    # Process from API using existing client
-    return process_from_api(csv_cache_path, country, osm_config, client)
+    return check_units_cache(csv_cache_path, country, config_hash, client)
 
 
 def check_csv_cache(cache_path, country, config_hash, update):
@@ -379,7 +612,7 @@ def check_csv_cache(cache_path, country, config_hash, update):
 
     Returns cached data only if config_hash matches current configuration.
     """
-    if update or not os.path.exists(cache_path):
+    if update or cache_path is None or not os.path.exists(cache_path):
         return None
 
     try:
@@ -454,25 +687,30 @@ def check_units_cache(csv_cache_path, country, config_hash, client):
     return None
 
 
-def process_from_api(csv_cache_path, country, osm_config, client):
+def process_from_api(csv_cache_path, country, osm_config, client, download=None):
     """Download and process country data from Overpass API.
 
     Creates workflow, processes country, updates CSV cache with results.
+    ``download`` is the future of an already started download, as yielded by
+    :func:`~osm_powerplants.retrieval.prefetch.download_ahead`.
     """
     logger.info(f"No valid cache for {country}, processing from API")
 
     try:
+        osm_data = download.result() if download is not None else None
+
         units_collection = Units()
-        rejection_tracker = RejectionTracker()
+        rejection_tracker = RejectionTracker.from_config(osm_config)
 
-        workflow = Workflow(
+        with Workflow(
             client=client,
             rejection_tracker=rejection_tracker,
             units=units_collection,
             config=osm_config,
-        )
-
-        updated_units_collection, _ = workflow.process_country_data(country)
+        ) as workflow:
+            updated_units_collection, _ = workflow.process_country_data(
+                country, osm_data=osm_data
+            )
 
         country_units = updated_units_collection.filter_by_country(country)
 
@@ -496,7 +734,7 @@ def update_csv_cache(cache_path, country, country_data):
 
     Replaces existing data for the country, preserving other countries.
     """
-    if country_data.empty:
+    if country_data.empty or cache_path is None:
         return
 
     try:
@@ -629,6 +867,7 @@ def process_units(
     cache_dir: str,
     output_path: str | None = None,
     raw: bool = True,
+    jobs: int | None = None,
 ) -> pd.DataFrame:
     """Process power plant data for specified countries.
 
@@ -645,6 +884,9 @@ def process_units(
     raw : bool, default True
         If True, return all columns. If False, remove metadata columns
         (config_hash, created_at, processing_parameters, id).
+    jobs : int, optional
+        Number of worker processes for countries not in the CSV cache.
+        Countries are processed one after another if not above one.
 
     Returns
     -------
@@ -675,9 +917,72 @@ def process_units(
         update=update,
         osm_config=config,
         raw=raw,
+        jobs=jobs,
     )
 
     if output_path and not df.empty:
         df.to_csv(output_path, index=False)
 
     return df
+
+
+def prefetch_countries(
+    countries: list[str],
+    config: dict,
+    cache_dir: str,
+    jobs: int | None = None,
+    force_refresh: bool | None = None,
+) -> dict:
+    """Download raw OSM data for countries into the cache without processing.
+
+    Parameters
+    ----------
+    countries : list[str]
+        Country names or ISO codes
+    config : dict
+        Configuration from get_config()
+    cache_dir : str
+        Cache directory from get_cache_dir()
+    jobs : int, optional
+        Concurrent country downloads. Defaults to
+        ``overpass_api.prefetch_jobs`` from the config.
+    force_refresh : bool, optional
+        Re-download countries already prefetched. Defaults to the
+        config's ``force_refresh``.
+
+    Returns
+    -------
+    dict
+        Results with 'success', 'countries_fetched', 'countries_skipped'
+        and 'countries_failed'
+
+    Examples
+    --------
+    >>> from osm_powerplants import prefetch_countries, get_config, get_cache_dir
+    >>> config = get_config()
+    >>> prefetch_countries(
+    ...     countries=['Malta', 'Luxembourg'],
+    ...     config=config,
+    ...     cache_dir=str(get_cache_dir(config)),
+    ... )
+    """
+    valid_countries, _ = validate_countries(
+        countries, config.get("omitted_countries", [])
+    )
+
+    if jobs is None:
+        jobs = config.get("overpass_api", {}).get("prefetch_jobs", 2)
+    if force_refresh is None:
+        force_refresh = config.get("force_refresh", False)
+
+    api_url = config.get("overpass_api", {}).get("api_url")
+    client_params = get_client_params(config, api_url, cache_dir)
+
+    with OverpassAPIClient(**client_params) as client:
+        return prefetch_country_data(
+            client,
+            valid_countries,
+            jobs=jobs,
+            force_refresh=force_refresh,
+            plants_only=config.get("plants_only", True),
+        )
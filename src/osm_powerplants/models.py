@@ -25,6 +25,7 @@ from math import cos, radians
 from typing import Any, Literal, Union
 
 import pandas as pd
+import shapely
 from shapely.errors import ShapelyError
 from shapely.geometry import MultiPolygon, Point, Polygon
 
@@ -293,8 +294,6 @@ class PlantGeometry:
         bool
             True if point is within geometry (with buffer if applicable)
         """
-        point = Point(lon, lat)
-
         try:
             if isinstance(self.geometry, Point):
                 if buffer_meters is None:
@@ -308,11 +307,11 @@ class PlantGeometry:
                         111320.0 * ((1 + lon_correction) / 2)
                     )
 
-                distance = self.geometry.distance(point)
+                distance = self.geometry.distance(Point(lon, lat))
                 return distance <= buffer_degrees
 
             elif isinstance(self.geometry, Polygon | MultiPolygon):
-                return self.geometry.contains(point)
+                return bool(shapely.contains_xy(self.geometry, lon, lat))
 
             else:
                 logger.warning(
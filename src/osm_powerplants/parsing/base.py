@@ -18,10 +18,18 @@ from typing import Any
 from osm_powerplants.enhancement.estimation import CapacityEstimator
 from osm_powerplants.enhancement.geometry import GeometryHandler
 from osm_powerplants.models import Unit
-from osm_powerplants.quality.rejection import RejectionReason, RejectionTracker
+from osm_powerplants.quality.rejection import (
+    RejectionDetails,
+    RejectionReason,
+    RejectionTracker,
+)
+from osm_powerplants.retrieval.cache import ElementCache
 from osm_powerplants.retrieval.client import OverpassAPIClient
+from osm_powerplants.retrieval.index import ElementIndex
+from osm_powerplants.utils import parse_start_year
 
 from .capacity import CapacityExtractor
+from .mappings import TagMappings
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +61,10 @@ class ElementProcessor(ABC):
         Estimates missing capacities
     geometry_handler : GeometryHandler
         Handles spatial operations
+    tag_mappings : TagMappings
+        Lookup tables compiled from the tag mapping configuration
+    element_index : ElementIndex, optional
+        Index of the country being processed, see :meth:`set_element_index`
 
     Notes
     -----
@@ -91,6 +103,27 @@ class ElementProcessor(ABC):
             self.client, self.rejection_tracker, self.config
         )
         self.geometry_handler = geometry_handler
+        self.tag_mappings = TagMappings(self.config)
+        self.element_index: ElementIndex | None = None
+
+    def set_element_index(self, element_index: ElementIndex | None) -> None:
+        """Use an index of the current country for member lookups.
+
+        Parameters
+        ----------
+        element_index : ElementIndex or None
+            Index of the country being processed, None to read members
+            from the cache again
+        """
+        self.element_index = element_index
+        self.geometry_handler.element_index = element_index
+
+    @property
+    def elements(self) -> ElementCache | ElementIndex:
+        """Source of member nodes and ways: the element index or the cache."""
+        if self.element_index is not None:
+            return self.element_index
+        return self.client.cache
 
     def extract_name_from_tags(
         self, element: dict[str, Any], unit_type: str
@@ -119,19 +152,7 @@ class ElementProcessor(ABC):
 
         tags = element.get("tags", {})
 
-        unit_type_tags_keys = {
-            "plant": "plant_tags",
-            "generator": "generator_tags",
-        }
-
-        default_name = {
-            "plant_tags": ["name:en", "name"],
-            "generator_tags": ["name:en", "name"],
-        }
-
-        name_keys = self.config.get(unit_type_tags_keys[unit_type], {}).get(
-            "name_tags_keys", default_name[unit_type_tags_keys[unit_type]]
-        )
+        name_keys = self.tag_mappings.tags_keys(unit_type, "name_tags_keys")
 
         name = None
         for key in name_keys:
@@ -148,7 +169,7 @@ class ElementProcessor(ABC):
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.MISSING_NAME_TAG,
-                details=f"tags: {tags}",
+                details=RejectionDetails("tags: {tags}", tags=tags),
                 keywords="none",
             )
 
@@ -180,20 +201,8 @@ class ElementProcessor(ABC):
 
         tags = element.get("tags", {})
 
-        unit_type_tags_keys = {
-            "plant": "plant_tags",
-            "generator": "generator_tags",
-        }
-
-        default_source = {
-            "plant_tags": ["plant:source"],
-            "generator_tags": ["generator:source"],
-        }
-
-        source_keys = self.config.get(unit_type_tags_keys[unit_type], {}).get(
-            "source_tags_keys", default_source[unit_type_tags_keys[unit_type]]
-        )
-        source_mapping = self.config.get("source_mapping", {})
+        source_keys = self.tag_mappings.tags_keys(unit_type, "source_tags_keys")
+        source_lookup = self.tag_mappings.source_lookup
 
         store_element_source = ""
 
@@ -201,22 +210,26 @@ class ElementProcessor(ABC):
             if key in tags:
                 element_source = tags[key].lower()
                 store_element_source = element_source
-                for config_source in source_mapping:
-                    if element_source in source_mapping[config_source]:
-                        return config_source
+                config_source = source_lookup.get(element_source)
+                if config_source is not None:
+                    return config_source
 
         if not store_element_source:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.MISSING_SOURCE_TAG,
-                details=f"tags: {tags}",
+                details=RejectionDetails("tags: {tags}", tags=tags),
                 keywords="none",
             )
         else:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.MISSING_SOURCE_TYPE,
-                details=f"Source value '{store_element_source}' from tag '{key}' is not recognized",
+                details=RejectionDetails(
+                    "Source value '{source}' from tag '{key}' is not recognized",
+                    source=store_element_source,
+                    key=key,
+                ),
                 keywords=store_element_source,
             )
 
@@ -252,20 +265,8 @@ class ElementProcessor(ABC):
 
         tags = element.get("tags", {})
 
-        unit_type_tags_keys = {
-            "plant": "plant_tags",
-            "generator": "generator_tags",
-        }
-        default_technology = {
-            "plant_tags": ["plant:method", "plant:type"],
-            "generator_tags": ["generator:method", "generator:type"],
-        }
-
-        technology_keys = self.config.get(unit_type_tags_keys[unit_type], {}).get(
-            "technology_tags_keys", default_technology[unit_type_tags_keys[unit_type]]
-        )
-        technology_mapping = self.config.get("technology_mapping", {})
-        source_tech_mapping = self.config.get("source_technology_mapping", {})
+        technology_keys = self.tag_mappings.tags_keys(unit_type, "technology_tags_keys")
+        technology_lookup = self.tag_mappings.technology_lookup
 
         store_element_technology = ""
 
@@ -273,10 +274,11 @@ class ElementProcessor(ABC):
             if key in tags:
                 element_technology = tags[key].lower()
                 store_element_technology = element_technology
-                for config_technology in technology_mapping:
-                    if config_technology in source_tech_mapping[source_type]:
-                        if element_technology in technology_mapping[config_technology]:
-                            return config_technology
+                config_technology = technology_lookup.get(
+                    (source_type, element_technology)
+                )
+                if config_technology is not None:
+                    return config_technology
 
         missing_technology_allowed = self.config.get(
             "missing_technology_allowed", False
@@ -288,14 +290,21 @@ class ElementProcessor(ABC):
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.MISSING_TECHNOLOGY_TAG,
-                details=f"No technology tag found. Element has {len(tags)} tags but none specify technology",
+                details=RejectionDetails(
+                    "No technology tag found. Element has {count} tags but none specify technology",
+                    count=len(tags),
+                ),
                 keywords="none",
             )
         else:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.MISSING_TECHNOLOGY_TYPE,
-                details=f'''"{store_element_technology}" not found in technology_mapping. Ensure updating source_technology_mapping with "{source_type}"''',
+                details=RejectionDetails(
+                    '''"{technology}" not found in technology_mapping. Ensure updating source_technology_mapping with "{source_type}"''',
+                    technology=store_element_technology,
+                    source_type=source_type,
+                ),
                 keywords=store_element_technology,
             )
 
@@ -330,27 +339,7 @@ class ElementProcessor(ABC):
 
         tags = element.get("tags", {})
 
-        unit_type_tags_keys = {
-            "plant": "plant_tags",
-            "generator": "generator_tags",
-        }
-
-        default_output = {
-            "plant_tags": ["plant:output:electricity"],
-            "generator_tags": ["generator:output:electricity"],
-        }
-
-        output_keys = self.config.get(unit_type_tags_keys[unit_type], {}).get(
-            "output_tags_keys", default_output[unit_type_tags_keys[unit_type]]
-        )
-        if source_type:
-            source_output_keys = (
-                self.config.get("sources", {})
-                .get(source_type, {})
-                .get("capacity_extraction", {})
-                .get("additional_tags", [])
-            )
-            output_keys.extend(source_output_keys)
+        output_keys = self.tag_mappings.output_keys(unit_type, source_type)
 
         for key in output_keys:
             if key in tags:
@@ -359,7 +348,7 @@ class ElementProcessor(ABC):
         self.rejection_tracker.add_rejection(
             element=element,
             reason=RejectionReason.MISSING_OUTPUT_TAG,
-            details=f"tags: {tags}",
+            details=RejectionDetails("tags: {tags}", tags=tags),
             keywords="none",
         )
         return None
@@ -385,19 +374,7 @@ class ElementProcessor(ABC):
 
         tags = element.get("tags", {})
 
-        unit_type_tags_keys = {
-            "plant": "plant_tags",
-            "generator": "generator_tags",
-        }
-
-        default_start_date = {
-            "plant_tags": ["start_date", "year"],
-            "generator_tags": ["start_date", "year"],
-        }
-
-        start_date_keys = self.config.get(unit_type_tags_keys[unit_type], {}).get(
-            "start_date_tags_keys", default_start_date[unit_type_tags_keys[unit_type]]
-        )
+        start_date_keys = self.tag_mappings.tags_keys(unit_type, "start_date_tags_keys")
 
         missing_start_date_allowed = self.config.get(
             "missing_start_date_allowed", False
@@ -425,7 +402,11 @@ class ElementProcessor(ABC):
                         self.rejection_tracker.add_rejection(
                             element=element,
                             reason=RejectionReason.INVALID_START_DATE_FORMAT,
-                            details=f"Date value '{store_raw_date}' in tag '{key}' could not be parsed to standard format",
+                            details=RejectionDetails(
+                                "Date value '{date}' in tag '{key}' could not be parsed to standard format",
+                                date=store_raw_date,
+                                key=key,
+                            ),
                             keywords=store_raw_date,
                         )
                         return None
@@ -437,14 +418,17 @@ class ElementProcessor(ABC):
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.MISSING_START_DATE_TAG,
-                details=f"tags: {tags}",
+                details=RejectionDetails("tags: {tags}", tags=tags),
                 keywords="none",
             )
         else:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.INVALID_START_DATE_FORMAT,
-                details=f"Date value '{store_raw_date}' could not be parsed to standard format",
+                details=RejectionDetails(
+                    "Date value '{date}' could not be parsed to standard format",
+                    date=store_raw_date,
+                ),
                 keywords=store_raw_date,
             )
 
@@ -454,10 +438,6 @@ class ElementProcessor(ABC):
         self, element: dict[str, Any], date_string: str
     ) -> int | None:
         """Parse various date formats into year as integer."""
-        import re
-
-        from dateutil import parser
-
         if not date_string or not date_string.strip():
             logger.warning(
                 f"Empty date string provided for plant {element['type']}/{element['id']}"
@@ -466,23 +446,18 @@ class ElementProcessor(ABC):
 
         date_string = date_string.strip()
 
-        year_match = re.search(r"\b(1[0-9]{3}|2[0-9]{3})\b", date_string)
-        if not year_match:
+        year, problem = parse_start_year(date_string)
+        if year is None:
             logger.warning(
                 f"No valid year found for plant {element['type']}/{element['id']} in '{date_string}'"
             )
             return None
 
-        year = int(year_match.group(1))
-
-        try:
-            date_obj = parser.parse(date_string, fuzzy=True)
-            return int(date_obj.year)
-        except (ValueError, TypeError) as e:
+        if problem is not None:
             logger.warning(
-                f"Date parsing failed {element['type']}/{element['id']} in '{date_string}': {str(e)}. Using year only."
+                f"Date parsing failed {element['type']}/{element['id']} in '{date_string}': {problem}. Using year only."
             )
-            return year
+        return year
 
     @abstractmethod
     def process_element(
@@ -595,9 +570,9 @@ class ElementProcessor(ABC):
 
             member_elem = None
             if member_type == "node":
-                member_elem = self.client.cache.get_node(member_id)
+                member_elem = self.elements.get_node(member_id)
             elif member_type == "way":
-                member_elem = self.client.cache.get_way(member_id)
+                member_elem = self.elements.get_way(member_id)
             elif member_type == "relation":
                 continue
 
@@ -0,0 +1,271 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Vectorized batch parsing of generator nodes.
+
+This module converts the tags of a country's generator nodes into a columnar
+table and extracts source, technology, name, start date and capacity with
+vectorized string operations. Only elements that take the straightforward
+path through :class:`GeneratorParser` (every attribute present and valid,
+no rejection raised) are resolved here; all other elements are left to the
+scalar parser, so both paths produce the same units and rejections.
+"""
+
+import logging
+import math
+from collections.abc import Mapping
+from typing import Any
+
+import pandas as pd
+
+from osm_powerplants.utils import standardize_country_name
+
+from .generators import GeneratorParser
+from .incremental import ElementResult
+
+logger = logging.getLogger(__name__)
+
+# Same pattern as the basic extraction in parse_capacity_value; the space is
+# optional so the no-space variant is covered as well
+_CAPACITY_PATTERN = r"^(\d+(?:\.\d+)?)\s*(mw|mwp|MW|MWP)$"
+# Years and ISO dates, which _parse_date_string resolves to the leading year
+# whether or not dateutil accepts the month and day
+_YEAR_PATTERN = r"^(1[0-9]{3}|2[0-9]{3})(?:-[0-9]{2}(?:-[0-9]{2})?)?$"
+
+
+def _is_coordinate(value: Any) -> bool:
+    return (
+        isinstance(value, int | float)
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
+
+
+class BatchGeneratorParser:
+    """Columnar fast path for parsing generator nodes.
+
+    Attributes
+    ----------
+    parser : GeneratorParser
+        Scalar parser providing configuration, mappings and unit factory
+
+    Examples
+    --------
+    >>> batch = BatchGeneratorParser(generator_parser)
+    >>> batch.prepare(generators_data["elements"], "Malta")
+    >>> result = batch.pop("node/123")  # None if the scalar path is needed
+    """
+
+    def __init__(self, parser: GeneratorParser):
+        """Initialize the batch parser.
+
+        Parameters
+        ----------
+        parser : GeneratorParser
+            Scalar parser whose behaviour is reproduced
+        """
+        self.parser = parser
+        self._prepared: dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._prepared)
+
+    def __contains__(self, element_id: str) -> bool:
+        return element_id in self._prepared
+
+    def prepare(self, elements: list[dict[str, Any]], country: str) -> int:
+        """Resolve all generator nodes that can skip the scalar parser.
+
+        Parameters
+        ----------
+        elements : list[dict]
+            Generator elements of a country
+        country : str
+            Country name or code being processed
+
+        Returns
+        -------
+        int
+            Number of elements resolved in batch
+        """
+        self._prepared = {}
+
+        nodes = [
+            element
+            for element in elements
+            if element.get("type") == "node"
+            and isinstance(element.get("tags"), Mapping)
+            and element["tags"].get("power") == "generator"
+            and _is_coordinate(element.get("lat"))
+            and _is_coordinate(element.get("lon"))
+        ]
+        if not nodes:
+            return 0
+
+        config = self.parser.config
+        mappings = self.parser.tag_mappings
+        columns: dict[str, pd.Series] = {}
+
+        def column(key: str) -> pd.Series:
+            if key not in columns:
+                columns[key] = pd.Series(
+                    [element["tags"].get(key) for element in nodes], dtype=object
+                )
+            return columns[key]
+
+        def empty() -> pd.Series:
+            return pd.Series([None] * len(nodes), dtype=object)
+
+        source = empty()
+        for key in mappings.tags_keys("generator", "source_tags_keys"):
+            mapped = column(key).str.lower().map(mappings.source_lookup)
+            source = source.mask(source.isna(), mapped)
+
+        technology_lookup = {
+            f"{fuel_type}\x1f{value}": technology
+            for (fuel_type, value), technology in mappings.technology_lookup.items()
+            if isinstance(value, str)
+        }
+        technology = empty()
+        for key in mappings.tags_keys("generator", "technology_tags_keys"):
+            combined = source.str.cat(column(key).str.lower(), sep="\x1f")
+            technology = technology.mask(
+                technology.isna(), combined.map(technology_lookup)
+            )
+        if config.get("missing_technology_allowed", False):
+            technology = technology.mask(technology.isna(), "")
+
+        name = empty()
+        for key in mappings.tags_keys("generator", "name_tags_keys"):
+            values = column(key)
+            name = name.mask(name.isna() & (values.str.len() > 0), values)
+        if config.get("missing_name_allowed", False):
+            name = name.mask(name.isna(), "")
+
+        output_value = empty()
+        for fuel_type in source.dropna().unique():
+            pending = (source == fuel_type) & output_value.isna()
+            for key in mappings.output_keys("generator", fuel_type):
+                values = column(key)
+                present = pending & values.notna()
+                output_value = output_value.mask(present, values)
+                pending &= ~present
+        capacity_source = output_value.str.strip()
+        match = capacity_source.str.extract(_CAPACITY_PATTERN)[0]
+        capacity = match.map(float, na_action="ignore")
+
+        # Only the first present date tag is parsed. Generators without a
+        # usable start date are dropped by the scalar parser even when
+        # missing dates are allowed, so they never take the batch path.
+        start_date = empty()
+        for key in mappings.tags_keys("generator", "start_date_tags_keys"):
+            values = column(key)
+            start_date = start_date.mask(start_date.isna(), values.str.strip())
+        year = start_date.str.extract(_YEAR_PATTERN)[0]
+
+        resolved = (
+            source.notna()
+            & technology.notna()
+            & name.notna()
+            & (capacity > 0)
+            & year.notna()
+        )
+
+        resolved_positions = resolved[resolved].index.tolist()
+
+        # Generators inside rejected plants are grouped by the scalar parser;
+        # containment is evaluated for all nodes at once
+        rejected_plant_index = None
+        in_rejected_plant = None
+        if config.get("units_reconstruction", {}).get("enabled", False):
+            rejected_plant_index = getattr(self.parser, "rejected_plant_index", None)
+        if rejected_plant_index:
+            in_rejected_plant = (
+                rejected_plant_index.containing_many(
+                    [float(nodes[i]["lat"]) for i in resolved_positions],
+                    [float(nodes[i]["lon"]) for i in resolved_positions],
+                )
+                >= 0
+            )
+
+        country_names: dict[str, str] = {}
+
+        for k, i in enumerate(resolved_positions):
+            element = nodes[i]
+            element_country = element.get("_country", country)
+            if not element_country:
+                continue
+            if element_country not in country_names:
+                country_names[element_country] = standardize_country_name(
+                    element_country
+                )
+
+            lat = float(element["lat"])
+            lon = float(element["lon"])
+            if in_rejected_plant is not None and in_rejected_plant[k]:
+                continue
+
+            self._prepared[f"node/{element['id']}"] = (
+                element,
+                country_names[element_country],
+                lat,
+                lon,
+                name[i],
+                source[i],
+                technology[i],
+                float(capacity[i]),
+                capacity_source[i],
+                int(year[i]),
+            )
+
+        logger.debug(
+            f"Resolved {len(self._prepared)} of {len(nodes)} generator nodes in batch"
+        )
+        return len(self._prepared)
+
+    def pop(self, element_id: str) -> ElementResult | None:
+        """Build the result of an element resolved by :meth:`prepare`.
+
+        Parameters
+        ----------
+        element_id : str
+            Element identifier (e.g. "node/123")
+
+        Returns
+        -------
+        ElementResult or None
+            Parse outcome, None if the element needs the scalar parser
+        """
+        prepared = self._prepared.pop(element_id, None)
+        if prepared is None:
+            return None
+
+        (
+            element,
+            country,
+            lat,
+            lon,
+            name,
+            source,
+            technology,
+            capacity,
+            capacity_source,
+            start_date,
+        ) = prepared
+
+        unit = self.parser.unit_factory.create_generator_unit(
+            element_id=element["id"],
+            element_type="node",
+            country=country,
+            lat=lat,
+            lon=lon,
+            name=name,
+            source=source,
+            technology=technology,
+            capacity=capacity,
+            capacity_source=capacity_source,
+            start_date=start_date,
+        )
+        return ElementResult(unit=unit, coordinates=(lat, lon))
@@ -14,7 +14,7 @@ import logging
 from typing import Any
 
 from osm_powerplants.models import RejectionReason
-from osm_powerplants.quality.rejection import RejectionTracker
+from osm_powerplants.quality.rejection import RejectionDetails, RejectionTracker
 from osm_powerplants.utils import parse_capacity_value
 
 logger = logging.getLogger(__name__)
@@ -33,6 +33,8 @@ class CapacityExtractor:
         Configuration with extraction settings
     rejection_tracker : RejectionTracker
         Tracks elements with invalid capacity values
+    regex_patterns : tuple[str, ...]
+        Patterns for advanced extraction, compiled once on first use
     """
 
     def __init__(
@@ -51,6 +53,11 @@ class CapacityExtractor:
         """
         self.config = config
         self.rejection_tracker = rejection_tracker
+        self.regex_patterns = tuple(
+            config.get("capacity_extraction", {}).get(
+                "regex_patterns", [r"^(\d+(?:\.\d+)?)\s*([a-zA-Z]+p?)$"]
+            )
+        )
 
     def basic_extraction(
         self, element: dict[str, Any], output_key: str
@@ -84,7 +91,11 @@ class CapacityExtractor:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.CAPACITY_PLACEHOLDER,
-                details=f"Tag '{output_key}' contains placeholder value '{value_str}' instead of actual capacity",
+                details=RejectionDetails(
+                    "Tag '{key}' contains placeholder value '{value}' instead of actual capacity",
+                    key=output_key,
+                    value=value_str,
+                ),
                 keywords=value_str,
             )
             return False, None, "placeholder_value"
@@ -93,7 +104,11 @@ class CapacityExtractor:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.CAPACITY_DECIMAL_FORMAT,
-                details=f"Tag '{output_key}' uses comma as decimal separator in value '{value_str}'",
+                details=RejectionDetails(
+                    "Tag '{key}' uses comma as decimal separator in value '{value}'",
+                    key=output_key,
+                    value=value_str,
+                ),
                 keywords=value_str,
             )
             return False, None, "decimal_comma_format"
@@ -132,13 +147,9 @@ class CapacityExtractor:
         """
         value_str = element["tags"][output_key].strip()
 
-        regex_patterns = self.config.get("capacity_extraction", {}).get(
-            "regex_patterns", [r"^(\d+(?:\.\d+)?)\s*([a-zA-Z]+p?)$"]
-        )
-
         try:
             is_valid, value, identifier = parse_capacity_value(
-                value_str, advanced_extraction=True, regex_patterns=regex_patterns
+                value_str, advanced_extraction=True, regex_patterns=self.regex_patterns
             )
             return self.parse_and_track(
                 element, output_key, is_valid, value, identifier
@@ -152,7 +163,12 @@ class CapacityExtractor:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.CAPACITY_REGEX_ERROR,
-                details=f"Regex parsing failed for tag '{output_key}' with value '{value_str}': {str(e)}",
+                details=RejectionDetails(
+                    "Regex parsing failed for tag '{key}' with value '{value}': {error}",
+                    key=output_key,
+                    value=value_str,
+                    error=str(e),
+                ),
                 keywords=value_str,
             )
             return False, None, identifier
@@ -196,7 +212,11 @@ class CapacityExtractor:
                 self.rejection_tracker.add_rejection(
                     element=element,
                     reason=RejectionReason.CAPACITY_ZERO,
-                    details=f"Tag '{output_key}' parsed to zero capacity from value '{element['tags'][output_key]}'",
+                    details=RejectionDetails(
+                        "Tag '{key}' parsed to zero capacity from value '{value}'",
+                        key=output_key,
+                        value=element["tags"][output_key],
+                    ),
                     keywords=element["tags"][output_key],
                 )
                 return False, None, identifier
@@ -216,7 +236,11 @@ class CapacityExtractor:
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=reason,
-                details=f"Tag '{output_key}' has value '{element['tags'][output_key]}' which could not be parsed",
+                details=RejectionDetails(
+                    "Tag '{key}' has value '{value}' which could not be parsed",
+                    key=output_key,
+                    value=element["tags"][output_key],
+                ),
                 keywords=element["tags"][output_key],
             )
             return False, None, identifier
@@ -224,7 +248,11 @@ class CapacityExtractor:
         self.rejection_tracker.add_rejection(
             element=element,
             reason=RejectionReason.OTHER,
-            details=f"Unexpected error parsing tag '{output_key}' with value '{element['tags'][output_key]}'",
+            details=RejectionDetails(
+                "Unexpected error parsing tag '{key}' with value '{value}'",
+                key=output_key,
+                value=element["tags"][output_key],
+            ),
             keywords=element["tags"][output_key],
         )
         return False, None, identifier
@@ -15,7 +15,9 @@ import logging
 from typing import Any
 
 from osm_powerplants.models import PROCESSING_PARAMETERS, Unit
-from osm_powerplants.utils import determine_set_type, standardize_country_name
+from osm_powerplants.utils import standardize_country_name
+
+from .mappings import TagMappings
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,8 @@ class UnitFactory:
         Hash of configuration for cache validation
     processing_parameters : dict
         Subset of config affecting processing
+    tag_mappings : TagMappings
+        Compiled set type lookup
     """
 
     def __init__(self, config: dict[str, Any]):
@@ -51,6 +55,7 @@ class UnitFactory:
         self.processing_parameters = {
             k: config.get(k) for k in PROCESSING_PARAMETERS if k in config
         }
+        self.tag_mappings = TagMappings(config)
 
     def create_plant_unit(
         self,
@@ -113,7 +118,7 @@ class UnitFactory:
             Capacity=capacity,
             Name=name,
             generator_count=generator_count,
-            Set=determine_set_type(technology, self.config),
+            Set=self.tag_mappings.set_type(technology),
             capacity_source=capacity_source,
             DateIn=start_date,
             id=f"{element_type}/{element_id}",
@@ -232,7 +237,7 @@ class UnitFactory:
             Capacity=capacity,
             Name=name,
             generator_count=generator_count,
-            Set=determine_set_type(technology, self.config),
+            Set=self.tag_mappings.set_type(technology),
             capacity_source="aggregated_from_orphaned_generators",
             DateIn=start_date,
             id=f"relation/{plant_id}",
@@ -353,7 +358,7 @@ class UnitFactory:
             Capacity=capacity,
             Name=name,
             generator_count=generator_count,
-            Set=determine_set_type(technology, self.config),
+            Set=self.tag_mappings.set_type(technology),
             capacity_source="aggregated_cluster",
             DateIn=start_date,
             id=f"cluster/{source}_{cluster_id}",
@@ -13,10 +13,18 @@ within rejected plant boundaries for reconstruction.
 import logging
 from typing import Any
 
-from osm_powerplants.enhancement.geometry import GeometryHandler, PlantGeometry
+from osm_powerplants.enhancement.geometry import (
+    GeometryHandler,
+    PlantGeometry,
+    PlantGeometryIndex,
+)
 from osm_powerplants.enhancement.reconstruction import NameAggregator
 from osm_powerplants.models import GeneratorGroup, Unit
-from osm_powerplants.quality.rejection import RejectionReason, RejectionTracker
+from osm_powerplants.quality.rejection import (
+    RejectionDetails,
+    RejectionReason,
+    RejectionTracker,
+)
 from osm_powerplants.retrieval.client import OverpassAPIClient
 from osm_powerplants.utils import is_valid_unit, standardize_country_name
 
@@ -41,6 +49,8 @@ class GeneratorParser(ElementProcessor):
         Aggregates names from multiple generators (if reconstruction enabled)
     rejected_plant_polygons : dict[str, PlantGeometry]
         Boundaries of rejected plants for grouping generators
+    rejected_plant_index : PlantGeometryIndex
+        Spatial index over ``rejected_plant_polygons``
     generator_groups : dict[str, GeneratorGroup]
         Groups of generators within rejected plant boundaries
     """
@@ -78,6 +88,7 @@ class GeneratorParser(ElementProcessor):
             )
             self.name_aggregator = NameAggregator(similarity_threshold)
             self.rejected_plant_polygons: dict[str, PlantGeometry] = {}
+            self.rejected_plant_index = PlantGeometryIndex([])
             self.generator_groups: dict[str, GeneratorGroup] = {}
 
     def process_element(
@@ -128,7 +139,10 @@ class GeneratorParser(ElementProcessor):
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.INVALID_ELEMENT_TYPE,
-                details=f"Expected power type 'generator' but found '{element.get('tags', {}).get('power', 'missing')}'",
+                details=RejectionDetails(
+                    "Expected power type 'generator' but found '{power}'",
+                    power=element.get("tags", {}).get("power", "missing"),
+                ),
                 keywords=element.get("tags", {}).get("power", "missing"),
                 coordinates=(lat, lon) if lat is not None and lon is not None else None,
             )
@@ -160,7 +174,7 @@ class GeneratorParser(ElementProcessor):
         ):
             if lat is not None and lon is not None:
                 rejected_plant_id = self.geometry_handler.check_point_within_geometries(
-                    lat, lon, self.rejected_plant_polygons
+                    lat, lon, self.rejected_plant_index
                 )
                 if rejected_plant_id:
                     self._add_to_generator_group(element, rejected_plant_id)
@@ -207,7 +221,7 @@ class GeneratorParser(ElementProcessor):
             )
             return None
 
-        if members_and_capacities and processed_elements:
+        if members_and_capacities and processed_elements is not None:
             for elem, _ in members_and_capacities:
                 processed_elements.add(f"{elem['type']}/{elem['id']}")
 
@@ -236,6 +250,9 @@ class GeneratorParser(ElementProcessor):
         self.rejected_plant_polygons = {
             plant_id: info.polygon for plant_id, info in rejected_plant_info.items()
         }
+        self.rejected_plant_index = PlantGeometryIndex.from_dict(
+            self.rejected_plant_polygons
+        )
 
     def _add_to_generator_group(self, element: dict[str, Any], plant_id: str):
         """Add generator to a group for later aggregation."""
@@ -302,7 +319,7 @@ class GeneratorParser(ElementProcessor):
                 unit = self._create_aggregated_unit(filtered_group, country)
                 if unit:
                     aggregated_units.append(unit)
-                    if processed_elements:
+                    if processed_elements is not None:
                         for gen in unprocessed_generators:
                             gen_id = f"{gen['type']}/{gen['id']}"
                             processed_elements.add(gen_id)
@@ -0,0 +1,382 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Element-level change detection for incremental reprocessing.
+
+This module captures the outcome of parsing each element without applying
+it, fingerprints OSM elements together with the geometry they reference, and
+stores the captured outcomes. When a country is processed again, elements
+whose fingerprint is unchanged reuse their stored outcome instead of going
+through the parsers.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import diskcache
+
+from osm_powerplants import __version__
+from osm_powerplants.models import PlantGeometry, RejectedPlantInfo, Unit
+from osm_powerplants.quality.rejection import RejectedElement, RejectionTracker
+from osm_powerplants.retrieval.cache import ElementCache
+from osm_powerplants.retrieval.index import ElementIndex
+
+from .generators import GeneratorParser
+from .plants import PlantParser
+
+logger = logging.getLogger(__name__)
+
+# Bumped when stored outcomes must not be reused; outcomes of format 1 miss
+# the rejections of runs with rejection tracking off, those of format 2 hold
+# rendered detail messages
+_RESULT_FORMAT = 3
+
+# Configuration keys that do not influence how single elements are parsed
+_NON_PARSING_KEYS = {
+    "cache_dir",
+    "force_refresh",
+    "overpass_api",
+    "omitted_countries",
+    "algorithm_params",
+    "units_clustering",
+    "incremental_parsing",
+    "batch_parsing",
+    "parallel_parsing",
+    "rejection_tracking",
+    "compact_elements",
+}
+
+
+@dataclass
+class ElementResult:
+    """Outcome of parsing a single plant or generator element.
+
+    Attributes
+    ----------
+    unit : Unit, optional
+        Unit produced for the element, None if it was rejected
+    rejections : list[RejectedElement]
+        Rejections raised while parsing, in order
+    consumed : list[str]
+        IDs of other elements absorbed into the unit (e.g. plant members)
+    coordinates : tuple[float, float], optional
+        (latitude, longitude) determined for the element
+    plant_geometries : list[PlantGeometry]
+        Plant boundaries registered for spatial checks
+    rejected_plant : RejectedPlantInfo, optional
+        Incomplete plant kept for generator grouping
+    fingerprint : str, optional
+        Fingerprint of the element when it was parsed
+    cacheable : bool
+        False if the outcome depends on state outside the element, such as
+        a generator that was added to a rejected plant group
+    reused : bool
+        True if the outcome was loaded from the result store
+    """
+
+    unit: Unit | None = None
+    rejections: list[RejectedElement] = field(default_factory=list)
+    consumed: list[str] = field(default_factory=list)
+    coordinates: tuple[float, float] | None = None
+    plant_geometries: list[PlantGeometry] = field(default_factory=list)
+    rejected_plant: RejectedPlantInfo | None = None
+    fingerprint: str | None = None
+    cacheable: bool = True
+    reused: bool = False
+
+
+def capture_element_result(
+    kind: str,
+    element: dict[str, Any],
+    country: str,
+    plant_parser: PlantParser,
+    generator_parser: GeneratorParser,
+    rejection_tracker: RejectionTracker,
+) -> ElementResult:
+    """Parse an element and capture its outcome instead of applying it.
+
+    Parameters
+    ----------
+    kind : {'plant', 'generator'}
+        Parser to use
+    element : dict
+        OSM element to parse
+    country : str
+        Country name or code being processed
+    plant_parser : PlantParser
+        Plant parser, also holding plant polygons and rejected plants
+    generator_parser : GeneratorParser
+        Generator parser, also holding generator groups
+    rejection_tracker : RejectionTracker
+        Tracker the parsers report rejections to
+
+    Returns
+    -------
+    ElementResult
+        Outcome without fingerprint
+
+    Notes
+    -----
+    Plant geometries and rejected plant information registered by the
+    parser are moved from the parsers into the result, so that the parser
+    state is unchanged afterwards. Generators added to a rejected plant
+    group are the exception: the group keeps them and the result is marked
+    as not cacheable.
+    """
+    parser = plant_parser if kind == "plant" else generator_parser
+    plant_polygons = plant_parser.plant_polygons
+    rejected_plants = getattr(plant_parser, "rejected_plant_info", {})
+    plant_key = str(element["id"])
+    polygons_before = len(plant_polygons)
+    rejected_before = rejected_plants.get(plant_key)
+    grouped_before = sum(
+        len(group.generators)
+        for group in getattr(generator_parser, "generator_groups", {}).values()
+    )
+
+    consumed: set[str] = set()
+    with rejection_tracker.capture() as rejections:
+        unit = parser.process_element(element, country, consumed)
+
+    result = ElementResult(
+        unit=unit,
+        rejections=rejections,
+        consumed=sorted(consumed),
+        plant_geometries=plant_polygons[polygons_before:],
+    )
+    del plant_polygons[polygons_before:]
+
+    if "_lat" in element and "_lon" in element:
+        result.coordinates = (element["_lat"], element["_lon"])
+
+    rejected_plant = rejected_plants.get(plant_key)
+    if rejected_plant is not None and rejected_plant is not rejected_before:
+        result.rejected_plant = rejected_plants.pop(plant_key)
+        if rejected_before is not None:
+            rejected_plants[plant_key] = rejected_before
+
+    grouped_after = sum(
+        len(group.generators)
+        for group in getattr(generator_parser, "generator_groups", {}).values()
+    )
+    result.cacheable = grouped_after == grouped_before
+
+    return result
+
+
+def _update_hash(digest: Any, element: dict[str, Any] | None) -> None:
+    """Feed the OSM content of an element into a hash."""
+    if element is None:
+        digest.update(b"null\n")
+        return
+    content = {k: v for k, v in element.items() if not k.startswith("_")}
+    # Compact tag maps are serialized as the dicts they replace
+    digest.update(
+        json.dumps(
+            content, sort_keys=True, separators=(",", ":"), default=dict
+        ).encode()
+    )
+    digest.update(b"\n")
+
+
+def element_fingerprint(
+    element: dict[str, Any], cache: ElementCache | ElementIndex, context: str = ""
+) -> str:
+    """Compute a fingerprint of an element and the geometry it references.
+
+    Parameters
+    ----------
+    element : dict
+        OSM element
+    cache : ElementCache or ElementIndex
+        Cache or country index holding the nodes and ways the element
+        references
+    context : str
+        Extra state the parse outcome depends on, such as the country
+
+    Returns
+    -------
+    str
+        Hex digest that changes whenever the element's tags, its own
+        coordinates, its member list, or any referenced node or way changes
+
+    Notes
+    -----
+    Ways include the coordinates of their nodes. Relations include their
+    node and way members with the nodes of those ways. Relation members of
+    relations are only included by reference, as the parsers do not read them.
+    """
+    digest = hashlib.sha256()
+    digest.update(context.encode())
+    digest.update(b"\n")
+    digest.update(str(element.get("_country")).encode())
+    digest.update(b"\n")
+    _update_hash(digest, element)
+
+    if element.get("type") == "way":
+        for node_id in element.get("nodes", []):
+            _update_hash(digest, cache.get_node(node_id))
+    elif element.get("type") == "relation":
+        for member in element.get("members", []):
+            if member["type"] == "node":
+                _update_hash(digest, cache.get_node(member["ref"]))
+            elif member["type"] == "way":
+                way = cache.get_way(member["ref"])
+                _update_hash(digest, way)
+                for node_id in (way or {}).get("nodes", []):
+                    _update_hash(digest, cache.get_node(node_id))
+
+    return digest.hexdigest()
+
+
+def parse_config_hash(config: dict[str, Any]) -> str:
+    """Hash the parts of a configuration that affect element parsing.
+
+    Parameters
+    ----------
+    config : dict
+        Processing configuration
+
+    Returns
+    -------
+    str
+        Hash of the configuration and package version
+    """
+    relevant_config = {k: v for k, v in config.items() if k not in _NON_PARSING_KEYS}
+    config_str = json.dumps(
+        {"version": __version__, "format": _RESULT_FORMAT, "config": relevant_config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.md5(config_str.encode()).hexdigest()
+
+
+class ElementResultStore:
+    """Persistent store of per-element parse outcomes.
+
+    Outcomes are keyed by country, element kind and element ID, and are
+    only returned when both the element fingerprint and the parse
+    configuration hash match the stored ones.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory holding the store
+    store : diskcache.Cache
+        Persistent storage of outcomes
+    hits : int
+        Number of reused outcomes
+    misses : int
+        Number of outcomes that had to be recomputed
+    """
+
+    def __init__(self, cache_dir: str):
+        """Open the result store.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Directory for the store
+        """
+        self.cache_dir = cache_dir
+        self.store = diskcache.Cache(directory=f"{cache_dir}/element_results_dc")
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Close the result store."""
+        try:
+            self.store.close()
+        except Exception as e:
+            logger.debug(f"Error closing element result store: {e}")
+
+    @staticmethod
+    def _key(country_code: str, kind: str, element_id: str) -> str:
+        return f"{country_code}:{kind}:{element_id}"
+
+    def get(
+        self,
+        country_code: str,
+        kind: str,
+        element_id: str,
+        fingerprint: str,
+        config_hash: str,
+    ) -> ElementResult | None:
+        """Get a stored outcome if the element and configuration are unchanged.
+
+        Parameters
+        ----------
+        country_code : str
+            ISO country code
+        kind : {'plant', 'generator'}
+            Parser that produced the outcome
+        element_id : str
+            Element identifier (e.g. "node/123")
+        fingerprint : str
+            Current fingerprint of the element
+        config_hash : str
+            Current parse configuration hash
+
+        Returns
+        -------
+        ElementResult or None
+            Stored outcome, None if missing or outdated
+        """
+        try:
+            record = self.store.get(self._key(country_code, kind, element_id))
+        except Exception as e:
+            logger.debug(f"Unreadable element result for {element_id}: {e}")
+            record = None
+
+        if (
+            record is None
+            or record.get("fingerprint") != fingerprint
+            or record.get("config_hash") != config_hash
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        result = record["result"]
+        result.reused = True
+        return result
+
+    def put(
+        self,
+        country_code: str,
+        kind: str,
+        element_id: str,
+        result: ElementResult,
+        config_hash: str,
+    ) -> None:
+        """Store the outcome of parsing an element.
+
+        Parameters
+        ----------
+        country_code : str
+            ISO country code
+        kind : {'plant', 'generator'}
+            Parser that produced the outcome
+        element_id : str
+            Element identifier (e.g. "node/123")
+        result : ElementResult
+            Outcome to store, ignored unless cacheable and fingerprinted
+        config_hash : str
+            Parse configuration hash
+        """
+        if not result.cacheable or result.fingerprint is None:
+            return
+
+        self.store.set(
+            self._key(country_code, kind, element_id),
+            {
+                "fingerprint": result.fingerprint,
+                "config_hash": config_hash,
+                "result": result,
+            },
+        )
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compiled lookup tables for tag mapping configuration.
+
+This module inverts the source, technology and set mappings of the
+configuration into dictionaries once, so that classifying a tag value is a
+single hash lookup instead of a scan over every configured list.
+"""
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+UNIT_TYPE_TAGS_KEYS = {
+    "plant": "plant_tags",
+    "generator": "generator_tags",
+}
+
+DEFAULT_TAGS_KEYS = {
+    "plant": {
+        "name_tags_keys": ["name:en", "name"],
+        "source_tags_keys": ["plant:source"],
+        "technology_tags_keys": ["plant:method", "plant:type"],
+        "output_tags_keys": ["plant:output:electricity"],
+        "start_date_tags_keys": ["start_date", "year"],
+    },
+    "generator": {
+        "name_tags_keys": ["name:en", "name"],
+        "source_tags_keys": ["generator:source"],
+        "technology_tags_keys": ["generator:method", "generator:type"],
+        "output_tags_keys": ["generator:output:electricity"],
+        "start_date_tags_keys": ["start_date", "year"],
+    },
+}
+
+
+class TagMappings:
+    """Lookup tables compiled from a processing configuration.
+
+    Attributes
+    ----------
+    source_lookup : dict[str, str]
+        OSM source value to fuel type. If a value is listed under several
+        fuel types, the first one in ``source_mapping`` wins.
+    technology_lookup : dict[tuple[str, str], str]
+        (fuel type, OSM technology value) to technology, restricted to the
+        technologies allowed by ``source_technology_mapping``. The first
+        matching technology in ``technology_mapping`` wins.
+    source_technologies : dict[str, set[str]]
+        Technologies allowed for each fuel type
+    set_lookup : dict[str, str]
+        Technology to set type (first match in ``set_mapping`` wins)
+
+    Examples
+    --------
+    >>> mappings = TagMappings(config)
+    >>> mappings.source_lookup.get("photovoltaic")
+    'Solar'
+    >>> mappings.technology_lookup.get(("Solar", "photovoltaic"))
+    'PV'
+    """
+
+    def __init__(self, config: dict[str, Any]):
+        """Compile lookup tables from configuration.
+
+        Parameters
+        ----------
+        config : dict
+            Processing configuration
+        """
+        self.config = config
+
+        self.source_lookup: dict[str, str] = {}
+        for fuel_type, values in config.get("source_mapping", {}).items():
+            for value in values or []:
+                self.source_lookup.setdefault(value, fuel_type)
+
+        technology_mapping = config.get("technology_mapping", {})
+        self.source_technologies: dict[str, set[str]] = {
+            source: set(technologies or [])
+            for source, technologies in config.get(
+                "source_technology_mapping", {}
+            ).items()
+        }
+        self.technology_lookup: dict[tuple[str, str], str] = {}
+        for source, allowed in self.source_technologies.items():
+            for technology, values in technology_mapping.items():
+                if technology not in allowed:
+                    continue
+                for value in values or []:
+                    self.technology_lookup.setdefault((source, value), technology)
+
+        self.set_lookup: dict[str, str] = {}
+        for set_type, technologies in config.get("set_mapping", {}).items():
+            for technology in technologies or []:
+                self.set_lookup.setdefault(technology, set_type)
+
+        self._tags_keys: dict[tuple[str, str], list[str]] = {}
+        self._output_keys: dict[tuple[str, str | None], list[str]] = {}
+
+    def tags_keys(self, unit_type: str, field: str) -> list[str]:
+        """Get the configured tag keys for a field, in order of preference.
+
+        Parameters
+        ----------
+        unit_type : {'plant', 'generator'}
+            Type of unit being processed
+        field : str
+            Key in the ``*_tags`` configuration, e.g. 'source_tags_keys'
+
+        Returns
+        -------
+        list[str]
+            Tag keys to check
+        """
+        cache_key = (unit_type, field)
+        keys = self._tags_keys.get(cache_key)
+        if keys is None:
+            keys = (self.config.get(UNIT_TYPE_TAGS_KEYS[unit_type]) or {}).get(
+                field, DEFAULT_TAGS_KEYS[unit_type][field]
+            )
+            self._tags_keys[cache_key] = keys
+        return keys
+
+    def output_keys(self, unit_type: str, source_type: str | None) -> list[str]:
+        """Get capacity tag keys including source-specific additional tags.
+
+        Parameters
+        ----------
+        unit_type : {'plant', 'generator'}
+            Type of unit being processed
+        source_type : str, optional
+            Fuel type whose ``additional_tags`` are appended
+
+        Returns
+        -------
+        list[str]
+            Tag keys to check, in order of preference
+        """
+        cache_key = (unit_type, source_type)
+        keys = self._output_keys.get(cache_key)
+        if keys is None:
+            keys = list(self.tags_keys(unit_type, "output_tags_keys"))
+            if source_type:
+                source_config = (self.config.get("sources") or {}).get(
+                    source_type
+                ) or {}
+                keys.extend(
+                    (source_config.get("capacity_extraction") or {}).get(
+                        "additional_tags"
+                    )
+                    or []
+                )
+            self._output_keys[cache_key] = keys
+        return keys
+
+    def set_type(self, technology: str | None) -> str | None:
+        """Get the set type for a technology.
+
+        Equivalent to :func:`osm_powerplants.utils.determine_set_type`.
+
+        Parameters
+        ----------
+        technology : str, optional
+            Technology name
+
+        Returns
+        -------
+        str or None
+            Set type (PP, CHP, Store), None if not mapped
+        """
+        if technology is None:
+            return None
+        technology = technology.strip()
+        if technology == "":
+            return None
+        return self.set_lookup.get(technology)
@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Parallel parsing of a country's elements in worker processes.
+
+Workers parse chunks of plant or generator elements speculatively, each
+with its own parsers and rejection tracker, and return the captured
+outcomes. The workflow commits the outcomes in the original element order,
+so skipped elements, rejections and consumed members are handled exactly
+as in a serial run.
+"""
+
+import gc
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from functools import partial
+from typing import Any
+
+from osm_powerplants.models import RejectedPlantInfo, Unit
+from osm_powerplants.quality.rejection import RejectionTracker
+from osm_powerplants.retrieval.cache import ElementCache
+
+from .generators import GeneratorParser
+from .incremental import ElementResult, capture_element_result
+from .plants import PlantParser
+
+logger = logging.getLogger(__name__)
+
+_worker_state: dict[str, Any] = {}
+
+_UNIT_FIELDS = tuple(field.name for field in fields(Unit))
+
+
+class _CacheOnlyClient:
+    """Client stand-in giving worker parsers read access to the element cache.
+
+    Parsers only look up nodes, ways and relations through ``client.cache``,
+    so workers open the shared diskcaches without loading country caches or
+    querying the API.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache = ElementCache(cache_dir)
+
+
+def _init_worker(cache_dir: str, config: dict[str, Any]) -> None:
+    """Create the parsers of a worker process."""
+    client = _CacheOnlyClient(cache_dir)
+    rejection_tracker = RejectionTracker.from_config(config)
+    generator_parser = GeneratorParser(client, rejection_tracker, config)
+    plant_parser = PlantParser(
+        client, rejection_tracker, config, generator_parser=generator_parser
+    )
+    _worker_state.update(
+        client=client,
+        rejection_tracker=rejection_tracker,
+        generator_parser=generator_parser,
+        plant_parser=plant_parser,
+    )
+
+
+def _pack_result(result: ElementResult) -> tuple:
+    """Flatten an outcome for transfer to the parent process.
+
+    Units are sent as plain tuples without ``processing_parameters``, which
+    the parent holds already. Unpickling tuples is several times cheaper
+    than unpickling dataclass instances, and the parent unpickles every
+    outcome on a single core.
+    """
+    unit = None
+    if result.unit is not None:
+        result.unit.processing_parameters = None
+        unit = tuple(getattr(result.unit, name) for name in _UNIT_FIELDS)
+    return (
+        unit,
+        result.rejections,
+        result.consumed,
+        result.coordinates,
+        result.plant_geometries,
+        result.rejected_plant,
+        result.cacheable,
+    )
+
+
+def _unpack_result(
+    packed: tuple, processing_parameters: dict[str, Any] | None
+) -> ElementResult:
+    """Rebuild an outcome packed by :func:`_pack_result`."""
+    (
+        unit,
+        rejections,
+        consumed,
+        coordinates,
+        plant_geometries,
+        rejected_plant,
+        cacheable,
+    ) = packed
+    if unit is not None:
+        unit = Unit(*unit)
+        unit.processing_parameters = processing_parameters
+    return ElementResult(
+        unit=unit,
+        rejections=rejections,
+        consumed=consumed,
+        coordinates=coordinates,
+        plant_geometries=plant_geometries,
+        rejected_plant=rejected_plant,
+        cacheable=cacheable,
+    )
+
+
+def _parse_chunk(
+    kind: str,
+    country: str,
+    rejected_plant_info: dict[str, RejectedPlantInfo] | None,
+    elements: list[dict[str, Any]],
+) -> list[tuple]:
+    """Parse a chunk of elements in a worker process."""
+    plant_parser = _worker_state["plant_parser"]
+    generator_parser = _worker_state["generator_parser"]
+
+    plant_parser.plant_polygons = []
+    plant_parser.geometry_handler.clear_memo()
+    if hasattr(plant_parser, "rejected_plant_info"):
+        plant_parser.rejected_plant_info = {}
+    if hasattr(generator_parser, "generator_groups"):
+        generator_parser.generator_groups = {}
+        generator_parser.set_rejected_plant_info(rejected_plant_info or {})
+    if plant_parser.config.get("capacity_estimation", {}).get("enabled", False):
+        # Areas of the chunk's ways in one pass, as in the parent process
+        generator_parser.capacity_estimator.way_areas = (
+            plant_parser.capacity_estimator.compute_way_areas(
+                [element for element in elements if element.get("type") == "way"]
+            )
+        )
+
+    return [
+        _pack_result(
+            capture_element_result(
+                kind,
+                element,
+                country,
+                plant_parser,
+                generator_parser,
+                _worker_state["rejection_tracker"],
+            )
+        )
+        for element in elements
+    ]
+
+
+class ParallelElementParser:
+    """Pool of worker processes parsing elements of one country.
+
+    The pool is started on first use and reused until :meth:`shutdown`.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Cache directory shared with the workers
+    config : dict
+        Processing configuration passed to the worker parsers
+    workers : int
+        Number of worker processes
+    chunk_size : int
+        Number of elements sent to a worker at once
+    min_elements : int
+        Smallest number of elements worth parsing in parallel
+
+    Examples
+    --------
+    >>> parallel = ParallelElementParser(client.cache.cache_dir, config)
+    >>> results = parallel.parse("plant", plants_data["elements"], "Malta")
+    >>> parallel.shutdown()
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        config: dict[str, Any],
+        workers: int | None = None,
+        chunk_size: int = 500,
+        min_elements: int = 2000,
+    ):
+        """Initialize the parallel parser.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Cache directory holding the element diskcaches
+        config : dict
+            Processing configuration
+        workers : int, optional
+            Number of worker processes. Defaults to the number of CPUs.
+        chunk_size : int
+            Number of elements sent to a worker at once
+        min_elements : int
+            Smallest number of elements worth parsing in parallel
+        """
+        self.cache_dir = cache_dir
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.min_elements = min_elements
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __del__(self):
+        """Ensure worker processes are stopped."""
+        try:
+            self.shutdown(wait=False)
+        except Exception:
+            pass
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Workers open their own cache; diskcache reconnects per process
+            # so this is safe with every start method
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.cache_dir, self.config),
+            )
+            logger.info(f"Started {self.workers} parsing worker processes")
+        return self._executor
+
+    def parse(
+        self,
+        kind: str,
+        elements: list[dict[str, Any]],
+        country: str,
+        rejected_plant_info: dict[str, RejectedPlantInfo] | None = None,
+        processing_parameters: dict[str, Any] | None = None,
+    ) -> list[ElementResult]:
+        """Parse elements in the worker processes.
+
+        Parameters
+        ----------
+        kind : {'plant', 'generator'}
+            Parser to use
+        elements : list[dict]
+            Elements to parse
+        country : str
+            Country name or code being processed
+        rejected_plant_info : dict, optional
+            Rejected plants that generators are grouped into
+        processing_parameters : dict, optional
+            Processing parameters to attach to the units
+
+        Returns
+        -------
+        list[ElementResult]
+            Outcomes without fingerprints, in the order of elements
+        """
+        if not elements:
+            return []
+
+        chunks = [
+            elements[i : i + self.chunk_size]
+            for i in range(0, len(elements), self.chunk_size)
+        ]
+        task = partial(_parse_chunk, kind, country, rejected_plant_info)
+
+        results: list[ElementResult] = []
+        # Keep the garbage collector from rescanning the elements already in
+        # memory while the results are unpickled
+        gc.freeze()
+        try:
+            for chunk_results in self._get_executor().map(task, chunks):
+                results.extend(
+                    _unpack_result(packed, processing_parameters)
+                    for packed in chunk_results
+                )
+        finally:
+            gc.unfreeze()
+
+        logger.debug(f"Parsed {len(results)} {kind} elements in worker processes")
+        return results
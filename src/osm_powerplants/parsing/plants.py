@@ -19,7 +19,11 @@ from osm_powerplants.enhancement.reconstruction import (
     PlantReconstructor,
 )
 from osm_powerplants.models import PlantGeometry, RejectedPlantInfo, Unit
-from osm_powerplants.quality.rejection import RejectionReason, RejectionTracker
+from osm_powerplants.quality.rejection import (
+    RejectionDetails,
+    RejectionReason,
+    RejectionTracker,
+)
 from osm_powerplants.retrieval.client import OverpassAPIClient
 from osm_powerplants.utils import is_valid_unit
 
@@ -73,11 +77,14 @@ class PlantParser(ElementProcessor):
         config : dict
             Processing configuration
         generator_parser : GeneratorParser, optional
-            Parser for member generators
+            Parser for member generators. Its geometry handler is shared, so
+            both parsers use the same memoized geometries.
         """
         super().__init__(
             client,
-            GeometryHandler(client, rejection_tracker),
+            generator_parser.geometry_handler
+            if generator_parser is not None
+            else GeometryHandler(client, rejection_tracker),
             rejection_tracker,
             config,
         )
@@ -149,7 +156,10 @@ class PlantParser(ElementProcessor):
             self.rejection_tracker.add_rejection(
                 element=element,
                 reason=RejectionReason.INVALID_ELEMENT_TYPE,
-                details=f"Expected power type 'plant' but found '{element.get('tags', {}).get('power', 'missing')}'",
+                details=RejectionDetails(
+                    "Expected power type 'plant' but found '{power}'",
+                    power=element.get("tags", {}).get("power", "missing"),
+                ),
                 keywords=element.get("tags", {}).get("power", "missing"),
             )
             return None
@@ -245,7 +255,7 @@ class PlantParser(ElementProcessor):
                     return None
             else:
                 return None
-        if members_and_capacities and processed_elements:
+        if members_and_capacities and processed_elements is not None:
             for elem, _ in members_and_capacities:
                 processed_elements.add(f"{elem['type']}/{elem['id']}")
 
@@ -264,14 +274,14 @@ class PlantParser(ElementProcessor):
         )
 
     def _get_member_element(self, member: dict[str, Any]) -> dict[str, Any] | None:
-        """Retrieve member element data from cache."""
+        """Retrieve member element data from the element index or cache."""
         member_type = member["type"]
         member_id = member["ref"]
 
         if member_type == "node":
-            return self.client.cache.get_node(member_id)
+            return self.elements.get_node(member_id)
         elif member_type == "way":
-            return self.client.cache.get_way(member_id)
+            return self.elements.get_way(member_id)
         elif member_type == "relation":
             return None
 
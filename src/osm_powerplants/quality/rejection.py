@@ -10,14 +10,19 @@ helping to identify data quality issues and generate reports for
 OpenStreetMap contributors to improve the data.
 
 Key components:
+    RejectionDetails: Detail message rendered only when it is read
     RejectedElement: Data structure for a single rejection
     RejectionTracker: Main tracking and analysis system
 """
 
 import json
 import logging
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
@@ -27,6 +32,62 @@ from osm_powerplants.utils import standardize_country_name
 
 logger = logging.getLogger(__name__)
 
+REJECTION_LEVELS = ("off", "counts", "sampled", "full")
+
+_standardize_country = lru_cache(maxsize=1024)(standardize_country_name)
+
+
+class RejectionDetails:
+    """Detail message of a rejection, rendered when it is first read.
+
+    Keeps a format template and references to the values, so that messages
+    embedding large values such as a whole tag dict are only built when a
+    report needs them.
+
+    Attributes
+    ----------
+    template : str
+        :meth:`str.format` template with named fields
+    values : dict
+        Values for the template fields
+
+    Examples
+    --------
+    >>> details = RejectionDetails("tags: {tags}", tags={"power": "plant"})
+    >>> str(details)
+    "tags: {'power': 'plant'}"
+    """
+
+    __slots__ = ("template", "values", "_text")
+
+    def __init__(self, template: str, **values: Any):
+        self.template = template
+        self.values = values
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.template.format(**self.values)
+        return self._text
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RejectionDetails):
+            return self.template == other.template and self.values == other.values
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.template)
+
+    def __getstate__(self) -> tuple[str, dict[str, Any]]:
+        return self.template, self.values
+
+    def __setstate__(self, state: tuple[str, dict[str, Any]]) -> None:
+        self.template, self.values = state
+        self._text = None
+
 
 @dataclass
 class RejectedElement:
@@ -45,8 +106,9 @@ class RejectedElement:
         Type of OSM element (node, way, relation)
     reason : RejectionReason
         Reason for rejection
-    details : str, optional
-        Additional details about the rejection
+    details : str or RejectionDetails, optional
+        Additional details about the rejection. Use :attr:`details_text`
+        for the rendered message.
     keywords : str
         Keywords from the rejected value (default: "none")
     timestamp : datetime, optional
@@ -65,7 +127,7 @@ class RejectedElement:
     element_id: str
     element_type: ElementType
     reason: RejectionReason
-    details: str | None = None
+    details: str | RejectionDetails | None = None
     keywords: str = "none"
     timestamp: datetime | None = None
     url: str | None = None
@@ -81,6 +143,11 @@ class RejectedElement:
             if "cluster" not in self.id:
                 self.url = f"https://www.openstreetmap.org/{self.id}"
 
+    @property
+    def details_text(self) -> str:
+        """Rendered detail message, empty if there are no details."""
+        return "" if self.details is None else str(self.details)
+
 
 class RejectionTracker:
     """Tracks and analyzes rejected OSM elements.
@@ -91,8 +158,14 @@ class RejectionTracker:
 
     Attributes
     ----------
+    level : {'off', 'counts', 'sampled', 'full'}
+        How much is recorded. ``off`` records nothing, ``counts`` only the
+        reasons per element, ``sampled`` full records for a deterministic
+        share of elements and reasons for all, ``full`` every record.
+    sample_rate : float
+        Share of elements with full records at the ``sampled`` level
     rejected_elements : dict[str, list[RejectedElement]]
-        Rejected elements grouped by ID
+        Full rejection records grouped by ID
     ids : set[str]
         Set of all rejection IDs for quick lookup
 
@@ -112,9 +185,53 @@ class RejectionTracker:
     Missing capacity tag: 1 (100.0%)
     """
 
-    def __init__(self):
+    def __init__(self, level: str = "full", sample_rate: float = 0.1):
+        """Initialize the tracker.
+
+        Parameters
+        ----------
+        level : {'off', 'counts', 'sampled', 'full'}
+            Recording level
+        sample_rate : float
+            Share of elements with full records at the ``sampled`` level
+        """
+        if level not in REJECTION_LEVELS:
+            raise ValueError(
+                f"Invalid rejection level '{level}', expected one of {REJECTION_LEVELS}"
+            )
+        self.level = level
+        self.sample_rate = sample_rate
         self.rejected_elements: dict[str, list[RejectedElement]] = {}
         self.ids: set[str] = set()
+        self._captured: list[RejectedElement] | None = None
+        # Rejections already recorded per ID, see _key
+        self._seen: dict[str, set[tuple]] = {}
+        # Reasons per ID at the counts and sampled levels
+        self._reasons: dict[str, list[RejectionReason]] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "RejectionTracker":
+        """Create a tracker with the ``rejection_tracking`` configuration.
+
+        Parameters
+        ----------
+        config : dict
+            Processing configuration
+
+        Returns
+        -------
+        RejectionTracker
+            Tracker with the configured level and sample rate
+        """
+        tracking_config = config.get("rejection_tracking") or {}
+        return cls(
+            level=tracking_config.get("level", "full"),
+            sample_rate=tracking_config.get("sample_rate", 0.1),
+        )
+
+    def _is_sampled(self, identification: str) -> bool:
+        """Decide deterministically whether an element keeps full records."""
+        return zlib.crc32(identification.encode()) < self.sample_rate * 2**32
 
     def add_rejection(
         self,
@@ -143,8 +260,9 @@ class RejectionTracker:
             Element type (required if element not provided)
         reason : RejectionReason, optional
             Reason for rejection (required)
-        details : str, optional
-            Additional details about rejection
+        details : str or RejectionDetails, optional
+            Additional details about rejection. Pass
+            :class:`RejectionDetails` for messages built from large values.
         keywords : str
             Keywords from rejected value
         coordinates : tuple[float, float], optional
@@ -159,6 +277,11 @@ class RejectionTracker:
         ValueError
             If required parameters are missing
         """
+        # Captured rejections are kept whatever the level, as they may be
+        # recorded later by a tracker with another level
+        if self.level == "off" and self._captured is None:
+            return
+
         if element is not None:
             element_id = element.get("id") if element_id is None else element_id
             element_type = element.get("type") if element_type is None else element_type
@@ -184,6 +307,13 @@ class RejectionTracker:
 
         identification = f"{element_type}/{element_id}"
 
+        if self._captured is None and (
+            self.level == "counts"
+            or (self.level == "sampled" and not self._is_sampled(identification))
+        ):
+            self._record(identification, self._key(reason, details, keywords), None)
+            return
+
         rejected = RejectedElement(
             id=identification,
             element_id=element_id,
@@ -192,46 +322,141 @@ class RejectionTracker:
             details=details,
             keywords=keywords,
             coordinates=coordinates,
-            country=standardize_country_name(country) if country else None,
+            country=_standardize_country(country) if country else None,
             unit_type=unit_type,
         )
 
-        if identification not in self.rejected_elements:
-            self.rejected_elements[identification] = []
+        self.add_rejected_element(rejected)
 
-        duplicate_found = False
-        for existing_rejection in self.rejected_elements[identification]:
-            if (
-                existing_rejection.reason == reason
-                and existing_rejection.details == details
-                and existing_rejection.keywords == keywords
-            ):
-                duplicate_found = True
-                logger.debug(
-                    f"Duplicate rejection ignored for {identification}: {reason.value}"
-                )
-                break
+    def add_rejected_element(self, rejected: RejectedElement) -> None:
+        """Record a prepared rejection, ignoring exact duplicates.
 
-        if not duplicate_found:
-            self.rejected_elements[identification].append(rejected)
-            self.ids.add(rejected.id)
+        Parameters
+        ----------
+        rejected : RejectedElement
+            Rejection to record
+        """
+        if self._captured is not None:
+            self._captured.append(rejected)
+            return
+
+        if self.level == "off":
+            return
+
+        keep_record = self.level == "full" or (
+            self.level == "sampled" and self._is_sampled(rejected.id)
+        )
+        if keep_record:
+            key = (rejected.reason, rejected.details, rejected.keywords)
+            self._record(rejected.id, key, rejected)
+        else:
+            key = self._key(rejected.reason, rejected.details, rejected.keywords)
+            self._record(rejected.id, key, None)
+
+    @staticmethod
+    def _key(
+        reason: RejectionReason,
+        details: str | RejectionDetails | None,
+        keywords: str,
+    ) -> tuple:
+        """Get the key of a rejection recorded without its full record.
+
+        Only a checksum of the details is kept, so neither detail messages
+        nor the values they are built from outlive the call.
+        """
+        checksum = None if details is None else zlib.crc32(str(details).encode())
+        return reason, checksum, keywords
+
+    def _record(
+        self,
+        identification: str,
+        key: tuple,
+        rejected: RejectedElement | None,
+    ) -> None:
+        """Record a rejection unless the same one exists for the element.
+
+        ``key`` is ``(reason, details, keywords)`` for full records and
+        :meth:`_key` for rejections kept only as reasons.
+        """
+        reason = key[0]
+        seen = self._seen.setdefault(identification, set())
+        if key in seen:
+            logger.debug(
+                f"Duplicate rejection ignored for {identification}: {reason.value}"
+            )
+            return
+        seen.add(key)
+        self.ids.add(identification)
+
+        if self.level != "full":
+            self._reasons.setdefault(identification, []).append(reason)
+        if rejected is not None:
+            self.rejected_elements.setdefault(identification, []).append(rejected)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            details = rejected.details_text if rejected is not None else ""
             logger.debug(
-                f"Rejected element {element_id}: {reason.value} - {details or ''}"
+                f"Rejected element {identification}: {reason.value} - {details}"
             )
 
+    def merge(self, other: "RejectionTracker") -> None:
+        """Record the rejections of another tracker.
+
+        Used to combine trackers filled in separate processes. Elements
+        are recorded in the order of ``other``, so merging trackers in a
+        fixed order gives the same result as recording into one tracker.
+
+        Parameters
+        ----------
+        other : RejectionTracker
+            Tracker whose rejections are added
+        """
+        if self.level == "off":
+            return
+
+        for identification, seen in other._seen.items():
+            records = other.rejected_elements.get(identification, [])
+            for rejected in records:
+                self.add_rejected_element(rejected)
+            # Rejections kept only as reasons at the counts and sampled levels
+            recorded = {
+                (rejected.reason, rejected.details, rejected.keywords)
+                for rejected in records
+            }
+            for key in sorted(
+                seen - recorded, key=lambda key: (key[0].value, str(key[1]), key[2])
+            ):
+                self._record(identification, key, None)
+
+    @contextmanager
+    def capture(self) -> Iterator[list[RejectedElement]]:
+        """Collect new rejections in a list instead of recording them.
+
+        Yields
+        ------
+        list[RejectedElement]
+            Rejections added while the context is active, in order. They
+            can be recorded later with :meth:`add_rejected_element`.
+        """
+        previous = self._captured
+        self._captured = []
+        try:
+            yield self._captured
+        finally:
+            self._captured = previous
+
     def delete_rejection(self, id: str) -> bool:
         """Delete a rejection by ID."""
-        success = False
-        if id in self.rejected_elements:
-            del self.rejected_elements[id]
-            success = True
+        success = id in self.ids
+        if success:
+            self.ids.remove(id)
+            self.rejected_elements.pop(id, None)
+            self._reasons.pop(id, None)
+            self._seen.pop(id, None)
             logger.debug(f"Removed rejection with ID: {id}")
         else:
             logger.debug(f"Rejection with ID {id} not found for removal.")
 
-        if id in self.ids:
-            self.ids.remove(id)
-
         return success
 
     def delete_for_units(self, units: list[Unit]) -> int:
@@ -270,16 +495,22 @@ class RejectionTracker:
             Mapping of rejection reason to count
         """
         summary = {}
-        for rejections in self.rejected_elements.values():
-            for rejection in rejections:
-                reason_value = rejection.reason.value
-                summary[reason_value] = summary.get(reason_value, 0) + 1
+        if self.level == "full":
+            reasons = (
+                [rejection.reason for rejection in rejections]
+                for rejections in self.rejected_elements.values()
+            )
+        else:
+            reasons = self._reasons.values()
+        for element_reasons in reasons:
+            for reason in element_reasons:
+                summary[reason.value] = summary.get(reason.value, 0) + 1
 
         return summary
 
     def get_total_count(self) -> int:
         """Get total number of rejected elements."""
-        return len(self.rejected_elements)
+        return len(self.ids)
 
     def get_summary_string(self) -> str:
         """Generate human-readable summary of rejections.
@@ -416,7 +647,7 @@ class RejectionTracker:
                     "type": rejection.reason.value,
                     "osm_element": f"https://www.openstreetmap.org/{rejection.id}",
                     "rejection_reason": rejection.reason.value,
-                    "rejection_details": rejection.details or "",
+                    "rejection_details": rejection.details_text,
                     "rejection_keywords": rejection.keywords or "none",
                     "timestamp": rejection.timestamp.isoformat()
                     if rejection.timestamp
@@ -524,7 +755,7 @@ class RejectionTracker:
                         "unit_type": rejection.unit_type,
                         "reason": rejection.reason.value,
                         "keywords": rejection.keywords,
-                        "details": rejection.details if rejection.details else "",
+                        "details": rejection.details_text,
                         "timestamp": rejection.timestamp,
                         "url": rejection.url,
                         "lat": lat,
@@ -0,0 +1,384 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Offline country boundary index for coordinate-to-country resolution.
+
+This module keeps national (admin_level=2) boundary polygons on disk and
+answers point-in-country queries locally through a spatial index, so that
+assigning elements to countries does not require one Overpass request per
+coordinate.
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+import diskcache
+import numpy as np
+import shapely
+from shapely.errors import ShapelyError
+from shapely.geometry import LineString
+from shapely.geometry.base import BaseGeometry
+from shapely.ops import polygonize, unary_union
+from shapely.strtree import STRtree
+
+from osm_powerplants.enhancement.rings import (
+    assemble_area,
+    rings_to_polygons,
+    stitch_rings,
+)
+
+if TYPE_CHECKING:
+    from .client import OverpassAPIClient
+
+logger = logging.getLogger(__name__)
+
+_COVERAGE_KEY = "__coverage__"
+
+
+def boundary_geometry_from_relation(relation: dict) -> BaseGeometry | None:
+    """Build a boundary polygon from a relation returned with ``out geom``.
+
+    Parameters
+    ----------
+    relation : dict
+        Boundary relation whose way members carry inline ``geometry``
+
+    Returns
+    -------
+    BaseGeometry or None
+        Polygon or MultiPolygon of the area, None if no ring could be formed
+
+    Notes
+    -----
+    Member ways are stitched into outer and inner rings with
+    :func:`~osm_powerplants.enhancement.rings.stitch_rings`; segments that
+    do not close into a ring are polygonized. Inner areas are removed from
+    the outer area, and outer rings nested inside inner rings (islands in
+    lakes) are added back.
+    """
+    outer_lines: list[list[tuple[float, float]]] = []
+    inner_lines: list[list[tuple[float, float]]] = []
+
+    for member in relation.get("members", []):
+        if member.get("type") != "way":
+            continue
+        coords = [
+            (point["lon"], point["lat"])
+            for point in member.get("geometry") or []
+            if point
+        ]
+        if len(coords) < 2:
+            continue
+        if member.get("role") == "inner":
+            inner_lines.append(coords)
+        else:
+            outer_lines.append(coords)
+
+    if not outer_lines:
+        return None
+
+    try:
+        geometry = assemble_area(_faces(outer_lines), _faces(inner_lines))
+    except ShapelyError as e:
+        logger.warning(
+            f"Could not build boundary geometry for relation {relation.get('id')}: {e}"
+        )
+        return None
+
+    return geometry
+
+
+def _faces(lines: list[list[tuple[float, float]]]) -> list[BaseGeometry]:
+    """Polygons of stitched rings plus the faces formed by leftover lines."""
+    rings, leftover = stitch_rings(lines)
+    faces: list[BaseGeometry] = rings_to_polygons(rings)
+    if leftover:
+        faces.extend(
+            polygonize(
+                unary_union([LineString(lines[position]) for position in leftover])
+            )
+        )
+    return faces
+
+
+class CountryBoundaryIndex:
+    """Disk-backed spatial index of national boundaries.
+
+    Boundary polygons are stored as WKB keyed by ISO 3166-1 code and are
+    downloaded at most once. Lookups run against an STRtree of prepared
+    geometries and never touch the network.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory holding the boundary store
+    store : diskcache.Cache
+        Persistent WKB storage keyed by country code
+
+    Examples
+    --------
+    >>> index = CountryBoundaryIndex(cache_dir)
+    >>> index.ensure_bbox(client, 49.0, 5.7, 50.2, 6.6)
+    >>> index.lookup_many([49.6, 50.1], [6.1, 6.0])
+    array(['LU', 'BE'], dtype=object)
+    """
+
+    def __init__(self, cache_dir: str):
+        """Initialize index and load stored boundaries.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Directory for the boundary store
+        """
+        self.cache_dir = cache_dir
+        self.store = diskcache.Cache(directory=f"{cache_dir}/boundaries_dc")
+
+        self._geometries: dict[str, BaseGeometry] = {}
+        self._tree: STRtree | None = None
+        self._tree_codes = np.empty(0, dtype=object)
+        self._tree_geometries = np.empty(0, dtype=object)
+
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    def __contains__(self, country_code: str) -> bool:
+        return country_code in self._geometries
+
+    @property
+    def countries(self) -> list[str]:
+        """Country codes with a stored boundary."""
+        return sorted(self._geometries)
+
+    def close(self) -> None:
+        """Close the boundary store."""
+        try:
+            self.store.close()
+        except Exception as e:
+            logger.debug(f"Error closing boundary store: {e}")
+
+    def load(self) -> None:
+        """Load all stored boundaries from disk."""
+        for key in self.store.iterkeys():
+            if key == _COVERAGE_KEY:
+                continue
+            try:
+                self._geometries[key] = shapely.from_wkb(self.store[key])
+            except (KeyError, ShapelyError) as e:
+                logger.warning(f"Failed to load boundary for {key}: {e}")
+        self._tree = None
+
+        if self._geometries:
+            logger.debug(f"Loaded {len(self._geometries)} country boundaries")
+
+    def add(self, country_code: str, geometry: BaseGeometry) -> None:
+        """Add or replace a country boundary and persist it.
+
+        Parameters
+        ----------
+        country_code : str
+            ISO 3166-1 alpha-2 code
+        geometry : BaseGeometry
+            Boundary polygon in lon/lat
+        """
+        self._geometries[country_code] = geometry
+        self.store.set(country_code, shapely.to_wkb(geometry))
+        self._tree = None
+
+    def is_covered(self, south: float, west: float, north: float, east: float) -> bool:
+        """Check whether a bounding box lies within an already fetched area."""
+        for c_south, c_west, c_north, c_east in self.store.get(_COVERAGE_KEY, []):
+            if (
+                c_south <= south
+                and c_west <= west
+                and c_north >= north
+                and c_east >= east
+            ):
+                return True
+        return False
+
+    def ensure_bbox(
+        self,
+        client: "OverpassAPIClient",
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+    ) -> bool:
+        """Download boundaries of all countries overlapping a bounding box.
+
+        Parameters
+        ----------
+        client : OverpassAPIClient
+            Client used for the one-off download
+        south, west, north, east : float
+            Bounding box in degrees
+
+        Returns
+        -------
+        bool
+            True if the area is covered by the index
+        """
+        if self.is_covered(south, west, north, east):
+            return True
+
+        # Border ways inside the box catch partially covered countries, the
+        # is_in lookup catches a country that fully contains the box.
+        center_lat = (south + north) / 2
+        center_lon = (west + east) / 2
+        query = f"""
+        [out:json][timeout:{client.timeout}];
+        is_in({center_lat},{center_lon})->.a;
+        (
+            relation["boundary"="administrative"]["admin_level"="2"]["ISO3166-1"]({south},{west},{north},{east});
+            relation(pivot.a)["admin_level"="2"]["ISO3166-1"];
+        );
+        out geom;
+        """
+
+        logger.info(
+            f"Fetching country boundaries for bbox ({south},{west},{north},{east})"
+        )
+        result = client.query_overpass(query)
+        if "error" in result:
+            return False
+
+        self._add_relations(result.get("elements", []))
+
+        coverage = self.store.get(_COVERAGE_KEY, [])
+        coverage.append((south, west, north, east))
+        self.store.set(_COVERAGE_KEY, coverage)
+        return True
+
+    def ensure_countries(
+        self, client: "OverpassAPIClient", country_codes: list[str]
+    ) -> list[str]:
+        """Download boundaries for countries not yet in the index.
+
+        Parameters
+        ----------
+        client : OverpassAPIClient
+            Client used for the one-off download
+        country_codes : list[str]
+            ISO 3166-1 alpha-2 codes
+
+        Returns
+        -------
+        list[str]
+            Codes still missing after the download
+        """
+        missing = [code for code in country_codes if code not in self._geometries]
+        if not missing:
+            return []
+
+        codes_regex = "|".join(sorted(missing))
+        query = f"""
+        [out:json][timeout:{client.timeout}];
+        relation["boundary"="administrative"]["admin_level"="2"]["ISO3166-1"~"^({codes_regex})$"];
+        out geom;
+        """
+
+        logger.info(f"Fetching country boundaries for {', '.join(sorted(missing))}")
+        result = client.query_overpass(query)
+        if "error" in result:
+            return missing
+
+        self._add_relations(result.get("elements", []))
+
+        return [code for code in missing if code not in self._geometries]
+
+    def _add_relations(self, relations: list[dict]) -> None:
+        """Build and store boundaries from downloaded relations."""
+        for relation in relations:
+            country_code = relation.get("tags", {}).get("ISO3166-1")
+            if not country_code:
+                continue
+            geometry = boundary_geometry_from_relation(relation)
+            if geometry is None:
+                logger.warning(f"Could not build boundary polygon for {country_code}")
+                continue
+            self.add(country_code, geometry)
+
+    def _get_tree(self) -> STRtree | None:
+        """Build the STRtree over prepared boundaries on first use."""
+        if self._tree is None and self._geometries:
+            codes = sorted(self._geometries)
+            geometries = np.array([self._geometries[c] for c in codes], dtype=object)
+            shapely.prepare(geometries)
+            self._tree_codes = np.array(codes, dtype=object)
+            self._tree_geometries = geometries
+            self._tree = STRtree(geometries)
+        return self._tree
+
+    def lookup(self, lat: float, lon: float) -> str | None:
+        """Get the country code containing a coordinate.
+
+        Parameters
+        ----------
+        lat : float
+            Latitude
+        lon : float
+            Longitude
+
+        Returns
+        -------
+        str or None
+            ISO country code, None if outside all indexed boundaries
+        """
+        return self.lookup_many([lat], [lon])[0]
+
+    def lookup_many(self, lats, lons) -> np.ndarray:
+        """Get country codes for many coordinates at once.
+
+        Parameters
+        ----------
+        lats : array-like
+            Latitudes
+        lons : array-like
+            Longitudes
+
+        Returns
+        -------
+        np.ndarray
+            Object array of ISO country codes, None where unresolved
+
+        Notes
+        -----
+        Candidates come from an envelope query on the STRtree and are
+        confirmed with ``contains_xy`` on prepared geometries. If a point
+        falls into several boundaries, the alphabetically first code wins.
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        result = np.full(len(lats), None, dtype=object)
+
+        tree = self._get_tree()
+        if tree is None or len(lats) == 0:
+            return result
+
+        valid = np.flatnonzero(np.isfinite(lats) & np.isfinite(lons))
+        if len(valid) == 0:
+            return result
+
+        point_idx, geom_idx = tree.query(shapely.points(lons[valid], lats[valid]))
+        if len(point_idx) == 0:
+            return result
+
+        point_idx = valid[point_idx]
+        hits = shapely.contains_xy(
+            self._tree_geometries[geom_idx], lons[point_idx], lats[point_idx]
+        )
+        point_idx = point_idx[hits]
+        geom_idx = geom_idx[hits]
+
+        order = np.lexsort((geom_idx, point_idx))
+        point_idx = point_idx[order]
+        geom_idx = geom_idx[order]
+        _, first = np.unique(point_idx, return_index=True)
+        result[point_idx[first]] = self._tree_codes[geom_idx[first]]
+
+        return result
@@ -13,15 +13,34 @@ by storing data locally in JSON format.
 import gc
 import json
 import logging
+import math
 import os
+import threading
 from functools import lru_cache
 
 import diskcache
 
 from osm_powerplants.models import Unit
 
+from .elements import compact_elements, to_json
+
 logger = logging.getLogger(__name__)
 
+# Seconds after which a lock left by a crashed process is released
+_SAVE_LOCK_EXPIRE = 600
+
+
+def _write_json(path: str, data: dict) -> None:
+    """Write JSON atomically so readers never see a partial file."""
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "w") as f:
+            json.dump(data, f, indent=2, default=to_json)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
 
 class ElementCache:
     """Multi-level cache for OSM elements and processed units.
@@ -46,11 +65,27 @@ class ElementCache:
         Relation ID to element mapping
     units_cache : dict[str, list[Unit]]
         Country code to processed units mapping
+    compact_elements : bool
+        Whether plant and generator elements are held as compact elements
     *_modified : bool
         Flags tracking which caches have unsaved changes
+
+    Notes
+    -----
+    Several processes may share one cache directory. Country caches are
+    saved under a lock shared through the node cache, and only the
+    countries stored by this instance overwrite the entries on disk, so
+    countries saved by other processes in the meantime are kept.
+
+    With ``compact_elements``, plant and generator elements are converted
+    to :class:`~osm_powerplants.retrieval.elements.OSMElement` when they
+    are loaded or stored, so the element dicts are not kept, and written
+    back as plain dicts when the caches are saved.
     """
 
-    def __init__(self, cache_dir: str, cache_size_gb: int = 12):
+    def __init__(
+        self, cache_dir: str, cache_size_gb: int = 12, compact_elements: bool = False
+    ):
         """Initialize cache with specified directory.
 
         Parameters
@@ -59,8 +94,11 @@ class ElementCache:
             Directory path for cache files
         cache_size_gb : int
             Total cache size limit in GB
+        compact_elements : bool
+            Hold plant and generator elements as compact elements
         """
         self.cache_dir = cache_dir
+        self.compact_elements = compact_elements
         os.makedirs(cache_dir, exist_ok=True)
 
         # Country-specific caches (keep as dicts - small)
@@ -91,6 +129,15 @@ class ElementCache:
         self.plants_modified = False
         self.generators_modified = False
         self.units_modified = False
+        # Country codes stored since the last save, per country cache
+        self._stored: dict[str, set[str]] = {
+            "plants": set(),
+            "generators": set(),
+            "units": set(),
+        }
+
+        # Guards country caches when several threads download at once
+        self._lock = threading.RLock()
 
     def close(self):
         """Properly close diskcache connections."""
@@ -132,8 +179,8 @@ class ElementCache:
     def load_all_caches(self) -> None:
         """Load country caches and migrate JSON to diskcache if needed."""
         # Load small country-specific caches
-        self.plants_cache = self._load_cache(self.plants_cache_file)
-        self.generators_cache = self._load_cache(self.generators_cache_file)
+        self.plants_cache = self._load_elements_cache(self.plants_cache_file)
+        self.generators_cache = self._load_elements_cache(self.generators_cache_file)
         self.units_cache = self._load_units_cache(self.units_cache_file)
 
     def save_all_caches(self, force: bool = False) -> None:
@@ -141,22 +188,63 @@ class ElementCache:
         os.makedirs(self.cache_dir, exist_ok=True)
         logger.info(f"Saving country caches to {self.cache_dir}")
 
-        # Only save country-specific caches (small, still use JSON)
-        if self.plants_modified or force:
-            self._save_cache(self.plants_cache_file, self.plants_cache)
-            self.plants_modified = False
-
-        if self.generators_modified or force:
-            self._save_cache(self.generators_cache_file, self.generators_cache)
-            self.generators_modified = False
-
-        if self.units_modified or force:
-            self._save_units_cache(self.units_cache_file, self.units_cache)
-            self.units_modified = False
+        # Other processes may save the same files while this one runs
+        file_lock = diskcache.Lock(
+            self.nodes_cache, "country_caches_lock", expire=_SAVE_LOCK_EXPIRE
+        )
+        with self._lock, file_lock:
+            # Only save country-specific caches (small, still use JSON)
+            if self.plants_modified or force:
+                self.plants_cache = self._merge_saved(
+                    "plants", self._load_elements_cache(self.plants_cache_file), force
+                )
+                self._save_cache(self.plants_cache_file, self.plants_cache)
+                self.plants_modified = False
+
+            if self.generators_modified or force:
+                self.generators_cache = self._merge_saved(
+                    "generators",
+                    self._load_elements_cache(self.generators_cache_file),
+                    force,
+                )
+                self._save_cache(self.generators_cache_file, self.generators_cache)
+                self.generators_modified = False
+
+            if self.units_modified or force:
+                self.units_cache = self._merge_saved(
+                    "units", self._load_units_cache(self.units_cache_file), force
+                )
+                self._save_units_cache(self.units_cache_file, self.units_cache)
+                self.units_modified = False
 
         # Global caches (diskcache) auto-save - no manual action needed
         logger.debug("Global caches (nodes/ways/relations) use diskcache auto-save")
 
+    def _merge_saved(self, name: str, saved: dict, force: bool) -> dict:
+        """Overlay the countries stored by this instance on the saved ones.
+
+        Parameters
+        ----------
+        name : str
+            Country cache name ("plants", "generators" or "units")
+        saved : dict
+            Country cache as currently saved on disk
+        force : bool
+            Overlay every country held in memory, not only stored ones
+
+        Returns
+        -------
+        dict
+            Merged country cache
+        """
+        data = getattr(self, f"{name}_cache")
+        countries = data.keys() if force else self._stored[name]
+        for country_code in countries:
+            if country_code in data:
+                saved[country_code] = data[country_code]
+        self._stored[name] = set()
+        return saved
+
     def _load_cache(self, cache_path: str) -> dict:
         """Load JSON cache file."""
         if os.path.exists(cache_path):
@@ -168,13 +256,25 @@ class ElementCache:
                 return {}
         return {}
 
+    def _load_elements_cache(self, cache_path: str) -> dict:
+        """Load a plants or generators cache file, compacting its elements."""
+        data = self._load_cache(cache_path)
+        for country_data in data.values():
+            self._compact(country_data)
+        return data
+
+    def _compact(self, data: dict) -> dict:
+        """Replace the elements of country data by compact elements in place."""
+        if self.compact_elements and isinstance(data, dict) and "elements" in data:
+            data["elements"] = compact_elements(data["elements"])
+        return data
+
     def _save_cache(self, cache_path: str, data: dict) -> None:
         """Save dictionary to JSON cache file."""
         cache_data = data or {}
         try:
             os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            _write_json(cache_path, cache_data)
             logger.info(f"Successfully saved cache to {cache_path}")
         except Exception as e:
             logger.error(f"Failed to save cache to {cache_path}: {str(e)}")
@@ -204,16 +304,20 @@ class ElementCache:
         if country_code is None:
             logger.error("Attempted to store plants with None country_code")
             return
-        self.plants_cache[country_code] = data
-        self.plants_modified = True
+        with self._lock:
+            self.plants_cache[country_code] = self._compact(data)
+            self.plants_modified = True
+            self._stored["plants"].add(country_code)
 
     def store_generators(self, country_code: str, data: dict) -> None:
         """Store generator data for country."""
         if country_code is None:
             logger.error("Attempted to store generators with None country_code")
             return
-        self.generators_cache[country_code] = data
-        self.generators_modified = True
+        with self._lock:
+            self.generators_cache[country_code] = self._compact(data)
+            self.generators_modified = True
+            self._stored["generators"].add(country_code)
 
     def store_nodes_bulk(self, nodes: list[dict]) -> None:
         """Store multiple nodes at once."""
@@ -257,8 +361,7 @@ class ElementCache:
                 units_data[country] = [unit.to_dict() for unit in units]
 
             os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, "w") as f:
-                json.dump(units_data, f, indent=2)
+            _write_json(cache_path, units_data)
             logger.info(f"Successfully saved units cache to {cache_path}")
         except Exception as e:
             logger.error(f"Failed to save units cache to {cache_path}: {str(e)}")
@@ -291,16 +394,19 @@ class ElementCache:
         if country_code is None:
             logger.error("Attempted to store units with None country_code")
             return
-        self.units_cache[country_code] = units
-        self.units_modified = True
+        with self._lock:
+            self.units_cache[country_code] = units
+            self.units_modified = True
+            self._stored["units"].add(country_code)
 
 
 class CountryCoordinateCache:
     """Cache for determining country from coordinates.
 
-    Uses LRU cache with configurable precision to minimize API calls
-    when determining which country a coordinate belongs to. Includes
-    legacy cache compatibility and tolerance-based lookups.
+    Resolves coordinates through the offline boundary index when one is
+    attached, and otherwise uses an LRU cache with configurable precision
+    to minimize API calls. Includes legacy cache compatibility and
+    tolerance-based lookups backed by a grid hash.
 
     Attributes
     ----------
@@ -312,8 +418,12 @@ class CountryCoordinateCache:
         LRU cached lookup function
     _legacy_cache : dict
         Fallback cache for compatibility
+    _grid : dict
+        Grid cells of size ``10**-precision`` holding legacy cache keys
     _client : OverpassAPIClient
         Client for API queries
+    _boundary_index : CountryBoundaryIndex or None
+        Offline boundary index consulted before any API query
     """
 
     def __init__(self, precision: int = 2, max_size: int = 1000):
@@ -330,12 +440,47 @@ class CountryCoordinateCache:
         self.max_size = max_size
         self._lookup = lru_cache(maxsize=max_size)(self._uncached_lookup)
         self._legacy_cache = {}
+        self._grid: dict[tuple[int, int], list[tuple[int, float, float]]] = {}
+        self._grid_size = 0
         self._client = None
+        self._boundary_index = None
 
     def set_client(self, client):
         """Set the API client for lookups."""
         self._client = client
 
+    def set_boundary_index(self, boundary_index):
+        """Set the offline boundary index used before API lookups."""
+        self._boundary_index = boundary_index
+
+    def _grid_cell(self, lat: float, lon: float) -> tuple[int, int]:
+        """Get the grid cell of a coordinate."""
+        cell_size = 10**-self.precision
+        return (math.floor(lat / cell_size), math.floor(lon / cell_size))
+
+    def _index_legacy(self, key: tuple[float, float]) -> None:
+        """Add a legacy cache key to the grid."""
+        self._grid.setdefault(self._grid_cell(*key), []).append(
+            (self._grid_size, key[0], key[1])
+        )
+        self._grid_size += 1
+
+    def _rebuild_grid(self) -> None:
+        """Rebuild the grid after the legacy cache changed wholesale."""
+        self._grid = {}
+        self._grid_size = 0
+        for key in self._legacy_cache:
+            self._index_legacy(key)
+
+    def _store_legacy(self, key: tuple[float, float], country: str) -> None:
+        """Store a legacy cache entry and keep the grid in sync."""
+        if len(self._legacy_cache) != self._grid_size:
+            self._rebuild_grid()
+        is_new = key not in self._legacy_cache
+        self._legacy_cache[key] = country
+        if is_new:
+            self._index_legacy(key)
+
     def _round_coords(self, lat: float, lon: float) -> tuple[float, float]:
         """Round coordinates to configured precision."""
         return (round(lat, self.precision), round(lon, self.precision))
@@ -385,15 +530,21 @@ class CountryCoordinateCache:
         str or None
             ISO country code
         """
-        rounded_lat, rounded_lon = self._round_coords(lat, lon)
-        country = self._lookup((rounded_lat, rounded_lon))
+        country = None
+        if self._boundary_index is not None:
+            country = self._boundary_index.lookup(lat, lon)
+
+        if country is None:
+            rounded_lat, rounded_lon = self._round_coords(lat, lon)
+            country = self._lookup((rounded_lat, rounded_lon))
 
         if country:
-            self._legacy_cache[(lat, lon)] = country
+            self._store_legacy((lat, lon), country)
 
             if len(self._legacy_cache) > 1000:
                 items = list(self._legacy_cache.items())
                 self._legacy_cache = dict(items[-500:])
+                self._rebuild_grid()
 
         return country
 
@@ -420,11 +571,36 @@ class CountryCoordinateCache:
         if country:
             return country
 
-        for (cached_lat, cached_lon), cached_country in self._legacy_cache.items():
-            if abs(lat - cached_lat) < tolerance and abs(lon - cached_lon) < tolerance:
-                return cached_country
+        if len(self._legacy_cache) != self._grid_size:
+            self._rebuild_grid()
 
-        return None
+        cell_size = 10**-self.precision
+        lat_cells = range(
+            math.floor((lat - tolerance) / cell_size),
+            math.floor((lat + tolerance) / cell_size) + 1,
+        )
+        lon_cells = range(
+            math.floor((lon - tolerance) / cell_size),
+            math.floor((lon + tolerance) / cell_size) + 1,
+        )
+
+        # Earliest inserted match wins, as in a scan of the legacy cache
+        best = None
+        for lat_cell in lat_cells:
+            for lon_cell in lon_cells:
+                for order, cached_lat, cached_lon in self._grid.get(
+                    (lat_cell, lon_cell), []
+                ):
+                    if (
+                        abs(lat - cached_lat) < tolerance
+                        and abs(lon - cached_lon) < tolerance
+                        and (best is None or order < best[0])
+                    ):
+                        best = (order, cached_lat, cached_lon)
+
+        if best is None:
+            return None
+        return self._legacy_cache[(best[1], best[2])]
 
     def items(self):
         """Get legacy cache items."""
@@ -434,7 +610,7 @@ class CountryCoordinateCache:
         return self._legacy_cache[key]
 
     def __setitem__(self, key, value):
-        self._legacy_cache[key] = value
+        self._store_legacy(key, value)
 
     def __len__(self):
         return len(self._legacy_cache)
@@ -463,3 +639,4 @@ class CountryCoordinateCache:
         """Clear all caches."""
         self._lookup.cache_clear()
         self._legacy_cache.clear()
+        self._rebuild_grid()
@@ -20,6 +20,7 @@ from tqdm import tqdm
 from osm_powerplants.core import get_config
 from osm_powerplants.utils import get_country_code, get_osm_cache_paths
 
+from .boundaries import CountryBoundaryIndex
 from .cache import CountryCoordinateCache, ElementCache
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,8 @@ class OverpassAPIClient:
         Delay between retries in seconds
     show_progress : bool
         Whether to show progress bars
+    boundary_index : CountryBoundaryIndex
+        Offline country boundaries for coordinate lookups
     _country_cache : CountryCoordinateCache
         Cache for country coordinate lookups
 
@@ -67,6 +70,7 @@ class OverpassAPIClient:
         cache_size_gb: int = 12,
         show_progress: bool = True,
         country_cache: Union[dict, "CountryCoordinateCache"] | None = None,
+        compact_elements: bool = False,
     ):
         """Initialize the Overpass API client.
 
@@ -88,14 +92,19 @@ class OverpassAPIClient:
             Show progress bars during downloads
         country_cache : dict or CountryCoordinateCache, optional
             Country coordinate cache
+        compact_elements : bool
+            Hold cached plant and generator elements as compact elements
         """
         if cache_dir is None:
             config = get_config()
             cache_dir, _ = get_osm_cache_paths(config)
 
         self.api_url = api_url or "https://overpass-api.de/api/interpreter"
-        self.cache = ElementCache(cache_dir, cache_size_gb=cache_size_gb)
+        self.cache = ElementCache(
+            cache_dir, cache_size_gb=cache_size_gb, compact_elements=compact_elements
+        )
         self.cache.load_all_caches()
+        self.boundary_index = CountryBoundaryIndex(cache_dir)
 
         self.timeout = timeout
         self.max_retries = max_retries
@@ -109,9 +118,11 @@ class OverpassAPIClient:
         else:
             self._country_cache = CountryCoordinateCache(precision=2, max_size=1000)
             if isinstance(country_cache, dict):
-                self._country_cache._legacy_cache.update(country_cache)
+                for coords, country_code in country_cache.items():
+                    self._country_cache[coords] = country_code
 
         self._country_cache.set_client(self)
+        self._country_cache.set_boundary_index(self.boundary_index)
 
     def __enter__(self):
         return self
@@ -136,6 +147,8 @@ class OverpassAPIClient:
 
                 # Close diskcache connections
                 self.cache.close()
+                if hasattr(self, "boundary_index"):
+                    self.boundary_index.close()
                 logger.debug("Closed all cache connections")
 
             except Exception as e:
@@ -379,7 +392,8 @@ out count;"""
         for element in data.get("elements", []):
             element["_country"] = country_code
 
-        self.cache.store_plants(country_code, data)
+        if "error" not in data:
+            self.cache.store_plants(country_code, data)
 
         return data
 
@@ -428,7 +442,8 @@ out count;"""
         for element in data.get("elements", []):
             element["_country"] = country_code
 
-        self.cache.store_generators(country_code, data)
+        if "error" not in data:
+            self.cache.store_generators(country_code, data)
 
         return data
 
@@ -661,7 +676,11 @@ out count;"""
         )
 
     def get_country_data(
-        self, country: str, force_refresh: bool = False, plants_only: bool = False
+        self,
+        country: str,
+        force_refresh: bool = False,
+        plants_only: bool = False,
+        show_progress: bool | None = None,
     ) -> tuple[dict, dict]:
         """Get all power infrastructure data for a country.
 
@@ -673,6 +692,8 @@ out count;"""
             Skip cache and download fresh data
         plants_only : bool
             Only download plants, not generators
+        show_progress : bool, optional
+            Override the client's progress setting for this call
 
         Returns
         -------
@@ -698,8 +719,11 @@ out count;"""
             logger.error(f"Invalid country name: {country}")
             return {"elements": []}, {"elements": []}
 
+        if show_progress is None:
+            show_progress = self.show_progress
+
         pbar = None
-        if self.show_progress:
+        if show_progress:
             logger.info(f"Counting elements in {country}...")
             counts = self.count_country_elements(
                 country, "plants" if plants_only else "both"
@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Compact in-memory representation of OSM elements.
+
+OSM elements are loaded as plain JSON dicts, each with its own tag dict.
+For countries with millions of generators these dicts dominate memory.
+This module provides slot-based replacements that behave like the dicts
+they replace, so parsers and the geometry handler use them unchanged:
+
+- :class:`TagMap` stores tag values in a tuple and shares the key layout
+  with every other tag map that has the same keys in the same order.
+- :class:`OSMElement` keeps the common element fields in slots.
+
+Tag values repeated within a batch of elements (sources, methods, power
+types) are stored once.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Key layouts shared by tag maps, keyed by the tuple of tag keys
+_KEY_LAYOUTS: dict[tuple[str, ...], dict[str, int]] = {}
+_MAX_KEY_LAYOUTS = 100_000
+
+
+def _key_layout(keys: tuple[str, ...]) -> dict[str, int]:
+    layout = _KEY_LAYOUTS.get(keys)
+    if layout is None:
+        layout = {key: position for position, key in enumerate(keys)}
+        if len(_KEY_LAYOUTS) < _MAX_KEY_LAYOUTS:
+            _KEY_LAYOUTS[keys] = layout
+    return layout
+
+
+class TagMap(Mapping):
+    """Read-only mapping of OSM tags with a shared key layout.
+
+    Compares equal to a dict with the same items and renders like one.
+
+    Parameters
+    ----------
+    tags : mapping
+        Tag keys and values
+    values : dict[str, str], optional
+        Table of already seen values, used to store repeated values once
+
+    Examples
+    --------
+    >>> tags = TagMap({"power": "generator", "generator:source": "solar"})
+    >>> tags["generator:source"]
+    'solar'
+    >>> tags == {"power": "generator", "generator:source": "solar"}
+    True
+    """
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, tags: Mapping[str, Any], values: dict[str, str] | None = None):
+        self._layout = _key_layout(tuple(tags))
+        if values is None:
+            self._values = tuple(tags.values())
+        else:
+            self._values = tuple(
+                values.setdefault(value, value) if isinstance(value, str) else value
+                for value in tags.values()
+            )
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._layout[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        position = self._layout.get(key)
+        return default if position is None else self._values[position]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._layout
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __reduce__(self) -> tuple:
+        return TagMap, (dict(self),)
+
+
+# Element fields held in slots, in the order they are iterated
+_FIELDS = ("type", "id", "lat", "lon", "tags", "nodes", "members")
+_PRIVATE_FIELDS = ("_country", "_lat", "_lon")
+_SLOT_FIELDS = frozenset(_FIELDS + _PRIVATE_FIELDS)
+
+
+class OSMElement(MutableMapping):
+    """Slot-based OSM element that behaves like the element dict.
+
+    Common fields (``type``, ``id``, ``lat``, ``lon``, ``tags``, ``nodes``,
+    ``members`` and the private ``_country``, ``_lat`` and ``_lon``) live
+    in slots; any other key is kept in a small overflow dict. Missing
+    fields are absent keys, exactly as in the original dict.
+
+    Examples
+    --------
+    >>> element = OSMElement({"type": "node", "id": 1, "lat": 35.9, "lon": 14.4})
+    >>> element["_country"] = "MT"
+    >>> "nodes" in element
+    False
+    """
+
+    __slots__ = _FIELDS + _PRIVATE_FIELDS + ("_extra",)
+
+    def __init__(
+        self,
+        element: Mapping[str, Any] | None = None,
+        values: dict[str, str] | None = None,
+    ):
+        """Create an element from an element dict.
+
+        Parameters
+        ----------
+        element : mapping, optional
+            OSM element as returned by the Overpass API
+        values : dict[str, str], optional
+            Table of already seen tag values, shared across elements
+        """
+        self._extra: dict[str, Any] | None = None
+        for key, value in (element or {}).items():
+            if key == "tags" and isinstance(value, Mapping):
+                value = TagMap(value, values)
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOT_FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _SLOT_FIELDS:
+            return getattr(self, key, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _SLOT_FIELDS:
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _SLOT_FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in _SLOT_FIELDS:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in _FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+        for key in _PRIVATE_FIELDS:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert back to a plain element dict with a plain tag dict."""
+        element = dict(self)
+        if "tags" in element:
+            element["tags"] = dict(element["tags"])
+        return element
+
+
+def compact_elements(elements: Iterable[Mapping[str, Any]]) -> list[OSMElement]:
+    """Convert element dicts to compact elements.
+
+    Parameters
+    ----------
+    elements : iterable of mapping
+        OSM elements, e.g. the ``elements`` of a plants or generators query
+
+    Returns
+    -------
+    list[OSMElement]
+        Compact elements in the same order. Tag values are shared between
+        the elements of one call.
+    """
+    values: dict[str, str] = {}
+    return [
+        element if isinstance(element, OSMElement) else OSMElement(element, values)
+        for element in elements
+    ]
+
+
+def to_json(value: Any) -> Any:
+    """Convert compact elements and tag maps for ``json.dump``.
+
+    Pass as ``default`` so compact elements are written as the element
+    dicts they replace.
+
+    Raises
+    ------
+    TypeError
+        If the value is neither a compact element nor a tag map
+    """
+    if isinstance(value, OSMElement):
+        return value.to_dict()
+    if isinstance(value, TagMap):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
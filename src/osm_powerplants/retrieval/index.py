@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+In-memory index of the elements of one country.
+
+The index holds a country's plant and generator elements by ID together
+with a reverse map from relation members to their parent relations. Member
+nodes and ways are read from the element cache at most once, so walking
+relation members during parsing becomes a sequence of dictionary lookups.
+"""
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from .cache import ElementCache
+
+logger = logging.getLogger(__name__)
+
+
+class ElementIndex:
+    """Per-country index of elements and relation membership.
+
+    Provides ``get_node`` and ``get_way`` like :class:`ElementCache`, so
+    parsers can use it in place of the cache while a country is processed.
+
+    Attributes
+    ----------
+    cache : ElementCache
+        Cache the member nodes and ways are read from
+    elements : dict[str, dict]
+        Country elements by ID (e.g. "way/123")
+
+    Examples
+    --------
+    >>> index = ElementIndex(client.cache, plants + generators)
+    >>> index.parent_relations("node/42")
+    ['relation/7']
+    >>> way = index.get_way(123)  # read from the cache once
+    """
+
+    def __init__(self, cache: ElementCache, elements: Iterable[dict[str, Any]]):
+        """Index the elements of a country.
+
+        Parameters
+        ----------
+        cache : ElementCache
+            Cache holding the referenced nodes and ways
+        elements : iterable of dict
+            Plant and generator elements of the country
+        """
+        self.cache = cache
+        self.elements: dict[str, dict[str, Any]] = {}
+        self._parents: dict[str, list[str]] = {}
+        self._nodes: dict[int, dict[str, Any] | None] = {}
+        self._ways: dict[int, dict[str, Any] | None] = {}
+
+        for element in elements:
+            element_id = f"{element['type']}/{element['id']}"
+            self.elements[element_id] = element
+            if element["type"] != "relation":
+                continue
+            for member in element.get("members", []):
+                parents = self._parents.setdefault(
+                    f"{member['type']}/{member['ref']}", []
+                )
+                if element_id not in parents:
+                    parents.append(element_id)
+
+        logger.debug(
+            f"Indexed {len(self.elements)} elements with "
+            f"{len(self._parents)} relation members"
+        )
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __contains__(self, element_id: str) -> bool:
+        return element_id in self.elements
+
+    def get(self, element_id: str) -> dict[str, Any] | None:
+        """Get a country element by ID (e.g. "node/123")."""
+        return self.elements.get(element_id)
+
+    def parent_relations(self, element_id: str) -> list[str]:
+        """Get the IDs of the country relations an element is a member of.
+
+        Parameters
+        ----------
+        element_id : str
+            Element identifier (e.g. "node/123")
+
+        Returns
+        -------
+        list[str]
+            Parent relation IDs in the order they were indexed
+        """
+        return self._parents.get(element_id, [])
+
+    def get_node(self, node_id: int) -> dict[str, Any] | None:
+        """Get a node, reading it from the cache on first access."""
+        if node_id not in self._nodes:
+            self._nodes[node_id] = self.cache.get_node(node_id)
+        return self._nodes[node_id]
+
+    def get_way(self, way_id: int) -> dict[str, Any] | None:
+        """Get a way, reading it from the cache on first access."""
+        if way_id not in self._ways:
+            self._ways[way_id] = self.cache.get_way(way_id)
+        return self._ways[way_id]
@@ -0,0 +1,298 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Concurrent cache prewarming for lists of countries.
+
+This module downloads and resolves raw OSM data for many countries into the
+element cache without processing it, so that later processing runs are fully
+cache-hot. Progress is persisted per country and interrupted runs resume
+where they stopped. :func:`download_ahead` downloads the next countries
+while the current one is processed.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any
+
+from tqdm import tqdm
+
+from osm_powerplants.utils import get_country_code
+
+from .client import OverpassAPIClient
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_FILE = "prefetch_progress.json"
+
+
+class PrefetchProgress:
+    """Persistent per-country record of prefetch results.
+
+    Attributes
+    ----------
+    path : str
+        JSON file holding the progress records
+    records : dict[str, dict]
+        Country code to status record mapping
+    """
+
+    def __init__(self, path: str):
+        """Load progress from file if present.
+
+        Parameters
+        ----------
+        path : str
+            Progress file path
+        """
+        self.path = path
+        self.records: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.records = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Ignoring unreadable prefetch progress {path}: {e}")
+
+    def is_complete(self, country_code: str) -> bool:
+        """Check whether a country was fully prefetched."""
+        return self.records.get(country_code, {}).get("status") == "complete"
+
+    def mark(self, country_code: str, status: str, **info: Any) -> None:
+        """Record the outcome for a country and persist immediately.
+
+        Parameters
+        ----------
+        country_code : str
+            ISO country code
+        status : {'complete', 'failed'}
+            Prefetch outcome
+        **info
+            Extra fields stored with the record
+        """
+        with self._lock:
+            self.records[country_code] = {
+                "status": status,
+                "timestamp": datetime.now().isoformat(),
+                **info,
+            }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.records, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def prefetch_country_data(
+    client: OverpassAPIClient,
+    countries: list[str],
+    jobs: int = 2,
+    force_refresh: bool = False,
+    plants_only: bool = False,
+    progress_path: str | None = None,
+) -> dict[str, Any]:
+    """Download and resolve raw data for many countries concurrently.
+
+    Parameters
+    ----------
+    client : OverpassAPIClient
+        Client whose cache is filled
+    countries : list[str]
+        Country names or ISO codes
+    jobs : int
+        Number of countries downloaded at the same time
+    force_refresh : bool
+        Download again even if a country was already prefetched
+    plants_only : bool
+        Only download plants, not generators
+    progress_path : str, optional
+        Progress file. Defaults to ``prefetch_progress.json`` in the cache
+        directory.
+
+    Returns
+    -------
+    dict
+        Results with 'success', 'countries_fetched', 'countries_skipped'
+        and 'countries_failed' (country to error mapping)
+
+    Notes
+    -----
+    Country caches are saved after every completed country, so an
+    interrupted run loses at most the countries in flight. Countries that
+    failed before are retried with a forced refresh.
+    """
+    if progress_path is None:
+        progress_path = os.path.join(client.cache.cache_dir, PROGRESS_FILE)
+    progress = PrefetchProgress(progress_path)
+
+    results = {
+        "success": True,
+        "countries_fetched": [],
+        "countries_skipped": [],
+        "countries_failed": {},
+    }
+
+    pending = []
+    for country in countries:
+        country_code = get_country_code(country)
+        if country_code is None:
+            logger.error(f"Invalid country name: {country}")
+            results["countries_failed"][country] = "Invalid country"
+            continue
+
+        cached = client.cache.get_plants(country_code) is not None and (
+            plants_only or client.cache.get_generators(country_code) is not None
+        )
+        if not force_refresh and progress.is_complete(country_code) and cached:
+            logger.info(f"Skipping {country}: already prefetched")
+            results["countries_skipped"].append(country)
+            continue
+
+        retry = progress.records.get(country_code, {}).get("status") == "failed"
+        pending.append((country, country_code, force_refresh or retry))
+
+    if not pending:
+        results["success"] = not results["countries_failed"]
+        return results
+
+    logger.info(f"Prefetching {len(pending)} countries with {jobs} concurrent jobs")
+
+    def fetch(country: str, refresh: bool) -> tuple[int, int]:
+        plants_data, generators_data = client.get_country_data(
+            country,
+            force_refresh=refresh,
+            plants_only=plants_only,
+            show_progress=False,
+        )
+        errors = [
+            data["error"]
+            for data in (plants_data, generators_data)
+            if data.get("error")
+        ]
+        if errors:
+            raise RuntimeError("; ".join(errors))
+        return len(plants_data.get("elements", [])), len(
+            generators_data.get("elements", [])
+        )
+
+    pbar = None
+    if client.show_progress:
+        pbar = tqdm(total=len(pending), desc="Prefetching", unit="country")
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            futures = {
+                executor.submit(fetch, country, refresh): (country, country_code)
+                for country, country_code, refresh in pending
+            }
+            for future in as_completed(futures):
+                country, country_code = futures[future]
+                try:
+                    plants_count, generators_count = future.result()
+                    client.cache.save_all_caches()
+                    progress.mark(
+                        country_code,
+                        "complete",
+                        plants=plants_count,
+                        generators=generators_count,
+                        plants_only=plants_only,
+                    )
+                    results["countries_fetched"].append(country)
+                    logger.info(
+                        f"Prefetched {country}: {plants_count} plants, "
+                        f"{generators_count} generators"
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to prefetch {country}: {e}")
+                    progress.mark(country_code, "failed", error=str(e))
+                    results["countries_failed"][country] = str(e)
+                if pbar:
+                    pbar.update(1)
+    finally:
+        if pbar:
+            pbar.close()
+
+    order = {country: i for i, (country, _, _) in enumerate(pending)}
+    results["countries_fetched"].sort(key=order.__getitem__)
+    results["success"] = not results["countries_failed"]
+    return results
+
+
+def download_ahead(
+    client: OverpassAPIClient,
+    countries: Iterable[str],
+    ahead: int = 1,
+    force_refresh: bool = False,
+    plants_only: bool = False,
+) -> Iterator[tuple[str, Future]]:
+    """Download countries in background threads ahead of their processing.
+
+    Countries are yielded in order, each with the download of its plants
+    and generators data. While the caller processes one country, up to
+    ``ahead`` following countries are downloaded; the next download
+    starts only when the caller is done with a country, which bounds the
+    number of resolved countries held in memory.
+
+    Parameters
+    ----------
+    client : OverpassAPIClient
+        Client used for the downloads
+    countries : iterable of str
+        Country names or ISO codes, in processing order
+    ahead : int
+        Number of countries downloaded ahead of the one being processed
+    force_refresh : bool
+        Skip cache and download fresh data
+    plants_only : bool
+        Only download plants, not generators
+
+    Yields
+    ------
+    tuple[str, concurrent.futures.Future]
+        Country and its download. The future's result is the
+        ``(plants_data, generators_data)`` pair of
+        :meth:`OverpassAPIClient.get_country_data`; it raises the
+        download error, if any.
+
+    Examples
+    --------
+    >>> for country, download in download_ahead(client, ["Malta", "Cyprus"]):
+    ...     plants_data, generators_data = download.result()
+    """
+
+    def fetch(country: str) -> tuple[dict, dict]:
+        return client.get_country_data(
+            country,
+            force_refresh=force_refresh,
+            plants_only=plants_only,
+            show_progress=False,
+        )
+
+    ahead = max(1, ahead)
+    countries = iter(countries)
+    executor = ThreadPoolExecutor(max_workers=ahead)
+    queue: deque[tuple[str, Future]] = deque()
+
+    def fill() -> None:
+        # The next country to process and `ahead` following ones
+        while len(queue) <= ahead:
+            country = next(countries, None)
+            if country is None:
+                return
+            queue.append((country, executor.submit(fetch, country)))
+
+    try:
+        fill()
+        while queue:
+            yield queue.popleft()
+            fill()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
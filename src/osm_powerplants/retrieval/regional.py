@@ -568,6 +568,7 @@ def _group_elements_by_country(
 
     elements_by_country = {}
 
+    located = []
     for element in elements:
         lat, lon = _get_element_coordinates(client, element)
 
@@ -577,7 +578,16 @@ def _group_elements_by_country(
             )
             continue
 
-        country_code = _determine_country_from_coordinates(client, lat, lon)
+        located.append((element, lat, lon))
+
+    bounds = _region_bounds(region) if region else None
+    offline_codes = _lookup_countries_offline(
+        client, [(lat, lon) for _, lat, lon in located], bounds
+    )
+
+    for (element, lat, lon), country_code in zip(located, offline_codes):
+        if not country_code:
+            country_code = _determine_country_from_coordinates(client, lat, lon)
 
         if country_code:
             if country_code not in elements_by_country:
@@ -592,6 +602,78 @@ def _group_elements_by_country(
     return elements_by_country
 
 
+def _region_bounds(
+    region: dict[str, Any],
+) -> tuple[float, float, float, float] | None:
+    """Get the bounding box of a region as (south, west, north, east)."""
+    if region.get("type") == "bbox":
+        lat_min, lon_min, lat_max, lon_max = region["bounds"]
+        return lat_min, lon_min, lat_max, lon_max
+
+    elif region.get("type") == "radius":
+        center_lat, center_lon = region["center"]
+        lat_offset = region["radius_km"] / 111.0
+        lon_offset = region["radius_km"] / (
+            111.0 * max(abs(math.cos(math.radians(center_lat))), 1e-6)
+        )
+        return (
+            center_lat - lat_offset,
+            center_lon - lon_offset,
+            center_lat + lat_offset,
+            center_lon + lon_offset,
+        )
+
+    elif region.get("type") == "polygon" and region.get("coordinates"):
+        lons = [coord[0] for coord in region["coordinates"]]
+        lats = [coord[1] for coord in region["coordinates"]]
+        return min(lats), min(lons), max(lats), max(lons)
+
+    return None
+
+
+def _lookup_countries_offline(
+    client: OverpassAPIClient,
+    points: list[tuple[float, float]],
+    bounds: tuple[float, float, float, float] | None = None,
+) -> list[str | None]:
+    """Resolve countries for many points through the boundary index.
+
+    Parameters
+    ----------
+    client : OverpassAPIClient
+        API client holding the boundary index
+    points : list[tuple[float, float]]
+        (lat, lon) pairs
+    bounds : tuple, optional
+        Area to make sure is indexed, defaults to the extent of the points
+
+    Returns
+    -------
+    list[str or None]
+        Country code per point, None where the index has no answer
+
+    Notes
+    -----
+    Missing boundaries for the area are downloaded once in a single query
+    and persisted, after which all lookups are local.
+    """
+    boundary_index = getattr(client, "boundary_index", None)
+    if boundary_index is None or not points:
+        return [None] * len(points)
+
+    lats = [lat for lat, _ in points]
+    lons = [lon for _, lon in points]
+    if bounds is None:
+        bounds = (min(lats), min(lons), max(lats), max(lons))
+
+    try:
+        boundary_index.ensure_bbox(client, *bounds)
+    except Exception as e:
+        logger.warning(f"Could not update country boundary index: {e}")
+
+    return list(boundary_index.lookup_many(lats, lons))
+
+
 def _determine_countries_for_region(
     client: OverpassAPIClient, region: dict[str, Any]
 ) -> list[str]:
@@ -653,7 +735,14 @@ def _determine_countries_for_region(
             return []
 
         countries = set()
-        for lat, lon in test_points:
+        offline_codes = _lookup_countries_offline(
+            client, test_points, _region_bounds(region)
+        )
+        for (lat, lon), country_code in zip(test_points, offline_codes):
+            if country_code:
+                countries.add(country_code)
+                continue
+
             query = f"""
             [out:json][timeout:30];
             is_in({lat},{lon})->.a;
@@ -753,6 +842,12 @@ def _determine_country_from_coordinates(
     str or None
         ISO country code
     """
+    boundary_index = getattr(client, "boundary_index", None)
+    if boundary_index is not None:
+        country = boundary_index.lookup(lat, lon)
+        if country:
+            return country
+
     if use_cache:
         country = client._country_cache.get_with_tolerance(lat, lon, tolerance=0.01)
         if country:
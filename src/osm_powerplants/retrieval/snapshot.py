@@ -0,0 +1,417 @@
+# SPDX-FileCopyrightText: Contributors to powerplantmatching <https://github.com/pypsa/powerplantmatching>
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Portable snapshots of the local cache.
+
+This module packs the element diskcaches, country stores, processed units
+and country boundaries into a single versioned archive that can be moved
+between machines. Archives start with a manifest describing the countries,
+timestamps, config hashes and checksums of every member, and are imported
+as a stream with all checksums verified before anything is written.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import IO, Any
+
+from osm_powerplants import __version__
+from osm_powerplants.models import Unit
+from osm_powerplants.utils import get_country_code
+
+from .boundaries import CountryBoundaryIndex
+from .cache import ElementCache
+from .elements import to_json
+from .prefetch import PROGRESS_FILE
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+_ELEMENT_MEMBERS = {
+    "nodes.jsonl": ("node", "nodes_cache"),
+    "ways.jsonl": ("way", "ways_cache"),
+    "relations.jsonl": ("relation", "relations_cache"),
+}
+_STORE_MEMBERS = ("plants.json", "generators.json", "units.json")
+_BOUNDARIES_MEMBER = "boundaries.jsonl"
+_REQUIRED_MEMBERS = frozenset(_ELEMENT_MEMBERS) | frozenset(_STORE_MEMBERS)
+# The only members extracted on import; anything else is skipped
+_KNOWN_MEMBERS = _REQUIRED_MEMBERS | {_BOUNDARIES_MEMBER}
+_CHUNK_SIZE = 1 << 20
+
+
+class _HashingWriter:
+    """File wrapper computing size and SHA-256 of written bytes."""
+
+    def __init__(self, f: IO[bytes]):
+        self.f = f
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self.f.write(data)
+        self.sha256.update(data)
+        self.size += len(data)
+
+
+def _referenced_element_ids(
+    cache: ElementCache, elements: Iterable[dict]
+) -> dict[str, set[str]]:
+    """Collect IDs of all nodes, ways and relations reachable from elements."""
+    ids: dict[str, set[str]] = {"node": set(), "way": set(), "relation": set()}
+    stack = [(element, 0) for element in elements]
+
+    while stack:
+        element, depth = stack.pop()
+        element_type = element.get("type")
+        if element_type not in ids:
+            continue
+        ids[element_type].add(str(element["id"]))
+
+        if element_type == "way":
+            ids["node"].update(str(node_id) for node_id in element.get("nodes", []))
+        elif element_type == "relation" and depth < 2:
+            for member in element.get("members", []):
+                if member["type"] == "node":
+                    ids["node"].add(str(member["ref"]))
+                elif member["type"] == "way":
+                    member_element = cache.get_way(member["ref"])
+                elif member["type"] == "relation":
+                    member_element = cache.get_relation(member["ref"])
+                else:
+                    continue
+
+                if member["type"] != "node" and member_element:
+                    stack.append((member_element, depth + 1))
+
+    return ids
+
+
+def _write_json(writer: _HashingWriter, data: dict) -> int:
+    """Write a JSON document and return its number of top-level entries."""
+    writer.write(json.dumps(data, default=to_json).encode())
+    return len(data)
+
+
+def _write_jsonl(writer: _HashingWriter, records: Iterator[Any]) -> int:
+    """Write records as JSON lines and return their count."""
+    count = 0
+    for record in records:
+        line = json.dumps(record, separators=(",", ":"), default=to_json)
+        writer.write(line.encode() + b"\n")
+        count += 1
+    return count
+
+
+def export_cache(
+    cache: ElementCache,
+    output_path: str,
+    countries: list[str] | None = None,
+    boundary_index: CountryBoundaryIndex | None = None,
+) -> dict[str, Any]:
+    """Write a snapshot of the cache to a compressed archive.
+
+    Parameters
+    ----------
+    cache : ElementCache
+        Loaded cache to export
+    output_path : str
+        Archive path, conventionally ending in ``.tar.gz``
+    countries : list[str], optional
+        Country names or codes to include. Elements are limited to those
+        referenced by the selected countries. Exports everything if None.
+    boundary_index : CountryBoundaryIndex, optional
+        Country boundaries to include
+
+    Returns
+    -------
+    dict
+        Manifest written to the archive
+    """
+    if countries is None:
+        country_codes = sorted(
+            set(cache.plants_cache)
+            | set(cache.generators_cache)
+            | set(cache.units_cache)
+        )
+    else:
+        country_codes = []
+        for country in countries:
+            code = get_country_code(country)
+            if code is None:
+                raise ValueError(f"Invalid country: {country}")
+            country_codes.append(code)
+
+    fetched_at = {}
+    progress_path = os.path.join(cache.cache_dir, PROGRESS_FILE)
+    if os.path.exists(progress_path):
+        with open(progress_path) as f:
+            for code, record in json.load(f).items():
+                if record.get("status") == "complete":
+                    fetched_at[code] = record.get("timestamp")
+
+    plants = {
+        c: cache.plants_cache[c] for c in country_codes if c in cache.plants_cache
+    }
+    generators = {
+        c: cache.generators_cache[c]
+        for c in country_codes
+        if c in cache.generators_cache
+    }
+    units = {
+        c: [unit.to_dict() for unit in cache.units_cache[c]]
+        for c in country_codes
+        if c in cache.units_cache
+    }
+
+    element_ids = None
+    if countries is not None:
+        element_ids = _referenced_element_ids(
+            cache,
+            (
+                element
+                for data in (*plants.values(), *generators.values())
+                for element in data.get("elements", [])
+            ),
+        )
+
+    manifest: dict[str, Any] = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "package_version": __version__,
+        "created_at": datetime.now().isoformat(),
+        "countries": {
+            code: {
+                "plants": len(plants.get(code, {}).get("elements", [])),
+                "generators": len(generators.get(code, {}).get("elements", [])),
+                "units": len(units.get(code, [])),
+                "config_hashes": sorted(
+                    {
+                        u["config_hash"]
+                        for u in units.get(code, [])
+                        if u.get("config_hash")
+                    }
+                ),
+                "fetched_at": fetched_at.get(code),
+            }
+            for code in country_codes
+        },
+        "files": {},
+    }
+
+    staging_dir = tempfile.mkdtemp(prefix="snapshot_", dir=cache.cache_dir)
+    try:
+        members = []
+
+        def stage(name: str, fill) -> None:
+            path = os.path.join(staging_dir, name)
+            with open(path, "wb") as f:
+                writer = _HashingWriter(f)
+                entries = fill(writer)
+            manifest["files"][name] = {
+                "sha256": writer.sha256.hexdigest(),
+                "size": writer.size,
+                "entries": entries,
+            }
+            members.append((name, path))
+
+        for name, data in zip(_STORE_MEMBERS, (plants, generators, units)):
+            stage(name, lambda w, data=data: _write_json(w, data))
+
+        for name, (element_type, attribute) in _ELEMENT_MEMBERS.items():
+            element_cache = getattr(cache, attribute)
+            if element_ids is None:
+                keys = element_cache.iterkeys()
+            else:
+                keys = iter(sorted(element_ids[element_type]))
+            stage(
+                name,
+                lambda w, c=element_cache, k=keys: _write_jsonl(
+                    w, (value for value in map(c.get, k) if value is not None)
+                ),
+            )
+
+        if boundary_index is not None:
+            store = boundary_index.store
+            stage(
+                _BOUNDARIES_MEMBER,
+                lambda w: _write_jsonl(
+                    w,
+                    (
+                        {"key": key, "wkb": value.hex()}
+                        if isinstance(value, bytes)
+                        else {"key": key, "value": value}
+                        for key, value in ((k, store[k]) for k in store.iterkeys())
+                    ),
+                ),
+            )
+
+        manifest_path = os.path.join(staging_dir, MANIFEST_NAME)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with tarfile.open(output_path, "w:gz") as tar:
+            tar.add(manifest_path, arcname=MANIFEST_NAME)
+            for name, path in members:
+                tar.add(path, arcname=name)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    logger.info(
+        f"Exported cache snapshot with {len(country_codes)} countries to {output_path}"
+    )
+    return manifest
+
+
+def read_manifest(snapshot_path: str) -> dict[str, Any]:
+    """Read the manifest of a snapshot without importing it.
+
+    Parameters
+    ----------
+    snapshot_path : str
+        Archive path
+
+    Returns
+    -------
+    dict
+        Snapshot manifest
+    """
+    with tarfile.open(snapshot_path, "r|*") as tar:
+        member = tar.next()
+        if member is None or member.name != MANIFEST_NAME:
+            raise ValueError(f"{snapshot_path} is not a cache snapshot")
+        return json.load(tar.extractfile(member))
+
+
+def import_cache(
+    cache: ElementCache,
+    snapshot_path: str,
+    boundary_index: CountryBoundaryIndex | None = None,
+) -> dict[str, Any]:
+    """Load a snapshot into the cache.
+
+    Parameters
+    ----------
+    cache : ElementCache
+        Loaded cache to import into
+    snapshot_path : str
+        Archive created by :func:`export_cache`
+    boundary_index : CountryBoundaryIndex, optional
+        Country boundary index to fill
+
+    Returns
+    -------
+    dict
+        Manifest of the imported snapshot
+
+    Raises
+    ------
+    ValueError
+        If the archive is not a snapshot, has an unsupported format version,
+        contains a member name with a path, misses a required member, or
+        any member fails checksum verification. Nothing is written to the
+        cache in that case.
+
+    Notes
+    -----
+    The archive is read sequentially and each member is copied to a staging
+    directory while its checksum is computed, so memory use does not depend
+    on the snapshot size. Country data in the snapshot replaces local data
+    for the same countries; elements are merged into the diskcaches.
+    """
+    staging_dir = tempfile.mkdtemp(prefix="snapshot_", dir=cache.cache_dir)
+    try:
+        staged = {}
+        with tarfile.open(snapshot_path, "r|*") as tar:
+            member = tar.next()
+            if member is None or member.name != MANIFEST_NAME:
+                raise ValueError(f"{snapshot_path} is not a cache snapshot")
+            manifest = json.load(tar.extractfile(member))
+
+            version = manifest.get("format_version")
+            if version != SNAPSHOT_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported snapshot format version {version}, "
+                    f"expected {SNAPSHOT_FORMAT_VERSION}"
+                )
+
+            for member in tar:
+                if member.name == MANIFEST_NAME:
+                    continue
+                if "/" in member.name or os.sep in member.name or ".." in member.name:
+                    raise ValueError(f"Invalid snapshot member name {member.name!r}")
+                expected = manifest["files"].get(member.name)
+                if (
+                    member.name not in _KNOWN_MEMBERS
+                    or expected is None
+                    or not member.isfile()
+                ):
+                    logger.warning(f"Skipping unexpected snapshot member {member.name}")
+                    continue
+
+                path = os.path.join(staging_dir, member.name)
+                if hasattr(tarfile, "data_filter"):
+                    tar.extract(member, staging_dir, filter="data")
+                else:
+                    tar.extract(member, staging_dir)
+                sha256 = hashlib.sha256()
+                with open(path, "rb") as f:
+                    while chunk := f.read(_CHUNK_SIZE):
+                        sha256.update(chunk)
+
+                if sha256.hexdigest() != expected["sha256"]:
+                    raise ValueError(f"Checksum mismatch for {member.name}")
+                staged[member.name] = path
+
+        listed = set(manifest["files"]) & _KNOWN_MEMBERS
+        missing = (listed | _REQUIRED_MEMBERS) - set(staged)
+        if missing:
+            raise ValueError(f"Snapshot is missing members: {sorted(missing)}")
+
+        for name, (_, attribute) in _ELEMENT_MEMBERS.items():
+            element_cache = getattr(cache, attribute)
+            with open(staged[name]) as f:
+                for line in f:
+                    element = json.loads(line)
+                    element_cache.set(str(element["id"]), element)
+
+        with open(staged["plants.json"]) as f:
+            for code, data in json.load(f).items():
+                cache.store_plants(code, data)
+        with open(staged["generators.json"]) as f:
+            for code, data in json.load(f).items():
+                cache.store_generators(code, data)
+        with open(staged["units.json"]) as f:
+            for code, units in json.load(f).items():
+                cache.store_units(code, [Unit(**unit) for unit in units])
+
+        if boundary_index is not None and _BOUNDARIES_MEMBER in staged:
+            with open(staged[_BOUNDARIES_MEMBER]) as f:
+                for line in f:
+                    record = json.loads(line)
+                    if "wkb" in record:
+                        value = bytes.fromhex(record["wkb"])
+                    else:
+                        value = record["value"]
+                    boundary_index.store.set(record["key"], value)
+            boundary_index.load()
+
+        cache.save_all_caches()
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    logger.info(
+        f"Imported cache snapshot with {len(manifest['countries'])} countries "
+        f"from {snapshot_path}"
+    )
+    return manifest
@@ -9,15 +9,18 @@ This module provides helper functions for capacity parsing, country
 validation, geometric calculations, and configuration handling.
 """
 
+import calendar
 import logging
 import math
 import os
 import re
+from functools import lru_cache
 from typing import Any
 
 import pycountry
 
 from osm_powerplants.core import get_cache_dir, get_config
+from osm_powerplants.enhancement.kernels import polygon_areas
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +49,91 @@ def get_source_config(
     return source_config
 
 
+# Basic extraction accepts MW values only, with or without a space
+_BASIC_CAPACITY_PATTERNS = (r"^(\d+(?:\.\d+)?)\s*(mw|mwp|MW|MWP)$",)
+
+_DEFAULT_CAPACITY_PATTERNS = (
+    # Matches: "100 MW", "15.5 kW", "50 MWp" (number with optional space and unit)
+    r"^(\d+(?:\.\d+)?)\s*([a-zA-Z]+(?:p|el|e)?)$",
+    # Matches: "100MW", "15.5kW", "50MWp" (number directly followed by unit)
+    r"^(\d+(?:\.\d+)?)([a-zA-Z]+(?:p|el|e)?)$",
+)
+
+_UNIT_FACTORS = {
+    **dict.fromkeys(["w", "watt", "watts"], 0.000001),
+    **dict.fromkeys(["kw", "kilowatt", "kilowatts"], 0.001),
+    **dict.fromkeys(["mw", "megawatt", "megawatts"], 1),
+    **dict.fromkeys(["gw", "gigawatt", "gigawatts"], 1000),
+}
+
+CAPACITY_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=64)
+def compile_capacity_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Compile a set of capacity regex patterns once.
+
+    Parameters
+    ----------
+    patterns : tuple[str, ...]
+        Regex patterns with two groups (number, unit)
+
+    Returns
+    -------
+    tuple[re.Pattern, ...]
+        Compiled patterns in the given order. Invalid patterns are logged
+        and left out.
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern))
+        except re.error as e:
+            logger.error(f"Invalid capacity regex pattern '{pattern}': {e}")
+    return tuple(compiled)
+
+
+@lru_cache(maxsize=CAPACITY_CACHE_SIZE)
+def _parse_capacity_cached(
+    value_str: str, patterns: tuple[str, ...]
+) -> tuple[bool, float | None, str]:
+    """Parse a stripped capacity string with a set of patterns."""
+    original_value_str = value_str
+
+    if "," in value_str and "." not in value_str:
+        value_str = value_str.replace(",", ".")
+
+    match = None
+    for pattern in compile_capacity_patterns(patterns):
+        match = pattern.match(value_str)
+        if match:
+            break
+
+    if not match:
+        return False, None, "regex_no_match"
+
+    number_str, unit = match.groups()
+    try:
+        number = float(number_str)
+    except ValueError:
+        return False, None, "value_error"
+
+    base_unit = unit.lower()
+    for suffix in ["el", "p", "e"]:
+        if base_unit.endswith(suffix):
+            base_unit = base_unit[: -len(suffix)]
+            break
+
+    factor = _UNIT_FACTORS.get(base_unit)
+    if factor is None:
+        return False, None, "unknown_unit"
+    return True, number * factor, original_value_str
+
+
 def parse_capacity_value(
     value: str,
     advanced_extraction: bool,
-    regex_patterns: list[str] | None = None,
+    regex_patterns: list[str] | tuple[str, ...] | None = None,
 ) -> tuple[bool, float | None, str]:
     """Parse capacity value string to MW.
 
@@ -74,6 +158,12 @@ def parse_capacity_value(
         - capacity_mw: Capacity in megawatts or None
         - original_value_or_error: Original string or error type
 
+    Notes
+    -----
+    Patterns are compiled once per pattern set, and results are memoized
+    per (value, pattern set) in a bounded LRU cache, as OSM capacity tags
+    repeat the same few strings. See :func:`capacity_cache_stats`.
+
     Examples
     --------
     >>> parse_capacity_value("50 MW", False)
@@ -85,73 +175,99 @@ def parse_capacity_value(
     >>> parse_capacity_value("100kWp", True)  # 'p' suffix for peak
     (True, 0.1, "100kWp")
     """
-    value_str = value.strip()
-    original_value_str = value_str
-
-    if "," in value_str and "." not in value_str:
-        value_str = value_str.replace(",", ".")
-
     if not advanced_extraction:
-        pattern = r"^(\d+(?:\.\d+)?)\s*(mw|mwp|MW|MWP)$"
-        try:
-            match = re.match(pattern, value_str)
-            if not match:
-                pattern_no_space = r"^(\d+(?:\.\d+)?)(mw|mwp|MW|MWP)$"
-                match = re.match(pattern_no_space, value_str)
-        except Exception as e:
-            logger.error(
-                f"Error parsing capacity value '{original_value_str}' with regex: {e}"
-            )
-            return False, None, "regex_error"
+        patterns = _BASIC_CAPACITY_PATTERNS
+    elif regex_patterns is None:
+        patterns = _DEFAULT_CAPACITY_PATTERNS
     else:
-        if regex_patterns is None:
-            regex_patterns = [
-                # Matches: "100 MW", "15.5 kW", "50 MWp" (number with optional space and unit)
-                r"^(\d+(?:\.\d+)?)\s*([a-zA-Z]+(?:p|el|e)?)$",
-                # Matches: "100MW", "15.5kW", "50MWp" (number directly followed by unit)
-                r"^(\d+(?:\.\d+)?)([a-zA-Z]+(?:p|el|e)?)$",
-            ]
-
-        match = None
-        for pattern in regex_patterns:
-            try:
-                match = re.match(pattern, value_str)
-                if match:
-                    break
-            except Exception as e:
-                logger.error(
-                    f"Error parsing capacity value '{original_value_str}' with regex: {e}"
-                )
-                continue
+        patterns = tuple(regex_patterns)
+    return _parse_capacity_cached(value.strip(), patterns)
+
+
+def capacity_cache_stats() -> dict[str, Any]:
+    """Get statistics of the capacity parsing cache.
+
+    Returns
+    -------
+    dict
+        Hits, misses, current size, maximum size and hit rate
+    """
+    cache_info = _parse_capacity_cached.cache_info()
+    total = cache_info.hits + cache_info.misses
+    return {
+        "hits": cache_info.hits,
+        "misses": cache_info.misses,
+        "size": cache_info.currsize,
+        "maxsize": cache_info.maxsize,
+        "hit_rate": cache_info.hits / total if total > 0 else 0,
+    }
+
+
+def clear_capacity_cache() -> None:
+    """Clear the capacity parsing cache and compiled patterns."""
+    _parse_capacity_cached.cache_clear()
+    compile_capacity_patterns.cache_clear()
+
+
+DATE_CACHE_SIZE = 16384
+
+_YEAR_SEARCH = re.compile(r"\b(1[0-9]{3}|2[0-9]{3})\b")
+_ISO_DATE = re.compile(r"(1[0-9]{3}|2[0-9]{3})(?:-([0-9]{2})(?:-([0-9]{2}))?)?")
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_start_year(date_string: str) -> tuple[int | None, str | None]:
+    """Parse a stripped date string into a year.
+
+    Bare years, ``YYYY-MM`` and valid ``YYYY-MM-DD`` dates are resolved
+    directly. Other strings go through ``dateutil`` with fuzzy parsing,
+    falling back to the first year found in the string.
+
+    Parameters
+    ----------
+    date_string : str
+        Stripped, non-empty date value of a start date tag
 
+    Returns
+    -------
+    tuple[int or None, str or None]
+        (year, problem) where year is None if the string contains no year,
+        and problem is the parser error when the year was taken from the
+        string because ``dateutil`` could not parse it
+
+    Notes
+    -----
+    Results are memoized per string, as start dates repeat a lot.
+
+    Examples
+    --------
+    >>> parse_start_year("2011-05")
+    (2011, None)
+    >>> parse_start_year("May 2011")
+    (2011, None)
+    """
+    match = _ISO_DATE.fullmatch(date_string)
     if match:
-        number_str, unit = match.groups()
+        year_str, month_str, day_str = match.groups()
+        year = int(year_str)
+        if month_str is None:
+            return year, None
+        month = int(month_str)
+        if 1 <= month <= 12 and (
+            day_str is None or 1 <= int(day_str) <= calendar.monthrange(year, month)[1]
+        ):
+            return year, None
+
+    from dateutil import parser
+
+    year_match = _YEAR_SEARCH.search(date_string)
+    if not year_match:
+        return None, "no_year"
 
-        try:
-            number = float(number_str)
-
-            unit_lower = unit.lower()
-
-            base_unit = unit_lower
-            for suffix in ["el", "p", "e"]:
-                if base_unit.endswith(suffix):
-                    base_unit = base_unit[: -len(suffix)]
-                    break
-
-            if base_unit in ["w", "watt", "watts"]:
-                return True, number * 0.000001, original_value_str
-            elif base_unit in ["kw", "kilowatt", "kilowatts"]:
-                return True, number * 0.001, original_value_str
-            elif base_unit in ["mw", "megawatt", "megawatts"]:
-                return True, number, original_value_str
-            elif base_unit in ["gw", "gigawatt", "gigawatts"]:
-                return True, number * 1000, original_value_str
-            else:
-                return False, None, "unknown_unit"
-        except ValueError:
-            return False, None, "value_error"
-    else:
-        return False, None, "regex_no_match"
+    try:
+        return int(parser.parse(date_string, fuzzy=True).year), None
+    except (ValueError, TypeError) as e:
+        return int(year_match.group(1)), str(e)
 
 
 def get_country_code(country: str) -> str | None:
@@ -224,7 +340,9 @@ def calculate_area(coordinates: list[dict[str, float]]) -> float:
     """Calculate area of polygon from coordinates.
 
     Uses the shoelace formula with coordinates projected to meters
-    using haversine distance for accuracy.
+    using haversine distance for accuracy. See
+    :func:`~osm_powerplants.enhancement.kernels.polygon_areas` for many
+    polygons at once.
 
     Parameters
     ----------
@@ -239,30 +357,13 @@ def calculate_area(coordinates: list[dict[str, float]]) -> float:
     if len(coordinates) < 3:
         return 0.0
 
-    ref_lat = coordinates[0]["lat"]
-    ref_lon = coordinates[0]["lon"]
-
-    points = []
-    for coord in coordinates:
-        dy = haversine_distance(ref_lat, ref_lon, coord["lat"], ref_lon)
-        dx = haversine_distance(ref_lat, ref_lon, ref_lat, coord["lon"])
-
-        if coord["lat"] < ref_lat:
-            dy = -dy
-        if coord["lon"] < ref_lon:
-            dx = -dx
-
-        points.append((dx, dy))
-
-    area = 0.0
-    n = len(points)
-    for i in range(n):
-        j = (i + 1) % n
-        area += points[i][0] * points[j][1]
-        area -= points[j][0] * points[i][1]
-    area = abs(area) / 2.0
-
-    return area
+    return float(
+        polygon_areas(
+            [coord["lat"] for coord in coordinates],
+            [coord["lon"] for coord in coordinates],
+            [0, len(coordinates)],
+        )[0]
+    )
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
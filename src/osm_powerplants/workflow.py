@@ -9,16 +9,29 @@ This module contains the main Workflow class that coordinates the entire
 processing pipeline for extracting power plant data from OpenStreetMap.
 """
 
+import hashlib
 import logging
+from dataclasses import replace
 from typing import Any
 
-from .enhancement.clustering import ClusteringManager
+from .enhancement.clustering import ClusteringManager, ClusteringStore
+from .enhancement.geometry import PlantGeometryIndex
 from .models import PROCESSING_PARAMETERS, Unit, Units
+from .parsing.batch import BatchGeneratorParser
 from .parsing.generators import GeneratorParser
+from .parsing.incremental import (
+    ElementResult,
+    ElementResultStore,
+    capture_element_result,
+    element_fingerprint,
+    parse_config_hash,
+)
+from .parsing.parallel import ParallelElementParser
 from .parsing.plants import PlantParser
 from .quality.rejection import RejectionReason, RejectionTracker
 from .retrieval.client import OverpassAPIClient
-from .utils import get_country_code
+from .retrieval.index import ElementIndex
+from .utils import capacity_cache_stats, get_country_code
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +63,15 @@ class Workflow:
         Hash of current configuration
     processed_elements : set
         Track processed element IDs
+    batch_parser : BatchGeneratorParser or None
+        Vectorized fast path for generator nodes (if batch parsing is
+        enabled)
+    result_store : ElementResultStore or None
+        Stored parse outcomes of unchanged elements (if incremental
+        parsing is enabled)
+    parallel_parser : ParallelElementParser or None
+        Worker processes parsing elements of large countries (if parallel
+        parsing is enabled)
 
     Examples
     --------
@@ -57,8 +79,8 @@ class Workflow:
     >>> client = OverpassAPIClient()
     >>> tracker = RejectionTracker()
     >>> units = Units()
-    >>> workflow = Workflow(client, tracker, units, config)
-    >>> units, tracker = workflow.process_country_data('Malta')
+    >>> with Workflow(client, tracker, units, config) as workflow:
+    ...     units, tracker = workflow.process_country_data('Malta')
     """
 
     def __init__(
@@ -87,6 +109,8 @@ class Workflow:
         self.rejection_tracker = rejection_tracker
 
         self.clustering_manager = ClusteringManager(self.config)
+        if self.config.get("units_clustering", {}).get("enabled", False):
+            self.clustering_manager.store = ClusteringStore(client.cache.cache_dir)
 
         self.generator_parser = GeneratorParser(
             client,
@@ -109,14 +133,54 @@ class Workflow:
 
         self.processing_parameters = processing_parameters
 
+        self.batch_parser: BatchGeneratorParser | None = None
+        if self.config.get("batch_parsing", {}).get("enabled", False):
+            self.batch_parser = BatchGeneratorParser(self.generator_parser)
+
         self.config_hash = Unit._generate_config_hash(processing_parameters)
 
         self.processed_elements: set[str] = set()
+        self.element_index: ElementIndex | None = None
+
+        self.parse_config_hash = parse_config_hash(self.config)
+        self.result_store: ElementResultStore | None = None
+        if self.config.get("incremental_parsing", {}).get("enabled", False):
+            self.result_store = ElementResultStore(client.cache.cache_dir)
+        self._rejected_plant_fingerprints: dict[str, str | None] = {}
+
+        self.parallel_parser: ParallelElementParser | None = None
+        parallel_config = self.config.get("parallel_parsing", {})
+        if parallel_config.get("enabled", False):
+            self.parallel_parser = ParallelElementParser(
+                client.cache.cache_dir,
+                self.config,
+                workers=parallel_config.get("workers"),
+                chunk_size=parallel_config.get("chunk_size", 500),
+                min_elements=parallel_config.get("min_elements", 2000),
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Stop parsing workers and close the result and clustering stores."""
+        if self.parallel_parser is not None:
+            self.parallel_parser.shutdown()
+        if self.result_store is not None:
+            self.result_store.close()
+            self.result_store = None
+        if self.clustering_manager.store is not None:
+            self.clustering_manager.store.close()
+            self.clustering_manager.store = None
 
     def process_country_data(
         self,
         country: str,
         force_refresh: bool | None = None,
+        osm_data: tuple[dict, dict] | None = None,
     ) -> tuple[Units, RejectionTracker]:
         """Process power plant data for a single country.
 
@@ -134,6 +198,9 @@ class Workflow:
         force_refresh : bool, optional
             If True, bypass cache and download fresh data.
             If None, uses config['force_refresh'] value.
+        osm_data : tuple[dict, dict], optional
+            Plants and generators data already downloaded for the
+            country, as returned by ``client.get_country_data``
 
         Returns
         -------
@@ -178,58 +245,128 @@ class Workflow:
 
         plants_only = self.config.get("plants_only", True)
 
-        plants_data, generators_data = self.client.get_country_data(
-            country,
-            force_refresh=force_refresh if force_refresh is not None else False,
-            plants_only=plants_only,
-        )
+        if osm_data is None:
+            osm_data = self.client.get_country_data(
+                country,
+                force_refresh=force_refresh if force_refresh is not None else False,
+                plants_only=plants_only,
+            )
+        plants_data, generators_data = osm_data
 
         self.processed_plants: list[Unit] = []
         self.processed_generators: list[Unit] = []
+        try:
+            self._set_element_index(
+                ElementIndex(
+                    self.client.cache,
+                    plants_data.get("elements", [])
+                    + generators_data.get("elements", []),
+                )
+            )
+            # Element geometries are shared by the parsers for this run only
+            self.generator_parser.geometry_handler.clear_memo()
+            self._prepare_ways(
+                plants_data.get("elements", []) + generators_data.get("elements", [])
+            )
 
-        for element in plants_data.get("elements", []):
-            element_id = f"{element['type']}/{element['id']}"
-
-            if element_id in self.processed_elements:
-                continue
+            if self.result_store is not None:
+                hits_before = self.result_store.hits
+                misses_before = self.result_store.misses
+            cluster_hits_before = self.clustering_manager.cache_hits
+            cluster_misses_before = self.clustering_manager.cache_misses
 
-            plant = self.plant_parser.process_element(
-                element, country, self.processed_elements
+            speculative = self._parse_speculatively(
+                "plant", plants_data.get("elements", []), country, country_code
             )
-            if plant:
-                self.processed_plants.append(plant)
-                self.processed_elements.add(element_id)
 
-            logger.debug(f"Processed plant element {element_id}")
+            for element in plants_data.get("elements", []):
+                element_id = f"{element['type']}/{element['id']}"
+
+                if element_id in self.processed_elements:
+                    continue
+
+                result = speculative.pop(element_id, None)
+                if result is None:
+                    result = self._parse_element(
+                        "plant", element, country, country_code
+                    )
+                self._commit_result("plant", element, result)
 
-        if not plants_only:
-            plant_polygons = self.plant_parser.plant_polygons
+                logger.debug(f"Processed plant element {element_id}")
 
-            reconstruct_config = self.config.get("units_reconstruction", {})
-            if reconstruct_config.get("enabled", False) and hasattr(
-                self.plant_parser, "rejected_plant_info"
-            ):
-                self.generator_parser.set_rejected_plant_info(
-                    self.plant_parser.rejected_plant_info
+            if not plants_only:
+                plant_polygons = self.plant_parser.plant_polygons
+
+                reconstruct_config = self.config.get("units_reconstruction", {})
+                if reconstruct_config.get("enabled", False) and hasattr(
+                    self.plant_parser, "rejected_plant_info"
+                ):
+                    self.generator_parser.set_rejected_plant_info(
+                        self.plant_parser.rejected_plant_info
+                    )
+
+                generator_context = self._generator_context()
+                plant_polygons_by_id = {
+                    f"{geometry.type}/{geometry.id}": geometry
+                    for geometry in plant_polygons
+                }
+                plant_index = PlantGeometryIndex(plant_polygons)
+                nodes_within = self._nodes_within(
+                    generators_data.get("elements", []), plant_index
                 )
 
-            for element in generators_data.get("elements", []):
-                element_id = f"{element['type']}/{element['id']}"
-                if element_id in self.processed_elements:
-                    self.rejection_tracker.add_rejection(
-                        element=element,
-                        reason=RejectionReason.ELEMENT_ALREADY_PROCESSED,
-                        details="Element processed already in plants processing",
-                        keywords="none",
+                if self.batch_parser is not None:
+                    resolved = self.batch_parser.prepare(
+                        generators_data.get("elements", []), country
                     )
-                    continue
+                    logger.info(
+                        f"Resolved {resolved} generators in batch for {country}"
+                    )
+
+                speculative = self._parse_speculatively(
+                    "generator",
+                    generators_data.get("elements", []),
+                    country,
+                    country_code,
+                    generator_context,
+                )
 
-                if plant_polygons:
-                    is_within, _ = (
-                        self.generator_parser.geometry_handler.is_element_within_plant_geometries(
-                            element, plant_polygons
+                for element in generators_data.get("elements", []):
+                    element_id = f"{element['type']}/{element['id']}"
+                    if element_id in self.processed_elements:
+                        self.rejection_tracker.add_rejection(
+                            element=element,
+                            reason=RejectionReason.ELEMENT_ALREADY_PROCESSED,
+                            details="Element processed already in plants processing",
+                            keywords="none",
                         )
-                    )
+                        continue
+
+                    is_within = nodes_within.get(element_id)
+                    if is_within is None and plant_polygons:
+                        # Plants the generator is a member of are tested first,
+                        # which settles most members with one containment test
+                        geometry_handler = self.generator_parser.geometry_handler
+                        parent_polygons = [
+                            plant_polygons_by_id[parent_id]
+                            for parent_id in self.element_index.parent_relations(
+                                element_id
+                            )
+                            if parent_id in plant_polygons_by_id
+                        ]
+                        is_within = False
+                        if parent_polygons:
+                            is_within, _ = (
+                                geometry_handler.is_element_within_plant_geometries(
+                                    element, parent_polygons
+                                )
+                            )
+                        if not is_within:
+                            is_within, _ = (
+                                geometry_handler.is_element_within_plant_geometries(
+                                    element, plant_index
+                                )
+                            )
                     if is_within:
                         self.rejection_tracker.add_rejection(
                             element=element,
@@ -239,60 +376,61 @@ class Workflow:
                         )
                         continue
 
-                generator = self.generator_parser.process_element(
-                    element, country, self.processed_elements
-                )
-                if generator:
-                    self.processed_generators.append(generator)
-                    self.processed_elements.add(element_id)
-
-                logger.debug(f"Processed generator element {element_id}")
-
-            reconstruct_config = self.config.get("units_reconstruction", {})
-            if reconstruct_config.get("enabled", False) and hasattr(
-                self.generator_parser, "finalize_generator_groups"
-            ):
-                aggregated_units = self.generator_parser.finalize_generator_groups(
-                    country, self.processed_elements
-                )
-                if aggregated_units:
-                    self.processed_generators.extend(aggregated_units)
-                    logger.info(
-                        f"Created {len(aggregated_units)} aggregated units from generator groups"
-                    )
-
-            if self.config.get("units_clustering", {}).get("enabled", False):
-                generators_by_source: dict[str, list[Unit]] = {}
-                for gen in self.processed_generators:
-                    source = gen.Fueltype or "unknown"
-                    if source not in generators_by_source:
-                        generators_by_source[source] = []
-                    generators_by_source[source].append(gen)
-
-                self.processed_generators = []
+                    result = None
+                    if self.batch_parser is not None:
+                        result = self.batch_parser.pop(element_id)
+                    if result is None:
+                        result = speculative.pop(element_id, None)
+                        if result is not None and not result.cacheable:
+                            # Generator groups live in this process, so grouped
+                            # generators are parsed again to join them
+                            result = self._parse_fresh(
+                                "generator",
+                                element,
+                                country,
+                                country_code,
+                                result.fingerprint,
+                            )
+                    if result is None:
+                        result = self._parse_element(
+                            "generator",
+                            element,
+                            country,
+                            country_code,
+                            generator_context,
+                        )
+                    self._commit_result("generator", element, result)
 
-                for source, source_generators in generators_by_source.items():
-                    if len(source_generators) < 2:
-                        self.processed_generators.extend(source_generators)
-                        continue
+                    logger.debug(f"Processed generator element {element_id}")
 
-                    success, clusters = self.clustering_manager.cluster_generators(
-                        source_generators, source
+                reconstruct_config = self.config.get("units_reconstruction", {})
+                if reconstruct_config.get("enabled", False) and hasattr(
+                    self.generator_parser, "finalize_generator_groups"
+                ):
+                    aggregated_units = self.generator_parser.finalize_generator_groups(
+                        country, self.processed_elements
                     )
-                    if success:
+                    if aggregated_units:
+                        self.processed_generators.extend(aggregated_units)
                         logger.info(
-                            f"Clustering successful for {len(source_generators)} generators of type {source}"
+                            f"Created {len(aggregated_units)} aggregated units from generator groups"
                         )
 
-                        cluster_plants = self.clustering_manager.create_cluster_plants(
-                            clusters, source
-                        )
-                        self.processed_generators.extend(cluster_plants)
-                    else:
-                        logger.warning(
-                            f"Clustering failed for {len(source_generators)} generators of type {source}"
+                if self.config.get("units_clustering", {}).get("enabled", False):
+                    self.processed_generators = (
+                        self.clustering_manager.cluster_by_source(
+                            self.processed_generators, country_code
                         )
-                        self.processed_generators.extend(source_generators)
+                    )
+        finally:
+            # Worker processes and per-run state are released even when
+            # processing fails
+            if self.parallel_parser is not None:
+                self.parallel_parser.shutdown()
+            self.generator_parser.geometry_handler.clear_memo()
+            self.plant_parser.capacity_estimator.way_areas = {}
+            self.generator_parser.capacity_estimator.way_areas = {}
+            self._set_element_index(None)
 
         all_units: list[Unit] = []
 
@@ -302,6 +440,27 @@ class Workflow:
         for generator in getattr(self, "processed_generators", []):
             all_units.append(generator)
 
+        if self.result_store is not None:
+            hits = self.result_store.hits - hits_before
+            total = hits + self.result_store.misses - misses_before
+            logger.info(f"Reused {hits} of {total} parsed elements for {country}")
+
+        cluster_hits = self.clustering_manager.cache_hits - cluster_hits_before
+        cluster_total = (
+            cluster_hits + self.clustering_manager.cache_misses - cluster_misses_before
+        )
+        if cluster_total:
+            logger.info(
+                f"Reused clusters of {cluster_hits} of {cluster_total} fuel types "
+                f"for {country}"
+            )
+
+        capacity_stats = capacity_cache_stats()
+        logger.debug(
+            f"Capacity parse cache: {capacity_stats['size']} entries, "
+            f"hit rate {capacity_stats['hit_rate']:.1%}"
+        )
+
         self.rejection_tracker.delete_for_units(all_units)
 
         logger.info(self.rejection_tracker.get_summary_string())
@@ -313,3 +472,310 @@ class Workflow:
         logger.info(f"Added {len(all_units)} units for {country} to collection")
 
         return self.units, self.rejection_tracker
+
+    def _prepare_ways(self, elements: list[dict[str, Any]]) -> None:
+        """Build polygons and areas of all country ways in batch.
+
+        Polygons are built for the country ways and the member ways of
+        relations; areas for capacity estimation only for country ways.
+        """
+        ways: dict[int, dict[str, Any]] = {}
+        for element in elements:
+            if element.get("type") == "way":
+                ways.setdefault(element["id"], element)
+            elif element.get("type") == "relation":
+                for member in element.get("members", []):
+                    if member["type"] == "way" and member["ref"] not in ways:
+                        way = self.element_index.get_way(member["ref"])
+                        if way:
+                            ways[member["ref"]] = way
+        if ways:
+            self.generator_parser.geometry_handler.build_way_geometries(
+                list(ways.values())
+            )
+
+        if self.config.get("capacity_estimation", {}).get("enabled", False):
+            way_areas = self.plant_parser.capacity_estimator.compute_way_areas(
+                [element for element in elements if element.get("type") == "way"],
+                self.element_index,
+            )
+            self.generator_parser.capacity_estimator.way_areas = way_areas
+
+    def _nodes_within(
+        self, elements: list[dict[str, Any]], plant_index: PlantGeometryIndex
+    ) -> dict[str, bool]:
+        """Check all generator nodes against the plant boundaries at once.
+
+        Returns whether each node with numeric coordinates lies within a
+        plant, keyed by element ID. Other generators are checked one by one.
+        """
+        if not len(plant_index):
+            return {}
+        nodes = [
+            element
+            for element in elements
+            if element.get("type") == "node"
+            and isinstance(element.get("lat"), int | float)
+            and isinstance(element.get("lon"), int | float)
+        ]
+        within = plant_index.containing_many(
+            [element["lat"] for element in nodes],
+            [element["lon"] for element in nodes],
+        )
+        return {
+            f"node/{element['id']}": bool(position >= 0)
+            for element, position in zip(nodes, within, strict=True)
+        }
+
+    def _set_element_index(self, element_index: ElementIndex | None) -> None:
+        """Share the index of the current country with the parsers."""
+        self.element_index = element_index
+        self.plant_parser.set_element_index(element_index)
+        self.generator_parser.set_element_index(element_index)
+
+    def _generator_context(self) -> str:
+        """Describe the rejected plants that generator parsing depends on."""
+        if self.result_store is None or not self.config.get(
+            "units_reconstruction", {}
+        ).get("enabled", False):
+            return ""
+
+        rejected_plants = getattr(self.plant_parser, "rejected_plant_info", {})
+        context = ",".join(
+            f"{plant_id}:{self._rejected_plant_fingerprints.get(plant_id)}"
+            for plant_id in sorted(rejected_plants)
+        )
+        return hashlib.sha256(context.encode()).hexdigest()
+
+    def _parse_speculatively(
+        self,
+        kind: str,
+        elements: list[dict[str, Any]],
+        country: str,
+        country_code: str,
+        context: str = "",
+    ) -> dict[str, ElementResult]:
+        """Parse elements ahead of the serial loop in worker processes.
+
+        Parameters
+        ----------
+        kind : {'plant', 'generator'}
+            Parser to use
+        elements : list[dict]
+            Elements of the country
+        country : str
+            Country name or code being processed
+        country_code : str
+            ISO country code
+        context : str
+            Extra state the outcomes depend on, part of the fingerprint
+
+        Returns
+        -------
+        dict[str, ElementResult]
+            Outcomes by element ID, empty if parallel parsing is disabled or
+            there are too few elements
+
+        Notes
+        -----
+        Outcomes are not applied here. The serial loop commits them in
+        element order and skips elements consumed in the meantime, which
+        keeps the result identical to parsing every element serially.
+        Stored outcomes of unchanged elements are looked up first and only
+        the remaining elements are sent to the workers.
+        """
+        if (
+            self.parallel_parser is None
+            or len(elements) < self.parallel_parser.min_elements
+        ):
+            return {}
+
+        speculative: dict[str, ElementResult] = {}
+        pending: list[tuple[dict[str, Any], str | None]] = []
+        for element in elements:
+            element_id = f"{element['type']}/{element['id']}"
+            if element_id in self.processed_elements or (
+                kind == "generator"
+                and self.batch_parser is not None
+                and element_id in self.batch_parser
+            ):
+                continue
+
+            result, fingerprint = self._lookup_result(
+                kind, element, country, country_code, context
+            )
+            if result is not None:
+                speculative[element_id] = result
+            else:
+                pending.append((element, fingerprint))
+
+        rejected_plant_info = None
+        if kind == "generator" and self.config.get("units_reconstruction", {}).get(
+            "enabled", False
+        ):
+            rejected_plant_info = getattr(
+                self.plant_parser, "rejected_plant_info", None
+            )
+
+        results = self.parallel_parser.parse(
+            kind,
+            [element for element, _ in pending],
+            country,
+            rejected_plant_info,
+            self.processing_parameters,
+        )
+        for (element, fingerprint), result in zip(pending, results):
+            result.fingerprint = fingerprint
+            self._store_result(kind, element, country_code, result)
+            speculative[f"{element['type']}/{element['id']}"] = result
+
+        logger.info(f"Parsed {len(results)} {kind} elements in parallel for {country}")
+        return speculative
+
+    def _parse_element(
+        self,
+        kind: str,
+        element: dict[str, Any],
+        country: str,
+        country_code: str,
+        context: str = "",
+    ) -> ElementResult:
+        """Parse a plant or generator element into a deferred outcome.
+
+        Parameters
+        ----------
+        kind : {'plant', 'generator'}
+            Parser to use
+        element : dict
+            OSM element to parse
+        country : str
+            Country name or code being processed
+        country_code : str
+            ISO country code
+        context : str
+            Extra state the outcome depends on, part of the fingerprint
+
+        Returns
+        -------
+        ElementResult
+            Outcome to apply with :meth:`_commit_result`
+
+        Notes
+        -----
+        Rejections, plant geometries and consumed element IDs are collected
+        in the result instead of being applied, so that a stored outcome and
+        a fresh one are committed the same way. Stored outcomes are reused
+        when incremental parsing is enabled and the element fingerprint and
+        parse configuration are unchanged.
+        """
+        result, fingerprint = self._lookup_result(
+            kind, element, country, country_code, context
+        )
+        if result is not None:
+            return result
+        return self._parse_fresh(kind, element, country, country_code, fingerprint)
+
+    def _lookup_result(
+        self,
+        kind: str,
+        element: dict[str, Any],
+        country: str,
+        country_code: str,
+        context: str = "",
+    ) -> tuple[ElementResult | None, str | None]:
+        """Get the stored outcome of an element and its current fingerprint.
+
+        Returns (None, None) if incremental parsing is disabled.
+        """
+        if self.result_store is None:
+            return None, None
+
+        element_id = f"{element['type']}/{element['id']}"
+        fingerprint = element_fingerprint(
+            element, self.element_index or self.client.cache, f"{country}|{context}"
+        )
+        result = self.result_store.get(
+            country_code, kind, element_id, fingerprint, self.parse_config_hash
+        )
+        if result is not None and result.unit is not None:
+            result.unit = replace(
+                result.unit,
+                config_hash=self.config_hash,
+                processing_parameters=self.processing_parameters,
+            )
+        return result, fingerprint
+
+    def _parse_fresh(
+        self,
+        kind: str,
+        element: dict[str, Any],
+        country: str,
+        country_code: str,
+        fingerprint: str | None = None,
+    ) -> ElementResult:
+        """Parse an element in this process and store the outcome."""
+        result = capture_element_result(
+            kind,
+            element,
+            country,
+            self.plant_parser,
+            self.generator_parser,
+            self.rejection_tracker,
+        )
+        result.fingerprint = fingerprint
+        self._store_result(kind, element, country_code, result)
+        return result
+
+    def _store_result(
+        self,
+        kind: str,
+        element: dict[str, Any],
+        country_code: str,
+        result: ElementResult,
+    ) -> None:
+        """Keep a fresh outcome for reuse if incremental parsing is enabled."""
+        if self.result_store is not None:
+            self.result_store.put(
+                country_code,
+                kind,
+                f"{element['type']}/{element['id']}",
+                result,
+                self.parse_config_hash,
+            )
+
+    def _commit_result(
+        self, kind: str, element: dict[str, Any], result: ElementResult
+    ) -> None:
+        """Apply the outcome of parsing an element to the workflow state.
+
+        Parameters
+        ----------
+        kind : {'plant', 'generator'}
+            Parser that produced the outcome
+        element : dict
+            Parsed OSM element
+        result : ElementResult
+            Outcome from :meth:`_parse_element`
+        """
+        element_id = f"{element['type']}/{element['id']}"
+
+        if result.coordinates is not None:
+            element["_lat"], element["_lon"] = result.coordinates
+
+        for rejected in result.rejections:
+            self.rejection_tracker.add_rejected_element(rejected)
+
+        self.plant_parser.plant_polygons.extend(result.plant_geometries)
+        if result.rejected_plant is not None:
+            plant_id = result.rejected_plant.element_id
+            self.plant_parser.rejected_plant_info[plant_id] = result.rejected_plant
+            self._rejected_plant_fingerprints[plant_id] = result.fingerprint
+
+        self.processed_elements.update(result.consumed)
+
+        if result.unit is not None:
+            if kind == "plant":
+                self.processed_plants.append(result.unit)
+            else:
+                self.processed_generators.append(result.unit)
+            self.processed_elements.add(element_id)
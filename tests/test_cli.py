@@ -51,3 +51,15 @@ def test_cli_process_help():
     assert result.returncode == 0
     assert "--output" in result.stdout
     assert "--config" in result.stdout
+
+
+def test_cli_prefetch_help():
+    """Test CLI prefetch help."""
+    result = subprocess.run(
+        [sys.executable, "-m", "osm_powerplants.cli", "prefetch", "--help"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "--jobs" in result.stdout
+    assert "--force-refresh" in result.stdout
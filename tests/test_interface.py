@@ -84,3 +84,113 @@ def test_validate_countries_empty():
     valid, codes = validate_countries([])
     assert len(valid) == 0
     assert len(codes) == 0
+
+
+def test_process_countries_jobs_match_serial(tmp_path, monkeypatch):
+    """Test countries processed in worker processes match serial processing."""
+    import copy
+    import sys
+    from pathlib import Path
+
+    import pandas as pd
+
+    from osm_powerplants import get_config
+    from osm_powerplants.interface import process_countries
+    from osm_powerplants.retrieval.cache import ElementCache
+
+    def plant(node_id, lat, lon, country, **tags):
+        tags = {
+            "power": "plant",
+            "plant:source": "solar",
+            "plant:method": "photovoltaic",
+            "start_date": "2015",
+            **tags,
+        }
+        return {
+            "type": "node",
+            "id": node_id,
+            "lat": lat,
+            "lon": lon,
+            "_country": country,
+            "tags": tags,
+        }
+
+    output = {"plant:output:electricity": "5 MW"}
+    plants = {
+        "MT": [
+            plant(1, 35.90, 14.40, "MT", name="Solar A", **output),
+            plant(2, 35.91, 14.41, "MT", name="Solar B"),
+            plant(3, 35.92, 14.42, "MT", **{"plant:output:electricity": "yes"}),
+        ],
+        "LU": [
+            plant(11, 49.60, 6.10, "LU", name="Solar C", **output),
+            plant(12, 49.61, 6.11, "LU", **{"plant:source": "unknown"}),
+        ],
+    }
+
+    def element_cache(name):
+        # Each run starts from the elements only, without processed units
+        cache_dir = tmp_path / name
+        cache = ElementCache(str(cache_dir))
+        for country_code, elements in plants.items():
+            cache.store_plants(country_code, {"elements": elements})
+            cache.store_generators(country_code, {"elements": []})
+            cache.store_nodes_bulk(elements)
+        cache.save_all_caches()
+        cache.close()
+        return cache_dir
+
+    # Everything is cached; requests to the API fail at once
+    config = get_config()
+    config["force_refresh"] = False
+    config["rejection_tracking"] = {"level": "full", "sample_rate": 0.1}
+    config["overpass_api"].update(
+        {
+            "api_url": "http://127.0.0.1:9/api/interpreter",
+            "show_progress": False,
+            "max_retries": 1,
+            "retry_delay": 0,
+        }
+    )
+
+    countries = ["Malta", "Luxembourg"]
+    results = {}
+    for jobs in (1, 2):
+        results[jobs] = process_countries(
+            countries,
+            str(tmp_path / f"osm_data_{jobs}.csv"),
+            str(element_cache(f"cache_{jobs}")),
+            True,
+            copy.deepcopy(config),
+            jobs=jobs,
+        )
+    pd.testing.assert_frame_equal(results[2], results[1])
+    assert results[1]["Country"].tolist() == countries
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "osm_data_2.csv").drop(columns=["created_at"]),
+        pd.read_csv(tmp_path / "osm_data_1.csv").drop(columns=["created_at"]),
+    )
+
+    # The extraction script combines units and rejections in country order
+    monkeypatch.syspath_prepend(str(Path(__file__).parent.parent / "scripts"))
+    import extract_europe
+
+    monkeypatch.setattr(extract_europe, "EUROPEAN_COUNTRIES", countries)
+    monkeypatch.setattr(extract_europe, "get_config", lambda: copy.deepcopy(config))
+    outputs = {}
+    for jobs in (1, 2):
+        cache_dir = element_cache(f"europe_cache_{jobs}")
+        monkeypatch.setattr(extract_europe, "get_cache_dir", lambda config: cache_dir)
+        path = tmp_path / f"europe_{jobs}.csv"
+        monkeypatch.setattr(
+            sys, "argv", ["extract_europe.py", "-o", str(path), "-j", str(jobs)]
+        )
+        extract_europe.main()
+        units = pd.read_csv(path).drop(columns=["created_at"])
+        rejections = (tmp_path / f"europe_{jobs}_rejections.txt").read_text()
+        outputs[jobs] = units, rejections
+    pd.testing.assert_frame_equal(outputs[2][0], outputs[1][0])
+    assert outputs[2][1] == outputs[1][1]
+    assert outputs[1][0]["Country"].tolist() == countries
+    assert "Total rejections: 3" in outputs[1][1]
+    assert "Missing source type: 1" in outputs[1][1]
@@ -122,3 +122,42 @@ def test_plant_geometry_contains():
 
     # Point outside
     assert not geom.contains_point(53.0, 14.0)
+
+
+def test_plant_geometry_index():
+    """Test PlantGeometryIndex matches a linear scan."""
+    import random
+
+    from shapely.geometry import Point, box
+
+    from osm_powerplants.enhancement.geometry import PlantGeometryIndex
+    from osm_powerplants.models import PlantGeometry
+
+    rng = random.Random(0)
+    plants = {}
+    for k in range(200):
+        lon, lat = rng.uniform(13.0, 13.5), rng.uniform(52.0, 52.5)
+        if k % 2:
+            geometry = Point(lon, lat)
+        else:
+            geometry = box(lon, lat, lon + 0.02, lat + 0.02)
+        plants[f"way/{k}"] = PlantGeometry(id=str(k), type="way", geometry=geometry)
+    index = PlantGeometryIndex.from_dict(plants)
+    assert len(index) == 200
+
+    points = [(rng.uniform(52.0, 52.5), rng.uniform(13.0, 13.5)) for _ in range(500)]
+    # Points just inside and outside the 50 m buffer of a point plant
+    plant = plants["way/1"].geometry
+    points += [(plant.y, plant.x + 0.0005), (plant.y, plant.x + 0.0006)]
+
+    candidates = index.candidates_many(
+        [lat for lat, _ in points], [lon for _, lon in points]
+    )
+    for (lat, lon), positions in zip(points, candidates, strict=True):
+        expected = next(
+            (key for key, g in plants.items() if g.contains_point(lat, lon)), None
+        )
+        assert index.first_containing(lat, lon) == expected
+        assert index.first_containing(lat, lon, positions=positions) == expected
+    assert index.first_containing(plant.y, plant.x + 0.0005) == "way/1"
+    assert index.first_containing(plant.y, plant.x + 0.0006) is None
@@ -61,3 +61,976 @@ def test_capacity_extractor_placeholder():
     element = {"id": 1, "type": "node", "tags": {"plant:output:electricity": "yes"}}
     success, value, _ = extractor.basic_extraction(element, "plant:output:electricity")
     assert not success
+
+
+def test_incremental_parsing_reuses_unchanged_elements(tmp_path):
+    """Test that unchanged elements reuse their stored parse results."""
+    from osm_powerplants import get_config
+    from osm_powerplants.models import Units
+    from osm_powerplants.quality.rejection import RejectionTracker
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+    from osm_powerplants.workflow import Workflow
+
+    class OfflineClient(OverpassAPIClient):
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            return self.cache.get_plants("MT"), self.cache.get_generators("MT")
+
+    def generator(node_id, output):
+        return {
+            "type": "node",
+            "id": node_id,
+            "lat": 35.9,
+            "lon": 14.4 + node_id / 100,
+            "tags": {
+                "power": "generator",
+                "name": f"Solar {node_id}",
+                "generator:source": "solar",
+                "generator:method": "photovoltaic",
+                "generator:output:electricity": output,
+                "start_date": "2015",
+            },
+        }
+
+    config = get_config()
+    config.update(
+        {
+            "plants_only": False,
+            "units_reconstruction": {"enabled": False},
+            "incremental_parsing": {"enabled": True},
+        }
+    )
+
+    with OfflineClient(cache_dir=str(tmp_path), show_progress=False) as client:
+        client.cache.store_plants("MT", {"elements": []})
+        client.cache.store_generators(
+            "MT", {"elements": [generator(1, "5 MW"), generator(2, "yes")]}
+        )
+
+        with Workflow(client, RejectionTracker(), Units(), config) as workflow:
+            units, tracker = workflow.process_country_data("Malta", force_refresh=True)
+            assert [u.Capacity for u in units] == [5.0]
+            rejections = tracker.get_summary()
+
+        client.cache.store_generators(
+            "MT", {"elements": [generator(1, "7 MW"), generator(2, "yes")]}
+        )
+        with Workflow(client, RejectionTracker(), Units(), config) as workflow:
+            units, tracker = workflow.process_country_data("Malta", force_refresh=True)
+            assert [u.Capacity for u in units] == [7.0]
+            assert tracker.get_summary() == rejections
+            assert workflow.result_store.hits == 1
+            assert workflow.result_store.misses == 1
+        assert workflow.result_store is None
+
+
+def test_tag_mappings_lookup():
+    """Test compiled tag mapping lookups against the configuration."""
+    from osm_powerplants import get_config
+    from osm_powerplants.parsing.mappings import TagMappings
+    from osm_powerplants.utils import determine_set_type
+
+    config = get_config()
+    mappings = TagMappings(config)
+
+    assert mappings.source_lookup["solar"] == "Solar"
+    assert mappings.technology_lookup[("Solar", "photovoltaic")] == "PV"
+    assert ("Wind", "photovoltaic") not in mappings.technology_lookup
+    for technology in ["PV", "Reservoir", " CCGT ", "", "Unknown", None]:
+        assert mappings.set_type(technology) == determine_set_type(technology, config)
+
+    # Source-specific additional tags do not leak between sources
+    solar_keys = mappings.output_keys("generator", "Solar")
+    assert "solar:output" in solar_keys
+    assert "solar:output" not in mappings.output_keys("generator", "Wind")
+    assert mappings.output_keys("generator", "Solar") == solar_keys
+
+
+def test_batch_parsing_matches_scalar(tmp_path):
+    """Test that batch parsing yields the same units and rejections as scalar."""
+    from osm_powerplants import get_config
+    from osm_powerplants.models import Units
+    from osm_powerplants.quality.rejection import RejectionTracker
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+    from osm_powerplants.workflow import Workflow
+
+    class OfflineClient(OverpassAPIClient):
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            return {"elements": []}, {"elements": elements}
+
+    variants = [
+        {"generator:output:electricity": "5 MW", "start_date": "2015"},
+        {"generator:output:electricity": "0.5MWp", "start_date": "1999-13-45"},
+        {"generator:output:electricity": "0.5 mw", "name": "Roof"},
+        {"generator:output:electricity": "250 kW", "start_date": "2010-05-01"},
+        {"generator:output:electricity": "yes"},
+        {"generator:output:electricity": "1,5 MW"},
+        {"generator:output:electricity": "0 MW"},
+        {"solar:output": "3 MW", "start_date": "unknown"},
+        {"generator:output:electricity": " 12 MW ", "generator:method": "turbine"},
+        {"generator:source": "unmapped", "generator:output:electricity": "1 MW"},
+        {"generator:source": None},
+        {"generator:method": None, "generator:output:electricity": "2 MW"},
+    ]
+    elements = []
+    for i, variant in enumerate(variants * 3):
+        tags = {
+            "power": "generator",
+            "generator:source": "solar",
+            "generator:method": "photovoltaic",
+            **variant,
+        }
+        tags = {k: v for k, v in tags.items() if v is not None}
+        elements.append(
+            {"type": "node", "id": i, "lat": 35.9, "lon": 14.4 + i / 1000, "tags": tags}
+        )
+    elements.append({"type": "way", "id": 1, "nodes": [], "tags": elements[0]["tags"]})
+
+    def run(batch_enabled):
+        config = get_config()
+        config.update(
+            {
+                "plants_only": False,
+                "missing_technology_allowed": False,
+                "incremental_parsing": {"enabled": False},
+                "batch_parsing": {"enabled": batch_enabled},
+            }
+        )
+        with OfflineClient(cache_dir=str(tmp_path), show_progress=False) as client:
+            workflow = Workflow(client, RejectionTracker(), Units(), config)
+            units, tracker = workflow.process_country_data("Malta", force_refresh=True)
+        unit_dicts = [
+            {k: v for k, v in unit.to_dict().items() if k != "created_at"}
+            for unit in units
+        ]
+        rejections = [
+            (r.id, r.reason, r.details, r.keywords, r.coordinates, r.country)
+            for records in tracker.rejected_elements.values()
+            for r in records
+        ]
+        return unit_dicts, rejections, workflow.batch_parser
+
+    scalar_units, scalar_rejections, _ = run(False)
+    batch_units, batch_rejections, batch_parser = run(True)
+
+    assert batch_units == scalar_units
+    assert batch_rejections == scalar_rejections
+    # Both the batch and the scalar fallback path were exercised
+    assert 0 < batch_parser.prepare(elements, "Malta") < len(batch_units)
+
+
+def test_parallel_parsing_matches_serial(tmp_path):
+    """Test that parsing in worker processes yields the serial result."""
+    from osm_powerplants import get_config
+    from osm_powerplants.models import Units
+    from osm_powerplants.quality.rejection import RejectionTracker
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+    from osm_powerplants.workflow import Workflow
+
+    class OfflineClient(OverpassAPIClient):
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            return self.cache.get_plants("MT"), self.cache.get_generators("MT")
+
+    def square(first_id, lat, lon):
+        corners = [(0, 0), (0, 0.01), (0.01, 0.01), (0.01, 0)]
+        return [
+            {"type": "node", "id": first_id + k, "lat": lat + dy, "lon": lon + dx}
+            for k, (dy, dx) in enumerate(corners)
+        ]
+
+    def generator(i, lat, lon, **tags):
+        tags = {
+            "power": "generator",
+            "generator:source": "solar",
+            "generator:method": "photovoltaic",
+            "start_date": "2011",
+            **tags,
+        }
+        return {"type": "node", "id": i, "lat": lat, "lon": lon, "tags": tags}
+
+    plant_tags = {
+        "power": "plant",
+        "plant:source": "solar",
+        "plant:method": "photovoltaic",
+    }
+    ways = [
+        {"type": "way", "id": 50, "nodes": [100, 101, 102, 103, 100]},
+        {"type": "way", "id": 51, "nodes": [200, 201, 202, 203, 200]},
+    ]
+    plants = [
+        {
+            "type": "relation",
+            "id": 60,
+            "members": [{"type": "way", "ref": 50, "role": "outer"}],
+            "tags": {
+                **plant_tags,
+                "name": "Complete",
+                "plant:output:electricity": "10 MW",
+            },
+        },
+        {
+            "type": "relation",
+            "id": 70,
+            "members": [{"type": "way", "ref": 51, "role": "outer"}],
+            "tags": {**plant_tags, "name": "Farm"},
+        },
+    ]
+    generators = [
+        generator(1, 35.905, 14.405, **{"generator:output:electricity": "1 MW"}),
+        generator(2, 36.5, 14.5, **{"generator:output:electricity": "3 MW"}),
+        generator(3, 36.6, 14.5, **{"generator:output:electricity": "yes"}),
+        # Grouped into the rejected plant relation/70
+        generator(4, 36.005, 14.605, **{"generator:output:electricity": "1 MW"}),
+        generator(5, 36.006, 14.606, **{"generator:output:electricity": "2 MW"}),
+    ]
+
+    def run(parallel_enabled, cache_dir):
+        config = get_config()
+        config.update(
+            {
+                "plants_only": False,
+                "incremental_parsing": {"enabled": False},
+                "batch_parsing": {"enabled": False},
+                "parallel_parsing": {
+                    "enabled": parallel_enabled,
+                    "workers": 2,
+                    "chunk_size": 2,
+                    "min_elements": 1,
+                },
+            }
+        )
+        with OfflineClient(cache_dir=str(cache_dir), show_progress=False) as client:
+            client.cache.store_nodes_bulk(
+                square(100, 35.9, 14.4) + square(200, 36.0, 14.6) + generators
+            )
+            client.cache.store_ways_bulk(ways)
+            client.cache.store_plants("MT", {"elements": plants})
+            client.cache.store_generators("MT", {"elements": generators})
+            workflow = Workflow(client, RejectionTracker(), Units(), config)
+            units, tracker = workflow.process_country_data("Malta", force_refresh=True)
+        unit_dicts = [
+            {k: v for k, v in unit.to_dict().items() if k != "created_at"}
+            for unit in units
+        ]
+        rejections = [
+            (r.id, r.reason, r.details, r.keywords, r.coordinates, r.country)
+            for records in tracker.rejected_elements.values()
+            for r in records
+        ]
+        return unit_dicts, rejections
+
+    serial_units, serial_rejections = run(False, tmp_path / "serial")
+    parallel_units, parallel_rejections = run(True, tmp_path / "parallel")
+
+    assert parallel_units == serial_units
+    assert parallel_rejections == serial_rejections
+    assert {unit["id"] for unit in serial_units} == {
+        "relation/60",
+        "relation/70",
+        "node/2",
+    }
+
+
+def test_parallel_parser_shut_down_on_failure(tmp_path):
+    """Test that worker processes stop when processing a country fails."""
+    import pytest
+
+    from osm_powerplants import get_config
+    from osm_powerplants.models import Units
+    from osm_powerplants.quality.rejection import RejectionTracker
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+    from osm_powerplants.workflow import Workflow
+
+    class OfflineClient(OverpassAPIClient):
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            return self.cache.get_plants("MT"), self.cache.get_generators("MT")
+
+    generators = [
+        {
+            "type": "node",
+            "id": i,
+            "lat": 35.9,
+            "lon": 14.4 + i / 100,
+            "tags": {"power": "generator", "generator:source": "solar"},
+        }
+        for i in range(1, 5)
+    ]
+    config = get_config()
+    config.update(
+        {
+            "plants_only": False,
+            "incremental_parsing": {"enabled": False},
+            "batch_parsing": {"enabled": False},
+            "parallel_parsing": {
+                "enabled": True,
+                "workers": 2,
+                "chunk_size": 2,
+                "min_elements": 1,
+            },
+        }
+    )
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("parsing failed")
+
+    with OfflineClient(cache_dir=str(tmp_path), show_progress=False) as client:
+        client.cache.store_plants("MT", {"elements": []})
+        client.cache.store_generators("MT", {"elements": generators})
+        workflow = Workflow(client, RejectionTracker(), Units(), config)
+        workflow._commit_result = fail
+        with pytest.raises(RuntimeError):
+            workflow.process_country_data("Malta", force_refresh=True)
+        assert workflow.parallel_parser._executor is None
+        assert workflow.element_index is None
+
+
+def test_geometry_memo_shared(tmp_path):
+    """Test that parsers share memoized element geometries."""
+    from osm_powerplants import get_config
+    from osm_powerplants.parsing.generators import GeneratorParser
+    from osm_powerplants.parsing.plants import PlantParser
+    from osm_powerplants.quality.rejection import RejectionTracker
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+
+    nodes = [
+        {"type": "node", "id": 1 + k, "lat": 35.9 + dy, "lon": 14.4 + dx}
+        for k, (dy, dx) in enumerate([(0, 0), (0, 0.01), (0.01, 0.01), (0.01, 0)])
+    ]
+    way = {"type": "way", "id": 10, "nodes": [1, 2, 3, 4, 1]}
+    relation = {
+        "type": "relation",
+        "id": 20,
+        "members": [{"type": "way", "ref": 10, "role": "outer"}],
+    }
+
+    with OverpassAPIClient(cache_dir=str(tmp_path), show_progress=False) as client:
+        client.cache.store_nodes_bulk(nodes)
+        client.cache.store_ways_bulk([way])
+        tracker = RejectionTracker()
+        generator_parser = GeneratorParser(client, tracker, get_config())
+        plant_parser = PlantParser(
+            client, tracker, get_config(), generator_parser=generator_parser
+        )
+        handler = plant_parser.geometry_handler
+        assert handler is generator_parser.geometry_handler
+
+        lat, lon = handler.process_element_coordinates(relation)
+        geometry = handler.get_element_geometry(relation)
+        assert geometry is handler.get_element_geometry(relation)
+        assert (lat, lon) == geometry.get_centroid()
+        assert handler.element_geometry(relation).bounds == (14.4, 35.9, 14.41, 35.91)
+        # The member way was memoized while building the relation
+        assert handler.element_geometry(way).geometry.geometry.equals(geometry.geometry)
+
+        handler.clear_memo()
+        assert handler.get_element_geometry(relation) is not geometry
+
+
+def test_build_way_geometries(tmp_path):
+    """Test that batch way polygons match the scalar geometries."""
+    import random
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.geometry import PlantGeometryIndex
+    from osm_powerplants.parsing.generators import GeneratorParser
+    from osm_powerplants.quality.rejection import RejectionTracker
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+
+    rng = random.Random(0)
+    nodes, ways = [], []
+    for k in range(50):
+        lat, lon = rng.uniform(35.8, 36.0), rng.uniform(14.3, 14.5)
+        corners = [(0, 0), (0, 0.01), (0.01, 0.01), (0.01, 0)][: 1 + k % 4]
+        if k % 7 == 0:
+            corners = [(0, 0), (0.01, 0.01), (0, 0.01), (0.01, 0)]  # bow tie
+        ids = [100 * k + n for n in range(len(corners))]
+        nodes += [
+            {"type": "node", "id": i, "lat": lat + dy, "lon": lon + dx}
+            for i, (dy, dx) in zip(ids, corners, strict=True)
+        ]
+        ways.append({"type": "way", "id": k, "nodes": ids + ids[:1]})
+
+    with OverpassAPIClient(cache_dir=str(tmp_path), show_progress=False) as client:
+        client.cache.store_nodes_bulk(nodes)
+        parser = GeneratorParser(client, RejectionTracker(), get_config())
+        handler = parser.geometry_handler
+
+        expected = [handler.element_geometry(way) for way in ways]
+        handler.clear_memo()
+        geometries = handler.build_way_geometries(ways)
+
+        for way, record, geometry in zip(ways, expected, geometries, strict=True):
+            built = handler.element_geometry(way)
+            assert (built.geometry is None) == (record.geometry is None)
+            assert (geometry is None) == (record.geometry is None)
+            if record.geometry is not None:
+                assert built.geometry.geometry.equals_exact(record.geometry.geometry, 0)
+                assert built.geometry.geometry is geometry
+                assert built.centroid == record.centroid
+                assert built.bounds == record.bounds
+
+        index = PlantGeometryIndex(
+            [record.geometry for record in expected if record.geometry]
+        )
+        points = [
+            (rng.uniform(35.8, 36.0), rng.uniform(14.3, 14.5)) for _ in range(500)
+        ]
+        positions = index.containing_many(
+            [lat for lat, _ in points], [lon for _, lon in points]
+        )
+        for (lat, lon), position in zip(points, positions, strict=True):
+            key = index.first_containing(lat, lon)
+            assert (index.keys[position] if position >= 0 else None) == key
+
+
+def test_relation_ring_assembly(tmp_path):
+    """Test that relation member segments are stitched and inner rings cut out."""
+    import pytest
+    import shapely
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.rings import stitch_rings
+    from osm_powerplants.parsing.generators import GeneratorParser
+    from osm_powerplants.quality.rejection import RejectionTracker
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+
+    rings, leftover = stitch_rings(
+        [
+            [(0, 0), (1, 0)],
+            [(0, 1), (1, 1)],
+            [(1, 0), (1, 1)],
+            [(0, 1), (0, 0)],
+            [(5, 5), (6, 6)],
+        ]
+    )
+    assert len(rings) == 1 and len(rings[0]) == 5
+    assert leftover == [4]
+
+    corners = [
+        (0, 0),
+        (0, 0.01),
+        (0.01, 0.01),
+        (0.01, 0),
+        (0.004, 0.004),
+        (0.004, 0.006),
+        (0.006, 0.006),
+        (0.006, 0.004),
+    ]
+    nodes = [
+        {"type": "node", "id": 1 + k, "lat": 35.9 + dy, "lon": 14.4 + dx}
+        for k, (dy, dx) in enumerate(corners)
+    ]
+    ways = [
+        {"type": "way", "id": 10, "nodes": [1, 2, 3]},
+        {"type": "way", "id": 11, "nodes": [1, 4, 3]},
+        {"type": "way", "id": 12, "nodes": [5, 6, 7, 8, 5]},
+    ]
+    relation = {
+        "type": "relation",
+        "id": 20,
+        "members": [
+            {"type": "way", "ref": 10, "role": "outer"},
+            {"type": "way", "ref": 11, "role": "outer"},
+            {"type": "way", "ref": 12, "role": "inner"},
+        ],
+    }
+
+    with OverpassAPIClient(cache_dir=str(tmp_path), show_progress=False) as client:
+        client.cache.store_nodes_bulk(nodes)
+        client.cache.store_ways_bulk(ways)
+        parser = GeneratorParser(client, RejectionTracker(), get_config())
+        geometry = parser.geometry_handler.get_element_geometry(relation)
+
+        assert geometry.geometry.is_valid
+        assert shapely.is_prepared(geometry.geometry)
+        assert geometry.geometry.area == pytest.approx(0.01**2 - 0.002**2)
+        assert geometry.contains_point(35.901, 14.401)
+        assert not geometry.contains_point(35.905, 14.405)
+
+
+def test_haversine_dbscan():
+    """Test chunked haversine DBSCAN against scikit-learn."""
+    import numpy as np
+    from sklearn.cluster import DBSCAN
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        haversine_dbscan,
+    )
+    from osm_powerplants.models import Unit
+
+    rng = np.random.default_rng(0)
+    centers = rng.uniform([45, 5], [55, 15], size=(20, 2))
+    points = centers[rng.integers(0, 20, 2000)] + rng.normal(0, 0.01, (2000, 2))
+
+    labels = haversine_dbscan(
+        points[:, 0], points[:, 1], eps_meters=400, min_samples=3, chunk_size=128
+    )
+    expected = DBSCAN(
+        eps=400 / 6371000, min_samples=3, metric="haversine", algorithm="ball_tree"
+    ).fit_predict(np.radians(points))
+    assert labels.tolist() == expected.tolist()
+
+    config = get_config()
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "dbscan",
+        "eps_meters": 500,
+        "min_samples": 2,
+    }
+    generators = [
+        Unit(projectID=f"g{k}", Country="Malta", lat=lat, lon=lon, Capacity=1.0)
+        for k, (lat, lon) in enumerate([(35.9, 14.4), (35.901, 14.4), (36.5, 14.9)])
+    ]
+    for generator in generators:
+        generator.Fueltype = "Solar"
+    units = ClusteringManager(config).cluster_by_source(generators)
+    assert sorted(unit.Capacity for unit in units) == [1.0, 2.0]
+    cluster = next(unit for unit in units if unit.type == "cluster")
+    assert cluster.lat == (35.9 + 35.901) / 2
+
+
+def test_grid_clustering():
+    """Test grid clustering joins touching cells and drops small clusters."""
+    import numpy as np
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        GridClustering,
+        grid_clusters,
+    )
+    from osm_powerplants.models import Unit
+
+    # A chain of points 400 m apart spans several cells but stays connected
+    lats = np.array([50.0, 50.0036, 50.0072, 50.0108, 48.0, 48.0001, 45.0])
+    lons = np.array([10.0, 10.0, 10.0, 10.0, 10.0, 10.0001, 10.0])
+    labels = grid_clusters(lats, lons, cell_meters=500, min_samples=2)
+    assert labels.tolist() == [0, 0, 0, 0, 1, 1, -1]
+
+    config = get_config()
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "grid",
+        "cell_meters": 500,
+    }
+    success, algorithm = ClusteringManager(config).create_algorithm("Solar")
+    assert success and isinstance(algorithm, GridClustering)
+    generators = [
+        Unit(projectID=f"g{k}", lat=lat, lon=lon, Capacity=1.0)
+        for k, (lat, lon) in enumerate(zip(lats, lons, strict=True))
+    ]
+    clusters = algorithm.cluster(generators)
+    assert [len(clusters[label]) for label in (0, 1, -1)] == [4, 2, 1]
+
+
+def test_grid_clustering_high_longitude():
+    """Test grid clustering keeps close pairs together far from lon 0."""
+    import numpy as np
+
+    from osm_powerplants.enhancement.clustering import grid_clusters
+
+    rng = np.random.default_rng(0)
+    for lon in (140.0, -175.0):
+        # Pairs 20 m apart north-south, far enough from each other to
+        # stay separate clusters
+        lats = rng.uniform(30, 60, 500)
+        lons = lon + rng.uniform(0, 5, 500)
+        pair_lats = np.concatenate([lats, lats + 20 / 111_195])
+        pair_lons = np.concatenate([lons, lons])
+        labels = grid_clusters(pair_lats, pair_lons, cell_meters=100)
+        assert (labels[:500] >= 0).all()
+        assert (labels[:500] == labels[500:]).all()
+
+    # Points more than three cells apart in neighbouring rows stay apart,
+    # however far east the other points reach
+    east = 1700 / (111_195 * np.cos(np.radians(50)))
+    for anchor in (10.1, 179.9):
+        labels = grid_clusters(
+            np.array([50.0, 50.0045, 50.0, 50.0]),
+            np.array([10.0, 10.0 + east, anchor, anchor]),
+            cell_meters=500,
+            min_samples=1,
+        )
+        assert labels[0] != labels[1]
+        assert labels[2] == labels[3]
+
+
+def test_minibatch_kmeans_warm_start(tmp_path):
+    """Test mini-batch K-means reuses stored centers on the next run."""
+    import numpy as np
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        ClusteringStore,
+    )
+    from osm_powerplants.models import Unit
+
+    rng = np.random.default_rng(0)
+    centers = np.array([[50.0, 10.0], [48.0, 12.0], [52.0, 8.0]])
+    points = centers[rng.integers(0, 3, 600)] + rng.normal(0, 0.01, (600, 2))
+    generators = [
+        Unit(projectID=f"g{k}", lat=lat, lon=lon, Capacity=1.0, Fueltype="Solar")
+        for k, (lat, lon) in enumerate(points)
+    ]
+
+    config = get_config()
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "kmeans",
+        "n_clusters": 3,
+        "minibatch": True,
+        "batch_size": 256,
+        "warm_start": True,
+        "random_state": 0,
+    }
+    manager = ClusteringManager(config)
+    manager.store = ClusteringStore(str(tmp_path))
+
+    success, clusters = manager.cluster_generators(generators, "Solar", "DE")
+    assert success and len(clusters) == 3
+    assert sum(len(members) for members in clusters.values()) == 600
+    stored = manager.store.get_centers("DE", "Solar", {})
+    assert stored.shape == (3, 2)
+    assert np.abs(np.sort(stored, axis=0) - np.sort(centers, axis=0)).max() < 0.01
+
+    # The next run starts from the stored centers
+    _, algorithm = manager.create_algorithm("Solar")
+    algorithm.initial_centers = stored
+    clusters = algorithm.cluster(generators[1:])
+    assert len(clusters) == 3
+    assert np.abs(algorithm.cluster_centers - stored).max() < 0.01
+    manager.store.close()
+
+
+def test_incremental_clustering(tmp_path):
+    """Test incremental re-clustering matches a full run and reuses plants."""
+    import numpy as np
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        ClusteringStore,
+    )
+    from osm_powerplants.models import Unit
+
+    def generator(project_id, lat, lon):
+        return Unit(
+            projectID=project_id,
+            lat=lat,
+            lon=lon,
+            Capacity=1.0,
+            Country="Germany",
+            Fueltype="Solar",
+        )
+
+    rng = np.random.default_rng(0)
+    towns = rng.uniform([50.0, 10.0], [50.5, 10.7], size=(15, 2))
+    points = towns[rng.integers(0, 15, 600)] + rng.normal(0, 0.004, (600, 2))
+    generators = [generator(f"g{k}", lat, lon) for k, (lat, lon) in enumerate(points)]
+
+    config = get_config()
+    config["units_clustering"]["incremental"] = True
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "dbscan",
+        "eps_meters": 300,
+        "min_samples": 3,
+    }
+    manager = ClusteringManager(config)
+    manager.store = ClusteringStore(str(tmp_path))
+    first = manager.update_clusters(generators, "Solar", "DE")
+
+    # Remove, add and move generators around the first town only
+    near_first = np.hypot(*(points - towns[0]).T) < 0.02
+    generators = [gen for gen, near in zip(generators, near_first) if not near][5:]
+    generators += [
+        generator(f"new{k}", lat, lon)
+        for k, (lat, lon) in enumerate(towns[0] + rng.normal(0, 0.004, (20, 2)))
+    ]
+    generators[-1].lat += 0.01
+
+    units = manager.update_clusters(generators, "Solar", "DE")
+    assert sum(unit.Capacity for unit in units) == len(generators)
+
+    state = manager.store.get_state("DE", "Solar")
+    _, algorithm = manager.create_algorithm("Solar")
+    full = algorithm.label_points(
+        np.array([gen.lat for gen in generators]),
+        np.array([gen.lon for gen in generators]),
+    )
+
+    def partition(labels, ids):
+        groups = {}
+        for label, project_id in zip(labels.tolist(), ids):
+            if label >= 0:
+                groups.setdefault(label, set()).add(project_id)
+        return {frozenset(group) for group in groups.values()}
+
+    assert partition(state.labels, state.ids) == partition(
+        full, [gen.projectID for gen in generators]
+    )
+    # Plants of clusters away from the changes are kept
+    kept = {unit.projectID for unit in first} & {unit.projectID for unit in units}
+    assert len(kept) >= len(state.plants) // 2
+    manager.store.close()
+
+
+def test_incremental_clustering_randomized(tmp_path):
+    """Test incremental core-point clusters match full runs on random edits."""
+    import numpy as np
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        ClusteringStore,
+    )
+    from osm_powerplants.models import Unit
+
+    config = get_config()
+    config["units_clustering"]["incremental"] = True
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "dbscan",
+        "eps_meters": 300,
+        "min_samples": 4,
+    }
+    manager = ClusteringManager(config)
+    manager.store = ClusteringStore(str(tmp_path))
+    _, algorithm = manager.create_algorithm("Solar")
+
+    def core_partition(labels, core, ids):
+        groups = {}
+        for label, is_core, project_id in zip(labels.tolist(), core, ids):
+            if is_core:
+                groups.setdefault(label, set()).add(project_id)
+        return {frozenset(group) for group in groups.values()}
+
+    for seed in range(30):
+        rng = np.random.default_rng(seed)
+        towns = rng.uniform([50.0, 10.0], [50.1, 10.15], size=(6, 2))
+        points = towns[rng.integers(0, 6, 400)] + rng.normal(0, 0.01, (400, 2))
+        generators = [
+            Unit(projectID=f"g{k}", lat=lat, lon=lon, Capacity=1.0, Fueltype="Solar")
+            for k, (lat, lon) in enumerate(points)
+        ]
+        manager.update_clusters(generators, "Solar", f"S{seed}")
+
+        kept = rng.random(len(generators)) > 0.05
+        generators = [gen for gen, keep in zip(generators, kept) if keep]
+        for gen in rng.choice(generators, 5, replace=False):
+            gen.lat += rng.normal(0, 0.01)
+            gen.lon += rng.normal(0, 0.01)
+        generators += [
+            Unit(projectID=f"n{k}", lat=lat, lon=lon, Capacity=1.0, Fueltype="Solar")
+            for k, (lat, lon) in enumerate(
+                towns[rng.integers(0, 6, 10)] + rng.normal(0, 0.01, (10, 2))
+            )
+        ]
+        manager.update_clusters(generators, "Solar", f"S{seed}")
+
+        state = manager.store.get_state(f"S{seed}", "Solar")
+        lats = np.array([gen.lat for gen in generators])
+        lons = np.array([gen.lon for gen in generators])
+        ids = [gen.projectID for gen in generators]
+        full_core = algorithm.core_points(lats, lons)
+        assert (state.core == full_core).all()
+        assert core_partition(state.labels, state.core, state.ids) == core_partition(
+            algorithm.label_points(lats, lons), full_core, ids
+        ), f"seed {seed}"
+    manager.store.close()
+
+
+def test_incremental_grid_clustering_randomized(tmp_path):
+    """Test incremental grid clusters match full runs on random edits."""
+    import numpy as np
+
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        ClusteringStore,
+    )
+    from osm_powerplants.models import Unit
+
+    config = get_config()
+    config["units_clustering"]["incremental"] = True
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "grid",
+        "cell_meters": 300,
+        "min_samples": 4,
+    }
+    manager = ClusteringManager(config)
+    manager.store = ClusteringStore(str(tmp_path))
+    _, algorithm = manager.create_algorithm("Solar")
+
+    def partition(labels, ids):
+        groups = {}
+        for label, project_id in zip(labels.tolist(), ids):
+            if label >= 0:
+                groups.setdefault(label, set()).add(project_id)
+        return {frozenset(group) for group in groups.values()}
+
+    for seed in range(60):
+        rng = np.random.default_rng(seed)
+        towns = rng.uniform([50.0, 10.0], [50.1, 10.15], size=(6, 2))
+        points = towns[rng.integers(0, 6, 300)] + rng.normal(0, 0.01, (300, 2))
+        generators = [
+            Unit(projectID=f"g{k}", lat=lat, lon=lon, Capacity=1.0, Fueltype="Solar")
+            for k, (lat, lon) in enumerate(points)
+        ]
+        manager.update_clusters(generators, "Solar", f"S{seed}")
+
+        kept = rng.random(len(generators)) > 0.05
+        generators = [gen for gen, keep in zip(generators, kept) if keep]
+        for gen in rng.choice(generators, 3, replace=False):
+            gen.lat += rng.normal(0, 0.01)
+            gen.lon += rng.normal(0, 0.01)
+        added = rng.integers(1, 10)
+        generators += [
+            Unit(projectID=f"n{k}", lat=lat, lon=lon, Capacity=1.0, Fueltype="Solar")
+            for k, (lat, lon) in enumerate(
+                towns[rng.integers(0, 6, added)] + rng.normal(0, 0.01, (added, 2))
+            )
+        ]
+        manager.update_clusters(generators, "Solar", f"S{seed}")
+
+        state = manager.store.get_state(f"S{seed}", "Solar")
+        full = algorithm.label_points(
+            np.array([gen.lat for gen in generators]),
+            np.array([gen.lon for gen in generators]),
+        )
+        assert partition(state.labels, state.ids) == partition(
+            full, [gen.projectID for gen in generators]
+        ), f"seed {seed}"
+    manager.store.close()
+
+
+def test_clustering_result_cache(tmp_path):
+    """Test clustered units are reused while generators are unchanged."""
+    from osm_powerplants import get_config
+    from osm_powerplants.enhancement.clustering import (
+        ClusteringManager,
+        ClusteringStore,
+    )
+    from osm_powerplants.models import Unit
+
+    generators = [
+        Unit(
+            projectID=f"g{k}",
+            lat=50.0 + 0.001 * k,
+            lon=10.0,
+            Capacity=1.0,
+            Country="Germany",
+            Fueltype="Solar",
+        )
+        for k in range(5)
+    ]
+    generators.append(
+        Unit(
+            projectID="outlier",
+            Name="Old name",
+            lat=51.0,
+            lon=10.0,
+            Capacity=1.0,
+            Country="Germany",
+            Fueltype="Solar",
+        )
+    )
+    config = get_config()
+    config["units_clustering"]["cache"] = True
+    config["sources"]["Solar"]["units_clustering"] = {
+        "method": "dbscan",
+        "eps_meters": 500,
+        "min_samples": 2,
+    }
+    manager = ClusteringManager(config)
+    manager.store = ClusteringStore(str(tmp_path))
+
+    first = manager.cluster_by_source(generators, "DE")
+    second = manager.cluster_by_source(generators, "DE")
+    assert (manager.cache_hits, manager.cache_misses) == (1, 1)
+    assert [unit.projectID for unit in second] == [unit.projectID for unit in first]
+    assert second[0].Capacity == 5.0
+
+    # Outliers are current generators, not stored copies
+    generators[-1].Name = "New name"
+    renamed = manager.cluster_by_source(generators, "DE")
+    assert (manager.cache_hits, manager.cache_misses) == (2, 1)
+    assert renamed[-1].Name == "New name"
+
+    generators[0].Capacity = 2.0
+    third = manager.cluster_by_source(generators, "DE")
+    assert (manager.cache_hits, manager.cache_misses) == (2, 2)
+    assert third[0].Capacity == 6.0
+
+    # Without a country there is nothing to key the cache by
+    manager.cluster_by_source(generators)
+    assert (manager.cache_hits, manager.cache_misses) == (2, 2)
+    manager.store.close()
+
+
+def test_tiled_dbscan():
+    """Test tiled DBSCAN matches single-pass DBSCAN across tile edges."""
+    import numpy as np
+    from sklearn.cluster import DBSCAN
+
+    from osm_powerplants.enhancement.clustering import tiled_dbscan
+
+    rng = np.random.default_rng(1)
+    centers = rng.uniform([50.0, 10.0], [50.5, 10.8], size=(20, 2))
+    points = centers[rng.integers(0, 20, 3000)] + rng.normal(0, 0.01, (3000, 2))
+    expected = DBSCAN(
+        eps=300 / 6371000, min_samples=3, metric="haversine", algorithm="ball_tree"
+    ).fit_predict(np.radians(points))
+
+    # Tiles of 2 km cut through most clusters
+    for workers in (None, 2):
+        labels = tiled_dbscan(
+            points[:, 0],
+            points[:, 1],
+            eps_meters=300,
+            min_samples=3,
+            tile_meters=2000,
+            workers=workers,
+        )
+        assert labels.tolist() == expected.tolist()
+
+
+def test_tiled_dbscan_antimeridian():
+    """Test tiled DBSCAN joins clusters across the antimeridian."""
+    import numpy as np
+    from sklearn.cluster import DBSCAN
+
+    from osm_powerplants.enhancement.clustering import points_near, tiled_dbscan
+
+    labels = tiled_dbscan(
+        np.array([0.0, 0.0, 0.0]),
+        np.array([179.999, -179.999, 180.0]),
+        eps_meters=300,
+        min_samples=2,
+    )
+    assert labels.tolist() == [0, 0, 0]
+
+    # Near the pole only a few tile columns span the circle
+    rng = np.random.default_rng(2)
+    for lat, tile_meters in ((-16.5, 2000), (89.8, 50_000)):
+        points = np.column_stack(
+            [lat + rng.normal(0, 0.01, 1500), rng.uniform(179.9, 180.1, 1500)]
+        )
+        points[:, 1] = (points[:, 1] + 180) % 360 - 180
+        expected = DBSCAN(
+            eps=300 / 6371000, min_samples=3, metric="haversine", algorithm="ball_tree"
+        ).fit_predict(np.radians(points))
+        labels = tiled_dbscan(
+            points[:, 0],
+            points[:, 1],
+            eps_meters=300,
+            min_samples=3,
+            tile_meters=tile_meters,
+        )
+        assert labels.tolist() == expected.tolist()
+
+    near = points_near(
+        np.array([10.0, 10.0]),
+        np.array([-179.999, 179.0]),
+        np.array([10.0]),
+        np.array([179.999]),
+        radius_meters=500,
+    )
+    assert near.tolist() == [True, False]
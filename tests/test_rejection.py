@@ -108,3 +108,131 @@ def test_rejection_tracker_keywords():
 
     keywords = tracker.get_unique_keyword(RejectionReason.MISSING_SOURCE_TYPE)
     assert keywords.get("coal_gas") == 2
+
+
+def test_rejection_tracker_levels():
+    """Test recording levels keep exact counts with fewer records."""
+    from osm_powerplants.models import RejectionReason
+    from osm_powerplants.quality.rejection import RejectionTracker
+
+    trackers = {
+        level: RejectionTracker(level=level, sample_rate=0.5)
+        for level in ("off", "counts", "sampled", "full")
+    }
+    for tracker in trackers.values():
+        for i in range(100):
+            for _ in range(2):  # duplicates are ignored
+                tracker.add_rejection(
+                    element_id=i,
+                    element_type="node",
+                    reason=RejectionReason.MISSING_SOURCE_TAG,
+                )
+        tracker.delete_rejection("node/0")
+
+    assert trackers["off"].get_total_count() == 0
+    for level in ("counts", "sampled", "full"):
+        assert trackers[level].get_total_count() == 99
+        assert trackers[level].get_summary() == {
+            RejectionReason.MISSING_SOURCE_TAG.value: 99
+        }
+    assert trackers["counts"].rejected_elements == {}
+    assert 0 < len(trackers["sampled"].rejected_elements) < 99
+    assert len(trackers["full"].rejected_elements) == 99
+
+
+def test_rejection_counts_keep_no_details():
+    """Test rejections below the full level keep no detail messages."""
+    import gc
+    import weakref
+
+    from osm_powerplants.models import RejectionReason
+    from osm_powerplants.quality.rejection import RejectionDetails, RejectionTracker
+
+    class Tags(dict):
+        pass
+
+    tracker = RejectionTracker(level="counts")
+    tags = Tags(power="plant")
+    tags_ref = weakref.ref(tags)
+    for details in (
+        RejectionDetails("tags: {tags}", tags=tags),
+        RejectionDetails("tags: {tags}", tags=tags),  # duplicate
+        RejectionDetails("source: {source}", source="coal"),
+    ):
+        tracker.add_rejection(
+            element_id=1,
+            element_type="node",
+            reason=RejectionReason.MISSING_SOURCE_TAG,
+            details=details,
+        )
+    del tags, details
+    gc.collect()
+
+    assert tags_ref() is None
+    assert tracker.get_summary() == {RejectionReason.MISSING_SOURCE_TAG.value: 2}
+
+
+def test_rejection_capture_ignores_level():
+    """Test rejections are captured even when the tracker records none."""
+    from osm_powerplants.models import RejectionReason
+    from osm_powerplants.quality.rejection import RejectionTracker
+
+    tracker = RejectionTracker(level="off")
+    with tracker.capture() as captured:
+        tracker.add_rejection(
+            element_id=1,
+            element_type="node",
+            reason=RejectionReason.MISSING_SOURCE_TAG,
+        )
+    assert tracker.get_total_count() == 0
+    assert len(captured) == 1
+
+    # A later run at another level records the captured rejection
+    full = RejectionTracker(level="full")
+    for rejected in captured:
+        full.add_rejected_element(rejected)
+    assert full.get_total_count() == 1
+
+
+def test_rejection_tracker_merge():
+    """Test merged trackers match a tracker recording everything."""
+    from osm_powerplants.models import RejectionReason
+    from osm_powerplants.quality.rejection import RejectionTracker
+
+    for level in ("counts", "sampled", "full"):
+        combined = RejectionTracker(level=level, sample_rate=0.5)
+        merged = RejectionTracker(level=level, sample_rate=0.5)
+        for part in range(3):
+            tracker = RejectionTracker(level=level, sample_rate=0.5)
+            for i in range(part * 20, part * 20 + 30):
+                for target in (tracker, combined):
+                    target.add_rejection(
+                        element_id=i,
+                        element_type="node",
+                        reason=RejectionReason.MISSING_SOURCE_TAG,
+                    )
+            merged.merge(tracker)
+
+        assert merged.get_total_count() == combined.get_total_count() == 70
+        assert merged.get_summary() == combined.get_summary()
+        assert merged.rejected_elements.keys() == combined.rejected_elements.keys()
+
+
+def test_rejection_details_lazy():
+    """Test detail messages are rendered when reports are generated."""
+    from osm_powerplants.models import RejectionReason
+    from osm_powerplants.quality.rejection import RejectionDetails, RejectionTracker
+
+    tags = {"power": "plant"}
+    details = RejectionDetails("tags: {tags}", tags=tags)
+    tracker = RejectionTracker()
+    tracker.add_rejection(
+        element_id=1,
+        element_type="node",
+        reason=RejectionReason.MISSING_SOURCE_TAG,
+        details=details,
+    )
+    assert details._text is None
+
+    report = tracker.generate_report()
+    assert report["details"].iloc[0] == "tags: {'power': 'plant'}"
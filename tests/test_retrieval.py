@@ -0,0 +1,378 @@
+"""Tests for data retrieval and caching."""
+
+
+def test_boundary_index_lookup(tmp_path):
+    """Test offline point-to-country lookup."""
+    from shapely.geometry import box
+
+    from osm_powerplants.retrieval.boundaries import CountryBoundaryIndex
+
+    index = CountryBoundaryIndex(str(tmp_path))
+    index.add("AA", box(0, 0, 10, 10))
+    index.add("BB", box(10, 0, 20, 10))
+
+    codes = index.lookup_many([5, 5, 5, float("nan")], [5, 15, 25, 5])
+    assert list(codes) == ["AA", "BB", None, None]
+    assert index.lookup(5, 5) == "AA"
+    index.close()
+
+    # Boundaries are persisted and reloaded without network access
+    reloaded = CountryBoundaryIndex(str(tmp_path))
+    assert reloaded.countries == ["AA", "BB"]
+    assert reloaded.lookup(5, 15) == "BB"
+    reloaded.close()
+
+
+def test_boundary_geometry_from_relation():
+    """Test boundary polygon assembly from out geom members."""
+    from osm_powerplants.retrieval.boundaries import boundary_geometry_from_relation
+
+    def way(role, coords):
+        return {
+            "type": "way",
+            "role": role,
+            "geometry": [{"lon": x, "lat": y} for x, y in coords],
+        }
+
+    relation = {
+        "id": 1,
+        "members": [
+            # Outer ring split into two open segments
+            way("outer", [(0, 0), (10, 0), (10, 10)]),
+            way("outer", [(10, 10), (0, 10), (0, 0)]),
+            way("inner", [(2, 2), (4, 2), (4, 4), (2, 4), (2, 2)]),
+        ],
+    }
+
+    geometry = boundary_geometry_from_relation(relation)
+    assert geometry is not None
+    assert geometry.area == 100 - 4
+
+
+def test_country_cache_tolerance_lookup():
+    """Test tolerance lookup over the legacy cache grid."""
+    from osm_powerplants.retrieval.cache import CountryCoordinateCache
+
+    cache = CountryCoordinateCache()
+    cache[(50.001, 8.001)] = "DE"
+    cache[(50.005, 8.005)] = "XX"
+
+    assert cache.get_with_tolerance(50.0085, 8.0085) == "DE"
+    assert cache.get_with_tolerance(50.014, 8.014) == "XX"
+    assert cache.get_with_tolerance(51.0, 8.0) is None
+
+
+def test_prefetch_resumes(tmp_path):
+    """Test that prefetch skips completed countries and retries failures."""
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+    from osm_powerplants.retrieval.prefetch import prefetch_country_data
+    from osm_powerplants.utils import get_country_code
+
+    class OfflineClient(OverpassAPIClient):
+        calls = []
+        failing = {"LU"}
+
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            self.calls.append(country)
+            code = get_country_code(country)
+            if code in self.failing:
+                return {"elements": [], "error": "timeout"}, {"elements": []}
+            data = {"elements": [{"type": "node", "id": 1, "lat": 0, "lon": 0}]}
+            self.cache.store_plants(code, data)
+            self.cache.store_generators(code, {"elements": []})
+            return data, {"elements": []}
+
+    with OfflineClient(cache_dir=str(tmp_path), show_progress=False) as client:
+        results = prefetch_country_data(client, ["Malta", "Luxembourg"], jobs=2)
+        assert results["countries_fetched"] == ["Malta"]
+        assert "Luxembourg" in results["countries_failed"]
+        assert not results["success"]
+
+        OfflineClient.calls.clear()
+        OfflineClient.failing.clear()
+        results = prefetch_country_data(client, ["Malta", "Luxembourg"], jobs=2)
+        assert OfflineClient.calls == ["Luxembourg"]
+        assert results["countries_skipped"] == ["Malta"]
+        assert results["success"]
+
+
+def test_download_ahead(tmp_path):
+    """Test downloads run ahead of processing in order and stay bounded."""
+    import threading
+    import time
+
+    from osm_powerplants.retrieval.client import OverpassAPIClient
+    from osm_powerplants.retrieval.prefetch import download_ahead
+
+    class OfflineClient(OverpassAPIClient):
+        started = []
+        lock = threading.Lock()
+
+        def get_country_data(self, country, force_refresh=False, **kwargs):
+            with self.lock:
+                self.started.append(country)
+            time.sleep(0.01)
+            if country == "Cyprus":
+                raise RuntimeError("timeout")
+            return {"elements": [country]}, {"elements": []}
+
+    countries = ["Malta", "Cyprus", "Luxembourg", "Andorra", "Monaco"]
+    with OfflineClient(cache_dir=str(tmp_path), show_progress=False) as client:
+        processed = []
+        for country, download in download_ahead(client, countries, ahead=2):
+            # Never more than two countries beyond the current one
+            assert len(OfflineClient.started) <= len(processed) + 3
+            if country == "Cyprus":
+                assert isinstance(download.exception(), RuntimeError)
+            else:
+                assert download.result()[0] == {"elements": [country]}
+            time.sleep(0.05)
+            processed.append(country)
+
+    assert processed == countries
+    assert sorted(OfflineClient.started) == sorted(countries)
+
+
+def test_cache_snapshot_roundtrip(tmp_path):
+    """Test exporting and importing a cache snapshot."""
+    import io
+    import tarfile
+
+    import pytest
+
+    from osm_powerplants.models import Unit
+    from osm_powerplants.retrieval.cache import ElementCache
+    from osm_powerplants.retrieval.snapshot import (
+        export_cache,
+        import_cache,
+        read_manifest,
+    )
+
+    source = ElementCache(str(tmp_path / "source"))
+    way = {"type": "way", "id": 10, "nodes": [1, 2, 3]}
+    source.store_plants("MT", {"elements": [way]})
+    source.store_generators("MT", {"elements": []})
+    source.store_ways_bulk([way])
+    source.store_nodes_bulk(
+        [{"type": "node", "id": i, "lat": 35.9, "lon": 14.4} for i in (1, 2, 3, 99)]
+    )
+    source.store_units("MT", [Unit(projectID="OSM_1", Country="Malta")])
+
+    snapshot = str(tmp_path / "cache.tar.gz")
+    manifest = export_cache(source, snapshot, countries=["Malta"])
+    source.close()
+
+    assert read_manifest(snapshot)["countries"]["MT"]["plants"] == 1
+    # Only elements referenced by the selected countries are exported
+    assert manifest["files"]["nodes.jsonl"]["entries"] == 3
+
+    target = ElementCache(str(tmp_path / "target"))
+    import_cache(target, snapshot)
+    assert target.get_plants("MT") == {"elements": [way]}
+    assert target.get_node(2)["lat"] == 35.9
+    assert target.get_node(99) is None
+    assert target.get_units("MT")[0].projectID == "OSM_1"
+    target.close()
+
+    # A corrupted member is rejected before anything is written
+    corrupted = str(tmp_path / "corrupted.tar.gz")
+    with tarfile.open(snapshot) as src, tarfile.open(corrupted, "w:gz") as dst:
+        for member in src.getmembers():
+            data = src.extractfile(member).read()
+            if member.name == "ways.jsonl":
+                data = data.replace(b"10", b"11")
+            member.size = len(data)
+            dst.addfile(member, io.BytesIO(data))
+
+    fresh = ElementCache(str(tmp_path / "fresh"))
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        import_cache(fresh, corrupted)
+    assert fresh.get_way(10) is None
+    fresh.close()
+
+
+def test_cache_snapshot_rejects_unsafe_members(tmp_path):
+    """Test snapshot import rejects path members and missing members."""
+    import io
+    import json
+    import tarfile
+
+    import pytest
+
+    from osm_powerplants.retrieval.cache import ElementCache
+    from osm_powerplants.retrieval.snapshot import export_cache, import_cache
+
+    source = ElementCache(str(tmp_path / "source"))
+    snapshot = str(tmp_path / "cache.tar.gz")
+    export_cache(source, snapshot)
+    source.close()
+
+    def rewrite(path, rename=None, drop=None):
+        with tarfile.open(snapshot) as src, tarfile.open(path, "w:gz") as dst:
+            for member in src.getmembers():
+                data = src.extractfile(member).read()
+                if member.name == "manifest.json":
+                    manifest = json.loads(data)
+                    if rename:
+                        files = manifest["files"]
+                        files[rename[1]] = files.pop(rename[0])
+                    if drop:
+                        del manifest["files"][drop]
+                    data = json.dumps(manifest).encode()
+                elif member.name == drop:
+                    continue
+                elif rename and member.name == rename[0]:
+                    member.name = rename[1]
+                member.size = len(data)
+                dst.addfile(member, io.BytesIO(data))
+
+    target = ElementCache(str(tmp_path / "target" / "cache"))
+    escaping = str(tmp_path / "escaping.tar.gz")
+    rewrite(escaping, rename=("units.json", "../../units.json"))
+    with pytest.raises(ValueError, match="Invalid snapshot member"):
+        import_cache(target, escaping)
+    assert not (tmp_path / "target" / "units.json").exists()
+
+    incomplete = str(tmp_path / "incomplete.tar.gz")
+    rewrite(incomplete, drop="plants.json")
+    with pytest.raises(ValueError, match="missing members"):
+        import_cache(target, incomplete)
+    target.close()
+
+
+def test_element_index_membership(tmp_path):
+    """Test element index lookups and reverse relation membership."""
+    from osm_powerplants.retrieval.cache import ElementCache
+    from osm_powerplants.retrieval.index import ElementIndex
+
+    cache = ElementCache(str(tmp_path))
+    cache.store_ways_bulk([{"type": "way", "id": 10, "nodes": [1, 2, 3]}])
+    relations = [
+        {
+            "type": "relation",
+            "id": 60 + i,
+            "members": [
+                {"type": "node", "ref": 2, "role": ""},
+                {"type": "way", "ref": 10, "role": "outer"},
+            ],
+        }
+        for i in range(2)
+    ]
+    generator = {"type": "node", "id": 2, "lat": 35.9, "lon": 14.4}
+
+    index = ElementIndex(cache, relations + [generator])
+    assert len(index) == 3
+    assert index.get("node/2") is generator
+    assert index.parent_relations("node/2") == ["relation/60", "relation/61"]
+    assert index.parent_relations("way/10") == ["relation/60", "relation/61"]
+    assert index.parent_relations("node/3") == []
+
+    way = index.get_way(10)
+    assert way["nodes"] == [1, 2, 3]
+    assert index.get_way(10) is way
+    assert index.get_node(99) is None
+    cache.close()
+
+
+def test_compact_elements():
+    """Test compact elements behave like the element dicts they replace."""
+    import pickle
+
+    import pytest
+
+    from osm_powerplants.retrieval.elements import OSMElement, compact_elements
+
+    raw = [
+        {
+            "type": "node",
+            "id": i,
+            "lat": 35.9,
+            "lon": 14.4,
+            "tags": {"power": "generator", "generator:source": "solar"},
+            "version": 2,
+        }
+        for i in range(2)
+    ]
+    elements = compact_elements(raw)
+    element = elements[0]
+
+    assert isinstance(element, OSMElement)
+    assert element == raw[0]
+    assert element["tags"] == raw[0]["tags"]
+    assert element["version"] == 2
+    assert "nodes" not in element and element.get("nodes") is None
+    with pytest.raises(KeyError):
+        element["nodes"]
+    assert repr(element["tags"]) == repr(raw[0]["tags"])
+    # Repeated tag values are stored once
+    assert element["tags"]["power"] is elements[1]["tags"]["power"]
+
+    element["_lat"] = 1.0
+    assert list(element)[-1] == "_lat"
+    assert pickle.loads(pickle.dumps(element)) == element
+    assert element.to_dict()["tags"] == raw[0]["tags"]
+
+
+def test_compact_element_cache(tmp_path):
+    """Test the element cache holds compact elements and saves plain JSON."""
+    import json
+
+    from osm_powerplants.retrieval.cache import ElementCache
+    from osm_powerplants.retrieval.elements import OSMElement
+
+    raw = {
+        "elements": [
+            {
+                "type": "node",
+                "id": 1,
+                "lat": 35.9,
+                "lon": 14.4,
+                "tags": {"power": "plant", "plant:source": "solar"},
+                "_country": "MT",
+            }
+        ]
+    }
+    cache = ElementCache(str(tmp_path), compact_elements=True)
+    data = json.loads(json.dumps(raw))
+    cache.store_plants("MT", data)
+    # Stored data is compacted in place, so the caller holds no dicts
+    assert isinstance(data["elements"][0], OSMElement)
+    assert cache.get_plants("MT") is data
+    cache.save_all_caches()
+    cache.close()
+
+    with open(tmp_path / "plants_power.json") as f:
+        assert json.load(f) == {"MT": raw}
+
+    reloaded = ElementCache(str(tmp_path), compact_elements=True)
+    reloaded.load_all_caches()
+    element = reloaded.get_plants("MT")["elements"][0]
+    assert isinstance(element, OSMElement)
+    assert element == raw["elements"][0]
+    reloaded.close()
+
+
+def test_country_caches_shared_between_processes(tmp_path):
+    """Test country caches saved by separate instances are merged on disk."""
+    from osm_powerplants.retrieval.cache import ElementCache
+
+    first = ElementCache(str(tmp_path))
+    second = ElementCache(str(tmp_path))
+    first.load_all_caches()
+    second.load_all_caches()
+
+    first.store_plants("MT", {"elements": [1]})
+    first.save_all_caches()
+    second.store_plants("LU", {"elements": [2]})
+    second.save_all_caches()
+    # A country stored again replaces only its own entry
+    first.store_plants("MT", {"elements": [3]})
+    first.save_all_caches()
+    first.close()
+    second.close()
+
+    merged = ElementCache(str(tmp_path))
+    merged.load_all_caches()
+    assert merged.get_plants("MT") == {"elements": [3]}
+    assert merged.get_plants("LU") == {"elements": [2]}
+    merged.close()
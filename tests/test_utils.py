@@ -52,6 +52,75 @@ def test_parse_capacity_invalid():
     assert capacity is None
 
 
+def test_parse_capacity_cache():
+    """Test memoized capacity parsing with custom patterns."""
+    from osm_powerplants.utils import (
+        capacity_cache_stats,
+        clear_capacity_cache,
+        parse_capacity_value,
+    )
+
+    clear_capacity_cache()
+    patterns = [r"^(\d+(?:\.\d+)?)\s*([a-zA-Z]+p?)$", r"^([invalid"]
+
+    assert parse_capacity_value(" 3 MWp ", True, patterns) == (True, 3.0, "3 MWp")
+    assert parse_capacity_value("3 MWp", True, tuple(patterns)) == (
+        True,
+        3.0,
+        "3 MWp",
+    )
+    assert parse_capacity_value("2,5 MW", False) == (True, 2.5, "2,5 MW")
+    assert parse_capacity_value("5 kW", False) == (False, None, "regex_no_match")
+
+    stats = capacity_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+
+
+def test_parse_start_year():
+    """Test start date parsing fast path and fallback."""
+    from osm_powerplants.utils import parse_start_year
+
+    assert parse_start_year("2011") == (2011, None)
+    assert parse_start_year("2011-05-31") == (2011, None)
+    assert parse_start_year("May 2011") == (2011, None)
+    assert parse_start_year("abc") == (None, "no_year")
+    # Invalid month: the year is taken from the string as before
+    year, problem = parse_start_year("2011-13")
+    assert year == 2011
+    assert problem is not None
+
+
+def test_polygon_areas():
+    """Test vectorized areas and distances against the scalar helpers."""
+    import pytest
+
+    from osm_powerplants.enhancement.kernels import (
+        haversine,
+        polygon_areas,
+        ring_offsets,
+    )
+    from osm_powerplants.utils import calculate_area, haversine_distance
+
+    square = [(52.0, 13.0), (52.0, 13.001), (52.001, 13.001), (52.001, 13.0)]
+    triangle = [(-33.9, 18.4), (-33.9, 18.41), (-33.89, 18.4), (-33.9, 18.4)]
+    rings = [square, [], triangle, square[:2]]
+    lats = [lat for ring in rings for lat, _ in ring]
+    lons = [lon for ring in rings for _, lon in ring]
+
+    areas = polygon_areas(lats, lons, ring_offsets([len(ring) for ring in rings]))
+    assert areas.tolist() == [
+        calculate_area([{"lat": lat, "lon": lon} for lat, lon in ring])
+        for ring in rings
+    ]
+    assert areas[0] == pytest.approx(111195 * 111195 * 0.001**2 * 0.6157, rel=1e-3)
+    assert areas[1] == 0 and areas[3] == 0
+
+    distances = haversine(lats[:4], lons[:4], 48.85, 2.35)
+    for lat, lon, distance in zip(lats[:4], lons[:4], distances, strict=True):
+        assert distance == pytest.approx(haversine_distance(lat, lon, 48.85, 2.35))
+
+
 def test_get_country_code():
     """Test country code lookup."""
     from osm_powerplants.utils import get_country_code